@@ -0,0 +1,137 @@
+"""
+Contrôle d'admission des routes qui modifient (réservations, retours).
+
+Deux protections, dans cet ordre :
+  - un seau à jetons par client (clé d'API, sinon adresse IP) : RATE_PER_SECOND
+    requêtes par seconde en régime établi, BURST d'un coup -> 429 au-delà ;
+  - une file bornée : au plus MAX_IN_FLIGHT requêtes traitées à la fois,
+    MAX_QUEUED en attente -> 503 au-delà, plutôt que de laisser la latence
+    de tout le monde s'envoler.
+Les deux refus donnent un Retry-After (secondes).
+"""
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Callable, Optional
+
+from metrics import METRICS
+
+RATE_PER_SECOND = 5.0
+BURST = 20
+MAX_CLIENTS = 10_000  # Seaux gardés (les moins récents sont oubliés : seau plein)
+MAX_IN_FLIGHT = 32
+MAX_QUEUED = 256
+
+QUEUE_WAIT_SECONDS = METRICS.histogram("admission_queue_wait_seconds",
+                                       "Attente dans la file avant traitement (routes qui modifient)")
+
+class Overloaded(Exception):
+    """File d'attente pleine : la requête est refusée sans être traitée."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"File d'attente pleine, réessayer dans {retry_after}s")
+        self.retry_after = retry_after
+
+class RateLimiter:
+    __slots__ = ("rate", "burst", "max_clients", "clock", "rejected", "_buckets")
+
+    def __init__(self, rate: float = RATE_PER_SECOND, burst: int = BURST, max_clients: int = MAX_CLIENTS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self.clock = clock
+        self.rejected = 0
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()  # client -> [jetons, dernière mise à jour]
+
+    def check(self, client: str) -> float:
+        """Prend un jeton : 0 si la requête passe, sinon le délai (s) avant le prochain jeton."""
+        now = self.clock()
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            bucket = self._buckets[client] = [float(self.burst), now]
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(client)
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+
+        if bucket[0] >= 1.0:
+            bucket[0] -= 1.0
+            return 0.0
+        self.rejected += 1
+        return (1.0 - bucket[0]) / self.rate
+
+class AdmissionQueue:
+    __slots__ = ("max_in_flight", "max_queued", "in_flight", "admitted", "rejected",
+                 "_waiters", "_service_time", "_loop")
+
+    def __init__(self, max_in_flight: int = MAX_IN_FLIGHT, max_queued: int = MAX_QUEUED):
+        self.max_in_flight = max_in_flight
+        self.max_queued = max_queued
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+        self._waiters: deque = deque()
+        self._service_time = 0.05  # Moyenne glissante du traitement d'une requête (s)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        """Temps estimé pour écouler la file actuelle (au moins 1 s)."""
+        return max(1, math.ceil(self._service_time * (self.queued + 1) / self.max_in_flight))
+
+    def _wake_next(self):
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+        self.in_flight -= 1
+
+    @asynccontextmanager
+    async def slot(self):
+        """Une place de traitement ; attend dans la file, ou lève Overloaded si elle est pleine."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Nouvelle boucle (redémarrage, tests) : les attentes de l'ancienne ne valent plus rien
+            self._loop, self.in_flight = loop, 0
+            self._waiters.clear()
+
+        if self.in_flight < self.max_in_flight:
+            self.in_flight += 1
+            QUEUE_WAIT_SECONDS.observe(0.0)
+        elif len(self._waiters) >= self.max_queued:
+            self.rejected += 1
+            raise Overloaded(self.retry_after())
+        else:
+            future = loop.create_future()
+            self._waiters.append(future)
+            queued_at = time.perf_counter()
+            try:
+                await future  # La place est transmise par la requête qui libère la sienne
+                QUEUE_WAIT_SECONDS.observe(time.perf_counter() - queued_at)
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    self._waiters.remove(future)
+                else:
+                    self._wake_next()  # Place reçue mais abandonnée : on la passe au suivant
+                raise
+
+        self.admitted += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._service_time += 0.1 * (time.perf_counter() - start - self._service_time)
+            self._wake_next()
+
+    def stats(self) -> dict:
+        return {"in_flight": self.in_flight, "queued": self.queued, "admitted": self.admitted,
+                "rejected": self.rejected}
@@ -1,4 +1,6 @@
 class Customer:
+    __slots__ = ("id", "last_name", "first_name", "age", "driver_license", "email", "phone", "username", "password")
+
     def __init__(self, c_id: int, last_name: str, first_name: str, age: int, driver_license: str, email: str, phone: str, username: str, password: str):
         self.id = c_id
         self.last_name = last_name
@@ -0,0 +1,59 @@
+from typing import Iterable, List, Optional, Tuple
+
+from fleet.transport_base import MotorizedVehicle, TransportAnimal
+from fleet.registry import FLEET_CLASSES, class_code
+from .customer import Customer
+
+# Classes "spécialisées" (Lourd/Dragon) réservées aux 21 ans et plus
+SPECIALIZED_CLASSES = ("Truck", "Plane", "Submarine", "Dragon")
+
+LICENSE_REASON = "Le permis de conduire est **obligatoire** pour tous les véhicules motorisés (Terre, Mer, Air)."
+
+class ClassRequirement:
+    """Conditions de location d'une classe : âge minimum et permis."""
+    __slots__ = ("min_age", "needs_license", "age_reason")
+
+    def __init__(self, min_age: int, needs_license: bool, age_reason: Optional[str]):
+        self.min_age = min_age
+        self.needs_license = needs_license
+        self.age_reason = age_reason
+
+def _build_requirement(cls) -> ClassRequirement:
+    # Même ordre de priorité que l'ancienne vérification au clic sur "Confirmer"
+    if cls.__name__ in SPECIALIZED_CLASSES:
+        min_age, reason = 21, "Âge minimum requis pour ce type de véhicule spécialisé (Lourd/Dragon) : 21 ans."
+    elif issubclass(cls, TransportAnimal):
+        min_age, reason = 16, "Âge minimum requis pour la location d'animaux : 16 ans."
+    elif issubclass(cls, MotorizedVehicle):
+        min_age, reason = 18, "Âge minimum requis pour la location motorisée : 18 ans."
+    else:
+        min_age, reason = 0, None
+
+    return ClassRequirement(min_age, issubclass(cls, MotorizedVehicle), reason)
+
+# Table précalculée une seule fois, indexée par code de classe
+REQUIREMENTS: Tuple[ClassRequirement, ...] = tuple(_build_requirement(cls) for cls in FLEET_CLASSES)
+
+def eligibility_mask(customer: Customer) -> Tuple[bool, ...]:
+    """Masque (un booléen par code de classe) des classes louables par ce client."""
+    has_license = bool(customer.driver_license)
+    return tuple(
+        customer.age >= req.min_age and (has_license or not req.needs_license)
+        for req in REQUIREMENTS
+    )
+
+def filter_eligible(vehicles: Iterable, customer: Customer) -> List:
+    """Filtre un catalogue en une seule passe grâce au masque par classe."""
+    mask = eligibility_mask(customer)
+    return [v for v in vehicles if mask[class_code(v)]]
+
+def check_eligibility(customer: Customer, vehicle) -> Tuple[bool, Optional[str]]:
+    """Vérifie un couple client/véhicule et renvoie (autorisé, raison du refus)."""
+    req = REQUIREMENTS[class_code(vehicle)]
+
+    if req.needs_license and not customer.driver_license:
+        return False, LICENSE_REASON
+    if customer.age < req.min_age:
+        return False, req.age_reason
+
+    return True, None
@@ -0,0 +1,48 @@
+"""
+Encodage JSON rapide (réponses de l'API et fichier de sauvegarde).
+
+orjson est utilisé s'il est installé, sinon le module json standard avec
+le même résultat pour nos données : dates en ISO, Enum par leur valeur,
+tableaux / scalaires NumPy en listes / nombres. Sortie toujours en octets UTF-8.
+"""
+import json
+from datetime import date
+from enum import Enum
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Dépendance optionnelle
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+def _default(obj):
+    """Types que json ne sait pas encoder seul (orjson gère déjà dates et Enum)."""
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type non sérialisable en JSON : {type(obj).__name__}")
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, default=_default, option=(_OPTIONS | orjson.OPT_INDENT_2) if indent else _OPTIONS)
+
+    def loads(data):
+        return orjson.loads(data)
+else:
+    def dumps(obj, indent: bool = False) -> bytes:
+        text = json.dumps(obj, default=_default, ensure_ascii=False,
+                          indent=2 if indent else None, separators=None if indent else (",", ":"))
+        return text.encode("utf-8")
+
+    def loads(data):
+        return json.loads(data)
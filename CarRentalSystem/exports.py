@@ -0,0 +1,86 @@
+"""
+Exports NDJSON (un objet JSON par ligne) pour l'entrepôt de données.
+
+Tout est produit au fil de l'eau : les enregistrements sont lus un par un
+(archive comprise) et encodés par paquets. Seuls les ids à parcourir sont
+copiés au départ (tableau d'entiers), jamais les enregistrements : une
+suppression pendant l'export ne décale rien. Avec `since` (une version du système, voir
+CarRentalSystem.version), seuls les éléments modifiés après cette version
+sont exportés ; un élément supprimé depuis sort comme {"id": ..., "deleted": true}.
+"""
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+import numpy as np
+
+from encoding import dumps
+
+EXPORT_CHUNK = 500  # Enregistrements encodés par morceau envoyé
+
+def fleet_ids(system) -> Iterator[int]:
+    """Ids de la flotte dans son ordre, copiés à l'appel (la liste vivante peut changer entre deux morceaux)."""
+    fleet = system.fleet
+    if hasattr(fleet, "columns"):
+        ids = fleet.columns()["id"]
+    else:
+        ids = np.fromiter((v.id for v in fleet), dtype=np.int64, count=len(fleet))
+    return map(int, ids)
+
+def iter_fleet(system, since: Optional[int] = None) -> Iterator[dict]:
+    if since is None:
+        for v_id in fleet_ids(system):
+            v = system.find_vehicle(v_id)
+            if v is not None:  # Retiré depuis le début de l'export
+                yield v.to_dict()
+        return
+    for v_id in system.changes.changed_since("fleet", since):
+        v = system.find_vehicle(v_id)
+        yield v.to_dict() if v is not None else {"id": v_id, "deleted": True}
+
+def iter_rentals(system, since: Optional[int] = None) -> Iterator[dict]:
+    """
+    Archive (partitions mensuelles) puis locations en mémoire. La liste en mémoire
+    est retenue avant de lire l'archive : une location archivée entre-temps peut
+    sortir deux fois (même id), jamais manquer.
+    """
+    if since is None:
+        live = system.rentals  # L'archivage remplace la liste, il ne la modifie pas
+    else:
+        changed = system.changes.changed_since("rentals", since)
+    if system.archive is not None:
+        yield from system.archive.iter_records(since=since)
+    if since is None:
+        for r in live:
+            yield r.to_dict()
+        return
+    for rental_id in changed:
+        r = system.find_rental(rental_id)
+        if r is not None:  # Sinon partie dans l'archive (déjà exportée ci-dessus)
+            yield r.to_dict()
+
+def iter_maintenance(system, since: Optional[int] = None) -> Iterator[dict]:
+    """Une ligne par intervention ; avec since, le journal complet des véhicules modifiés."""
+    ids = fleet_ids(system) if since is None else system.changes.changed_since("fleet", since)
+    for v in map(system.find_vehicle, ids):
+        if v is None:
+            continue
+        for entry in v.maintenance_log.to_dicts():
+            yield {"vehicle_id": v.id, **entry}
+
+EXPORTS: Dict[str, Callable[..., Iterator[dict]]] = {
+    "fleet": iter_fleet,
+    "rentals": iter_rentals,
+    "maintenance": iter_maintenance,
+}
+
+def ndjson_chunks(records: Iterable[dict], chunk_size: int = EXPORT_CHUNK) -> Iterator[bytes]:
+    """Lignes NDJSON regroupées par `chunk_size` enregistrements."""
+    lines = []
+    for record in records:
+        lines.append(dumps(record))
+        if len(lines) == chunk_size:
+            lines.append(b"")
+            yield b"\n".join(lines)
+            lines = []
+    if lines:
+        lines.append(b"")
+        yield b"\n".join(lines)
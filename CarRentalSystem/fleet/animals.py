@@ -1,80 +1,65 @@
 from .transport_base import TransportAnimal
+from .symbols import intern_symbol
+from .schema import Field, interned, fleet_schema
 
 # --- TERRE ---
+@fleet_schema(Field("age", default=5), Field("wither_height"), Field("shoe_size_front", default=0), Field("shoe_size_rear", default=0),
+              details="[{category}] {name} ({age} ans) - {wither_height}cm, Fers: {shoe_size_front}/{shoe_size_rear}mm")
 class Horse(TransportAnimal):
+    __slots__ = ("age", "wither_height", "shoe_size_front", "shoe_size_rear")
     def __init__(self, t_id, daily_rate, name, breed, age, wither_height, shoe_size_front, shoe_size_rear):
         super().__init__(t_id, daily_rate, name, breed, None)
         self.age = age; self.wither_height = wither_height
         self.shoe_size_front = shoe_size_front; self.shoe_size_rear = shoe_size_rear
     @property
     def category(self): return "Poney" if self.wither_height < 140 else "Cheval"
-    
-    def show_details(self): 
-        return f"[{self.category}] {self.name} ({self.age} ans) - {self.wither_height}cm, Fers: {self.shoe_size_front}/{self.shoe_size_rear}mm"
-    
-    def to_dict(self): d=super().to_dict(); d.update({"age": self.age, "wither_height": self.wither_height, "shoe_size_front": self.shoe_size_front, "shoe_size_rear": self.shoe_size_rear}); return d
 
+@fleet_schema(Field("age", default=5), Field("pack_capacity_kg"), Field("is_stubborn"),
+              details="[Âne] {name} ({age} ans) - Charge {pack_capacity_kg}kg, {is_stubborn?Têtu|Docile}")
 class Donkey(TransportAnimal):
+    __slots__ = ("age", "pack_capacity_kg", "is_stubborn")
     def __init__(self, t_id, daily_rate, name, breed, age, pack_capacity_kg, is_stubborn):
         super().__init__(t_id, daily_rate, name, breed, None)
         self.age = age; self.pack_capacity_kg = pack_capacity_kg; self.is_stubborn = is_stubborn
-    
-    def show_details(self): 
-        caractere = "Têtu" if self.is_stubborn else "Docile"
-        return f"[Âne] {self.name} ({self.age} ans) - Charge {self.pack_capacity_kg}kg, {caractere}"
-    
-    def to_dict(self): d=super().to_dict(); d.update({"age": self.age, "pack_capacity_kg": self.pack_capacity_kg, "is_stubborn": self.is_stubborn}); return d
 
+@fleet_schema(Field("age", default=5), Field("hump_count"), Field("water_reserve"),
+              details="[Chameau] {name} ({age} ans) - {hump_count} bosses, {water_reserve}L eau")
 class Camel(TransportAnimal):
+    __slots__ = ("age", "hump_count", "water_reserve")
     def __init__(self, t_id, daily_rate, name, breed, age, hump_count, water_reserve):
         super().__init__(t_id, daily_rate, name, breed, None)
         self.age = age; self.hump_count = hump_count; self.water_reserve = water_reserve
-    
-    def show_details(self): 
-        return f"[Chameau] {self.name} ({self.age} ans) - {self.hump_count} bosses, {self.water_reserve}L eau"
-    
-    def to_dict(self): d=super().to_dict(); d.update({"age": self.age, "hump_count": self.hump_count, "water_reserve": self.water_reserve}); return d
 
 # --- MER ---
+@fleet_schema(Field("age", default=10), Field("weight_tonnes"), Field("can_sing"),
+              details="[Baleine] {name} ({age} ans) - {weight_tonnes}T, {can_sing?Chanteuse|Silencieuse}")
 class Whale(TransportAnimal):
+    __slots__ = ("age", "weight_tonnes", "can_sing")
     def __init__(self, t_id, daily_rate, name, breed, age, weight_tonnes, can_sing):
         super().__init__(t_id, daily_rate, name, breed, None)
         self.age = age; self.weight_tonnes = weight_tonnes; self.can_sing = can_sing
-    
-    def show_details(self): 
-        chant = "Chanteuse" if self.can_sing else "Silencieuse"
-        return f"[Baleine] {self.name} ({self.age} ans) - {self.weight_tonnes}T, {chant}"
-    
-    def to_dict(self): d=super().to_dict(); d.update({"age": self.age, "weight_tonnes": self.weight_tonnes, "can_sing": self.can_sing}); return d
 
+@fleet_schema(Field("age", default=5), Field("swim_speed"), Field("knows_tricks"),
+              details="[Dauphin] {name} ({age} ans) - {swim_speed}km/h, {knows_tricks?Savant|Sauvage}")
 class Dolphin(TransportAnimal):
+    __slots__ = ("age", "swim_speed", "knows_tricks")
     def __init__(self, t_id, daily_rate, name, breed, age, swim_speed, knows_tricks):
         super().__init__(t_id, daily_rate, name, breed, None)
         self.age = age; self.swim_speed = swim_speed; self.knows_tricks = knows_tricks
-    
-    def show_details(self): 
-        trick = "Savant" if self.knows_tricks else "Sauvage"
-        return f"[Dauphin] {self.name} ({self.age} ans) - {self.swim_speed}km/h, {trick}"
-    
-    def to_dict(self): d=super().to_dict(); d.update({"age": self.age, "swim_speed": self.swim_speed, "knows_tricks": self.knows_tricks}); return d
 
 # --- AIR ---
+@fleet_schema(Field("age", default=5), Field("wingspan_cm"), Field("max_altitude"),
+              details="[Aigle] {name} ({age} ans) - Env. {wingspan_cm}cm, Alt. {max_altitude}m")
 class Eagle(TransportAnimal):
+    __slots__ = ("age", "wingspan_cm", "max_altitude")
     def __init__(self, t_id, daily_rate, name, breed, age, wingspan_cm, max_altitude):
         super().__init__(t_id, daily_rate, name, breed, None)
         self.age = age; self.wingspan_cm = wingspan_cm; self.max_altitude = max_altitude
-    
-    def show_details(self): 
-        return f"[Aigle] {self.name} ({self.age} ans) - Env. {self.wingspan_cm}cm, Alt. {self.max_altitude}m"
-    
-    def to_dict(self): d=super().to_dict(); d.update({"age": self.age, "wingspan_cm": self.wingspan_cm, "max_altitude": self.max_altitude}); return d
 
+@fleet_schema(Field("age", default=100), Field("fire_range"), interned("scale_color"),
+              details="[Dragon] {name} ({age} ans) - {scale_color}, Feu {fire_range}m")
 class Dragon(TransportAnimal):
+    __slots__ = ("age", "fire_range", "scale_color")
     def __init__(self, t_id, daily_rate, name, breed, age, fire_range, scale_color):
         super().__init__(t_id, daily_rate, name, breed, None)
-        self.age = age; self.fire_range = fire_range; self.scale_color = scale_color
-    
-    def show_details(self): 
-        return f"[Dragon] {self.name} ({self.age} ans) - {self.scale_color}, Feu {self.fire_range}m"
-    
-    def to_dict(self): d=super().to_dict(); d.update({"age": self.age, "fire_range": self.fire_range, "scale_color": self.scale_color}); return d
\ No newline at end of file
+        self.age = age; self.fire_range = fire_range; self.scale_color = intern_symbol(scale_color)
@@ -0,0 +1,272 @@
+"""
+Stockage colonnaire (struct-of-arrays) optionnel pour la flotte.
+
+Les champs communs (id, tarif, statut, classe, année/âge) vivent dans des
+tableaux NumPy contigus ; les champs propres à chaque classe vivent dans des
+tables annexes (une par classe). L'accès à un élément renvoie une "vue" :
+un objet léger, instance (via une sous-classe) de la vraie classe métier,
+dont les attributs lisent/écrivent directement dans les tableaux.
+"""
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .enums import VehicleStatus
+from .registry import FLEET_CLASSES, class_code
+
+STATUS_LIST = list(VehicleStatus)
+STATUS_CODES = {s: i for i, s in enumerate(STATUS_LIST)}
+
+# Champs stockés en colonnes (les autres vont dans les tables annexes)
+COLUMN_FIELDS = ("id", "daily_rate", "status", "year", "age")
+MISSING_INT = -1  # "pas d'année" (animal) / "pas d'âge" (véhicule)
+
+def _slot_names(cls) -> List[str]:
+    names = []
+    for klass in reversed(cls.__mro__):
+        for name in klass.__dict__.get("__slots__", ()):
+            if name not in names:
+                names.append(name)
+    return names
+
+def _side_fields(cls) -> List[str]:
+    return [n for n in _slot_names(cls) if n not in COLUMN_FIELDS]
+
+# ==========================================
+# VUES (objets compatibles TransportMode)
+# ==========================================
+
+def _column_property(column: str, to_py, to_store=None):
+    def getter(self):
+        return to_py(getattr(self._store, column)[self._row])
+
+    def setter(self, value):
+        getattr(self._store, column)[self._row] = to_store(value) if to_store else value
+
+    return property(getter, setter)
+
+def _side_property(code: int, field: str):
+    def getter(self):
+        store = self._store
+        return store._side[code][field][store._local[self._row]]
+
+    def setter(self, value):
+        store = self._store
+        store._side[code][field][store._local[self._row]] = value
+
+    return property(getter, setter)
+
+def _view_eq(self, other):
+    return type(other) is type(self) and other._store is self._store and other._row == self._row
+
+def _view_hash(self):
+    return hash((id(self._store), self._row))
+
+def _make_view_class(cls, code: int):
+    slots = _slot_names(cls)
+    ns = {
+        "__slots__": ("_store", "_row"),
+        "__qualname__": cls.__qualname__,
+        "__module__": cls.__module__,
+        "__eq__": _view_eq,
+        "__hash__": _view_hash,
+        # id en lecture seule : _row_by_id en dépend
+        "id": property(lambda self: int(self._store.ids[self._row])),
+        "daily_rate": _column_property("daily_rates", float),
+        "status": _column_property("status_codes", STATUS_LIST.__getitem__, STATUS_CODES.__getitem__),
+    }
+    if "year" in slots:
+        ns["year"] = _column_property("years", int)
+    if "age" in slots:
+        ns["age"] = _column_property("ages", int)
+    for field in _side_fields(cls):
+        ns[field] = _side_property(code, field)
+
+    # Même nom que la classe réelle : to_dict() et l'UI utilisent __class__.__name__
+    return type(cls.__name__, (cls,), ns)
+
+# Une vue a le code de classe de sa classe réelle (registry.class_code suit l'héritage)
+VIEW_CLASSES = tuple(_make_view_class(cls, code) for code, cls in enumerate(FLEET_CLASSES))
+
+# ==========================================
+# STOCKAGE
+# ==========================================
+
+class ColumnarFleet:
+    """Flotte en colonnes, utilisable comme la liste CarRentalSystem.fleet."""
+
+    def __init__(self, vehicles=(), capacity: int = 64):
+        self._size = 0      # lignes utilisées (y compris supprimées)
+        self._count = 0     # lignes vivantes
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.daily_rates = np.zeros(capacity, dtype=np.float64)
+        self.status_codes = np.zeros(capacity, dtype=np.int8)
+        self.class_codes = np.zeros(capacity, dtype=np.int16)
+        self.years = np.full(capacity, MISSING_INT, dtype=np.int32)
+        self.ages = np.full(capacity, MISSING_INT, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self._local = np.zeros(capacity, dtype=np.int32)  # ligne -> index dans la table annexe
+
+        # Tables annexes : code de classe -> {champ -> liste de valeurs}
+        self._side: Dict[int, Dict[str, list]] = {
+            code: {f: [] for f in _side_fields(cls)} for code, cls in enumerate(FLEET_CLASSES)
+        }
+        self._row_by_id: Dict[int, int] = {}
+
+        for v in vehicles:
+            self.append(v)
+
+    # --- Croissance des tableaux ---
+    def _grow(self):
+        capacity = max(64, len(self.ids) * 2)
+        for name in ("ids", "daily_rates", "status_codes", "class_codes", "years", "ages", "alive", "_local"):
+            old = getattr(self, name)
+            fill = MISSING_INT if name in ("years", "ages") else 0
+            new = np.full(capacity, fill, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _view(self, row: int):
+        view = object.__new__(VIEW_CLASSES[self.class_codes[row]])
+        view._store = self
+        view._row = row
+        return view
+
+    def _live_rows(self) -> np.ndarray:
+        return np.flatnonzero(self.alive[:self._size])
+
+    # --- Interface "liste" ---
+    def add(self, vehicle):
+        """Ajoute un élément et renvoie sa vue (l'objet d'origine n'est plus suivi)."""
+        if self._size == len(self.ids):
+            self._grow()
+
+        row = self._size
+        code = class_code(vehicle)
+        self.ids[row] = vehicle.id
+        self.daily_rates[row] = vehicle.daily_rate
+        self.status_codes[row] = STATUS_CODES[vehicle.status]
+        self.class_codes[row] = code
+        self.years[row] = getattr(vehicle, "year", MISSING_INT)
+        self.ages[row] = getattr(vehicle, "age", MISSING_INT)
+        self.alive[row] = True
+
+        side = self._side[code]
+        first = next(iter(side.values()), None)
+        self._local[row] = len(first) if first is not None else 0
+        for field, values in side.items():
+            values.append(getattr(vehicle, field))
+
+        self._row_by_id[vehicle.id] = row
+        self._size += 1
+        self._count += 1
+        return self._view(row)
+
+    def append(self, vehicle):
+        self.add(vehicle)
+
+    def extend(self, vehicles):
+        for v in vehicles:
+            self.add(v)
+
+    def remove(self, vehicle):
+        row = self._row_by_id.get(vehicle.id)
+        if row is None or not self.alive[row]:
+            raise ValueError("ColumnarFleet.remove(x): x not in fleet")
+
+        self.alive[row] = False
+        del self._row_by_id[vehicle.id]
+        self._count -= 1
+
+        # On libère les références de la table annexe (la ligne reste un "trou")
+        side = self._side[self.class_codes[row]]
+        local = self._local[row]
+        for values in side.values():
+            values[local] = None
+
+    def find(self, v_id: int):
+        row = self._row_by_id.get(v_id)
+        return self._view(row) if row is not None else None
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for row in self._live_rows():
+            yield self._view(int(row))
+
+    def __getitem__(self, index):
+        if self._count == self._size and isinstance(index, int):
+            # Pas de trou : l'index de la liste est directement la ligne
+            if index < 0:
+                index += self._size
+            if not 0 <= index < self._size:
+                raise IndexError("fleet index out of range")
+            return self._view(index)
+
+        rows = self._live_rows()[index]
+        if isinstance(index, slice):
+            return [self._view(int(r)) for r in rows]
+        return self._view(int(rows))
+
+    def __contains__(self, vehicle):
+        row = self._row_by_id.get(getattr(vehicle, "id", None))
+        return row is not None and bool(self.alive[row])
+
+    def set_status(self, ids, status: VehicleStatus):
+        """Change le statut de plusieurs éléments en une seule écriture de colonne."""
+        rows = np.fromiter((self._row_by_id[i] for i in ids), dtype=np.int64)
+        self.status_codes[rows] = STATUS_CODES[status]
+
+    def page(self, after: Optional[int] = None, limit: int = 50, codes=None,
+             status: Optional[VehicleStatus] = None, min_price: Optional[float] = None,
+             max_price: Optional[float] = None):
+        """Même contrat que FleetIndex.page : filtres évalués sur les colonnes, en un passage."""
+        n = self._size
+        mask = self.alive[:n].copy()
+        if after is not None:
+            mask &= self.ids[:n] > after
+        if codes is not None:
+            mask &= np.isin(self.class_codes[:n], list(codes))
+        if status is not None:
+            mask &= self.status_codes[:n] == STATUS_CODES[status]
+        if min_price is not None:
+            mask &= self.daily_rates[:n] >= min_price
+        if max_price is not None:
+            mask &= self.daily_rates[:n] <= max_price
+
+        rows = np.flatnonzero(mask)
+        if len(rows) > limit:
+            # Seules les limit + 1 plus petites valeurs d'id sont triées
+            rows = rows[np.argpartition(self.ids[rows], limit)[:limit + 1]]
+        rows = rows[np.argsort(self.ids[rows], kind="stable")]
+        views = [self._view(int(r)) for r in rows[:limit]]
+        return views, (views[-1].id if len(rows) > limit else None)
+
+    # ==========================================
+    # RÉDUCTIONS VECTORISÉES (ANALYTIQUE)
+    # ==========================================
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Colonnes communes des éléments vivants (copies contiguës)."""
+        rows = self._live_rows()
+        return {
+            "id": self.ids[rows],
+            "daily_rate": self.daily_rates[rows],
+            "status": self.status_codes[rows],
+            "class": self.class_codes[rows],
+            "year": self.years[rows],
+            "age": self.ages[rows],
+        }
+
+    def status_counts(self) -> Dict[VehicleStatus, int]:
+        live = self.alive[:self._size]
+        counts = np.bincount(self.status_codes[:self._size][live], minlength=len(STATUS_LIST))
+        return {s: int(counts[i]) for i, s in enumerate(STATUS_LIST)}
+
+    def potential_daily_revenue(self, status: Optional[VehicleStatus] = None) -> float:
+        """Somme des tarifs journaliers (optionnellement pour un seul statut)."""
+        mask = self.alive[:self._size]
+        if status is not None:
+            mask = mask & (self.status_codes[:self._size] == STATUS_CODES[status])
+        return float(self.daily_rates[:self._size][mask].sum())
@@ -0,0 +1,71 @@
+from typing import Dict, List, Optional
+
+from .enums import VehicleStatus
+
+class HarnessIndex:
+    """
+    Index bidirectionnel des attelages :
+      animal -> véhicule tracté, et véhicule tracté -> animaux.
+
+    Savoir si un animal est déjà attelé, ou si tout un attelage est
+    disponible, ne demande plus de parcourir les calèches et charrettes.
+    """
+    __slots__ = ("_towed_of", "_team_of", "_pending")
+
+    def __init__(self):
+        self._towed_of: Dict[int, object] = {}       # id animal -> véhicule tracté
+        self._team_of: Dict[int, List[object]] = {}  # id véhicule -> animaux (même liste que vehicle.animals)
+        self._pending: Dict[int, List[object]] = {}  # id animal pas encore chargé -> véhicules en attente
+
+    # --- Mise à jour ---
+    def link(self, towed, animal):
+        """Enregistre un lien déjà validé (ajoute aussi l'animal à towed.animals)."""
+        if animal not in towed.animals:
+            towed.animals.append(animal)
+        self._team_of[towed.id] = towed.animals
+        self._towed_of[animal.id] = towed
+
+    def unlink(self, animal):
+        """Dételle un animal (s'il était attelé)."""
+        towed = self._towed_of.pop(animal.id, None)
+        if towed is not None and animal in towed.animals:
+            towed.animals.remove(animal)
+        return towed
+
+    def forget(self, element):
+        """Retire un élément supprimé de la flotte (animal ou véhicule tracté)."""
+        self.unlink(element)
+        team = self._team_of.pop(element.id, None)
+        for animal in team or ():
+            self._towed_of.pop(animal.id, None)
+
+    # --- Chargement en une seule passe ---
+    def expect(self, towed, animal_id: int, loaded: Dict[int, object]):
+        """Lien lu dans le fichier : résolu tout de suite ou dès que l'animal sera chargé."""
+        self._team_of[towed.id] = towed.animals
+        animal = loaded.get(animal_id)
+        if animal is not None:
+            self.link(towed, animal)
+        else:
+            self._pending.setdefault(animal_id, []).append(towed)
+
+    def resolve(self, animal):
+        """À appeler pour chaque élément chargé : termine les liens en attente."""
+        for towed in self._pending.pop(animal.id, ()):
+            self.link(towed, animal)
+
+    # --- Requêtes O(1) ---
+    def towed_of(self, animal_id: int):
+        return self._towed_of.get(animal_id)
+
+    def is_harnessed(self, animal_id: int) -> bool:
+        return animal_id in self._towed_of
+
+    def team_of(self, towed_id: int) -> List[object]:
+        return self._team_of.get(towed_id, [])
+
+    def is_team_available(self, towed) -> bool:
+        """Le véhicule tracté et tous ses animaux sont disponibles (attelage de quelques bêtes)."""
+        if towed.status != VehicleStatus.AVAILABLE:
+            return False
+        return all(a.status == VehicleStatus.AVAILABLE for a in self._team_of.get(towed.id, ()))
@@ -0,0 +1,76 @@
+"""
+Index de la flotte (mode liste) pour la pagination par curseur.
+
+Les ids sont gardés triés, globalement et par classe : une page "après
+l'id X" commence par une recherche dichotomique et ne lit que les
+éléments candidats. La classe d'un élément ne change jamais ; le statut et
+le tarif, eux, sont lus sur l'objet au moment de la requête (jamais
+périmés, sans avoir à prévenir l'index à chaque changement).
+"""
+from bisect import bisect_right, insort
+from heapq import merge
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .enums import VehicleStatus
+from .registry import class_code
+
+def _from_index(items: list, start: int) -> Iterator:
+    """Parcours par index : démarrer au curseur ne coûte pas de sauter les éléments précédents."""
+    return (items[i] for i in range(start, len(items)))
+
+class FleetIndex:
+    __slots__ = ("_ids", "_by_id", "_by_class")
+
+    def __init__(self, vehicles: Iterable = ()):
+        self._ids: List[int] = []
+        self._by_id: Dict[int, object] = {}
+        self._by_class: Dict[int, List[int]] = {}
+        for v in vehicles:
+            self.add(v)
+
+    def add(self, vehicle):
+        insort(self._ids, vehicle.id)
+        insort(self._by_class.setdefault(class_code(vehicle), []), vehicle.id)
+        self._by_id[vehicle.id] = vehicle
+
+    def remove(self, vehicle):
+        if self._by_id.pop(vehicle.id, None) is None:
+            return
+        for ids in (self._ids, self._by_class[class_code(vehicle)]):
+            i = bisect_right(ids, vehicle.id) - 1
+            if i >= 0 and ids[i] == vehicle.id:
+                del ids[i]
+
+    def find(self, v_id: int):
+        return self._by_id.get(v_id)
+
+    def _ids_after(self, after: Optional[int], codes: Optional[Iterable[int]]) -> Iterator[int]:
+        """Ids triés strictement après le curseur (une seule liste, ou fusion des listes par classe)."""
+        if codes is None:
+            lists = [self._ids]
+        else:
+            lists = [self._by_class[c] for c in set(codes) if c in self._by_class]
+        start = after if after is not None else float("-inf")
+        slices = [_from_index(ids, bisect_right(ids, start)) for ids in lists]
+        return slices[0] if len(slices) == 1 else merge(*slices)
+
+    def page(self, after: Optional[int] = None, limit: int = 50, codes: Optional[Iterable[int]] = None,
+             status: Optional[VehicleStatus] = None, min_price: Optional[float] = None,
+             max_price: Optional[float] = None) -> Tuple[list, Optional[int]]:
+        """
+        Jusqu'à `limit` éléments d'id > after correspondant aux filtres, et le
+        curseur de la page suivante (None si c'était la dernière).
+        """
+        results = []
+        for v_id in self._ids_after(after, codes):
+            v = self._by_id[v_id]
+            if status is not None and v.status != status:
+                continue
+            if min_price is not None and v.daily_rate < min_price:
+                continue
+            if max_price is not None and v.daily_rate > max_price:
+                continue
+            if len(results) == limit:
+                return results, results[-1].id
+            results.append(v)
+        return results, None
@@ -1,7 +1,11 @@
+from array import array
 from datetime import date, timedelta
+from typing import List, Optional, Union
 from .enums import MaintenanceType
 
 class Maintenance:
+    __slots__ = ("id", "date", "type", "cost", "description", "duration")
+
     def __init__(self, m_id: int, date_m: date, m_type: MaintenanceType, cost: float, description: str, duration: float):
         self.id = m_id
         self.date = date_m
@@ -26,4 +30,102 @@ class Maintenance:
             "cost": self.cost,
             "description": self.description,
             "duration": self.duration
-        }
\ No newline at end of file
+        }
+
+# Codes compacts des types d'intervention (index dans l'Enum)
+MAINTENANCE_TYPES = list(MaintenanceType)
+MAINTENANCE_TYPE_CODES = {t: i for i, t in enumerate(MAINTENANCE_TYPES)}
+
+# Bits de _int_flags : valeurs saisies en entier (rendues telles quelles, pas en 150.0)
+INT_COST, INT_DURATION = 1, 2
+
+class MaintenanceLog:
+    """
+    Journal d'entretien compact d'un véhicule.
+
+    Les entrées sont stockées en colonnes (array) : id, date (ordinal), code
+    du type, coût et durée. Des agrégats sont tenus à jour à chaque ajout
+    (coût total, nombre par type, dernière intervention, jours d'immobilisation)
+    pour que les tableaux de bord n'aient pas à parcourir les entrées.
+    """
+    __slots__ = ("_ids", "_dates", "_types", "_costs", "_durations", "_int_flags", "_descriptions",
+                 "total_cost", "count_by_type", "last_service_date", "total_downtime_days")
+
+    def __init__(self, entries=()):
+        self._ids = array("q")
+        self._dates = array("l")
+        self._types = array("b")
+        self._costs = array("d")
+        self._durations = array("d")
+        self._int_flags = array("b")
+        self._descriptions = []
+
+        self.total_cost = 0.0
+        self.count_by_type = [0] * len(MAINTENANCE_TYPES)
+        self.last_service_date: Optional[date] = None
+        self.total_downtime_days = 0.0
+
+        for m in entries:
+            self.append(m)
+
+    def append(self, maintenance: Maintenance):
+        code = MAINTENANCE_TYPE_CODES[maintenance.type]
+        self._ids.append(maintenance.id)
+        self._dates.append(maintenance.date.toordinal())
+        self._types.append(code)
+        self._costs.append(maintenance.cost)
+        self._durations.append(maintenance.duration)
+        self._int_flags.append((INT_COST if isinstance(maintenance.cost, int) else 0)
+                               | (INT_DURATION if isinstance(maintenance.duration, int) else 0))
+        # Texte libre : gardé tel quel (seuls les champs catégoriels passent par la table de symboles)
+        self._descriptions.append(maintenance.description)
+
+        # Agrégats incrémentaux
+        self.total_cost += maintenance.cost
+        self.count_by_type[code] += 1
+        self.total_downtime_days += maintenance.duration
+        if self.last_service_date is None or maintenance.date > self.last_service_date:
+            self.last_service_date = maintenance.date
+
+    def count(self, m_type: MaintenanceType) -> int:
+        return self.count_by_type[MAINTENANCE_TYPE_CODES[m_type]]
+
+    def __len__(self):
+        return len(self._ids)
+
+    def _cost(self, i: int):
+        cost = self._costs[i]
+        return int(cost) if self._int_flags[i] & INT_COST else cost
+
+    def _duration(self, i: int):
+        duration = self._durations[i]
+        return int(duration) if self._int_flags[i] & INT_DURATION else duration
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[Maintenance, List[Maintenance]]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self._ids)))]
+        return Maintenance(self._ids[i], date.fromordinal(self._dates[i]), MAINTENANCE_TYPES[self._types[i]],
+                           self._cost(i), self._descriptions[i], self._duration(i))
+
+    def __iter__(self):
+        # Les objets Maintenance sont recréés à la demande (non stockés)
+        for i in range(len(self._ids)):
+            yield self[i]
+
+    def to_dicts(self):
+        """Sérialisation directe depuis les colonnes (sans objets intermédiaires)."""
+        return [
+            {"id": self._ids[i], "date": str(date.fromordinal(self._dates[i])), "type": MAINTENANCE_TYPES[self._types[i]].value,
+             "cost": self._cost(i), "description": self._descriptions[i], "duration": self._duration(i)}
+            for i in range(len(self._ids))
+        ]
+
+    def columns(self):
+        """Colonnes du journal (dates en objets date, types en Enum)."""
+        return {
+            "date": [date.fromordinal(d) for d in self._dates],
+            "type": [MAINTENANCE_TYPES[t] for t in self._types],
+            "cost": [self._cost(i) for i in range(len(self._ids))],
+            "duration": [self._duration(i) for i in range(len(self._ids))],
+            "description": list(self._descriptions),
+        }
@@ -0,0 +1,35 @@
+from .vehicles import Car, Truck, Motorcycle, Hearse, GoKart, Boat, Submarine, Plane, Helicopter, Carriage, Cart
+from .animals import Horse, Donkey, Camel, Whale, Dolphin, Eagle, Dragon
+
+# Les 18 classes concrètes de la flotte.
+# L'ordre définit le "code de classe" (entier) utilisé par les tables précalculées.
+FLEET_CLASSES = (
+    Car, Truck, Motorcycle, Hearse, GoKart,   # Terre (moteur)
+    Boat, Submarine,                          # Mer (moteur)
+    Plane, Helicopter,                        # Air (moteur)
+    Carriage, Cart,                           # Attelages
+    Horse, Donkey, Camel,                     # Animaux terrestres
+    Whale, Dolphin,                           # Animaux marins
+    Eagle, Dragon,                            # Animaux aériens
+)
+
+CLASS_CODES = {cls: code for code, cls in enumerate(FLEET_CLASSES)}
+CLASS_BY_NAME = {cls.__name__: cls for cls in FLEET_CLASSES}
+
+def class_code(vehicle) -> int:
+    """
+    Code entier de la classe d'un élément de la flotte. Une sous-classe (ex :
+    vue de la flotte colonnaire) a le code de la classe métier dont elle dérive.
+    """
+    cls = type(vehicle)
+    code = CLASS_CODES.get(cls)
+    if code is None:
+        code = next(CLASS_CODES[base] for base in cls.__mro__ if base in CLASS_CODES)
+    return code
+
+# Milieux (mêmes regroupements que les menus d'ajout) -> classes concernées
+ENVIRONMENTS = {
+    "terre": (Car, Truck, Motorcycle, Hearse, GoKart, Carriage, Cart, Horse, Donkey, Camel),
+    "mer": (Boat, Submarine, Whale, Dolphin),
+    "air": (Plane, Helicopter, Eagle, Dragon),
+}
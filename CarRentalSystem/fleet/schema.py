@@ -0,0 +1,148 @@
+"""
+Schéma déclaratif des champs de la flotte et génération de code.
+
+Chaque classe déclare ses propres champs avec le décorateur `fleet_schema`.
+À l'import, on génère pour chaque classe concrète des fonctions "à plat"
+(sans super() ni dict.update intermédiaires) :
+  - to_dict   : objet -> dict JSON
+  - from_dict : dict JSON -> objet (sans repasser par la chaîne de __init__)
+  - show_details : à partir d'un gabarit texte
+"""
+import re
+from abc import update_abstractmethods
+from inspect import isabstract
+from datetime import date
+
+from .enums import VehicleStatus, MaintenanceType
+from .maintenance import Maintenance, MaintenanceLog
+from .symbols import intern_symbol
+
+REQUIRED = object()
+
+class Field:
+    """
+    Un champ persistant (ou non) d'une classe de la flotte.
+
+    - key     : clé JSON (par défaut le nom de l'attribut)
+    - default : valeur si la clé est absente au chargement (sinon obligatoire)
+    - encode  : expression de sérialisation, "{}" = la valeur de l'attribut
+    - decode  : expression de désérialisation, "{}" = la valeur JSON
+    - persist : False pour un attribut qui n'est jamais sauvegardé
+    - init    : expression de la valeur initiale d'un attribut non sauvegardé
+    """
+    __slots__ = ("name", "key", "default", "encode", "decode", "persist", "init")
+
+    def __init__(self, name, key=None, default=REQUIRED, encode=None, decode=None, persist=True, init="None"):
+        self.name = name
+        self.key = key or name
+        self.default = default
+        self.encode = encode
+        self.decode = decode
+        self.persist = persist
+        self.init = init
+
+def interned(name, **kwargs):
+    """Champ catégoriel : la valeur chargée passe par la table de symboles."""
+    return Field(name, decode="_intern({})", **kwargs)
+
+# ==========================================
+# AIDES UTILISÉES PAR LE CODE GÉNÉRÉ
+# ==========================================
+
+STATUS_BY_VALUE = {s.value: s for s in VehicleStatus}
+MAINTENANCE_TYPE_BY_VALUE = {t.value: t for t in MaintenanceType}
+
+def decode_maintenance_log(entries):
+    """Reconstruit un journal d'entretien (les types inconnus sont ignorés)."""
+    log = MaintenanceLog()
+    for l in entries:
+        mt = MAINTENANCE_TYPE_BY_VALUE.get(l["type"])
+        if mt:
+            log.append(Maintenance(l["id"], date.fromisoformat(l["date"]), mt, l["cost"], l["description"], l.get("duration", 1.0)))
+    return log
+
+_NAMESPACE = {
+    "_new": object.__new__,
+    "_intern": intern_symbol,
+    "_status": STATUS_BY_VALUE,
+    "_AVAILABLE": VehicleStatus.AVAILABLE,
+    "_decode_log": decode_maintenance_log,
+}
+
+# ==========================================
+# GÉNÉRATION
+# ==========================================
+
+def all_fields(cls):
+    """Champs de la classe et de ses parents, du plus général au plus précis."""
+    fields = []
+    for klass in reversed(cls.__mro__):
+        fields.extend(klass.__dict__.get("_schema_fields", ()))
+    return fields
+
+def _compile(source, name, cls):
+    namespace = dict(_NAMESPACE, _cls=cls)
+    exec(compile(source, f"<fleet_schema {cls.__name__}.{name}>", "exec"), namespace)
+    return namespace[name]
+
+def _encoder_source(cls, fields):
+    items = [f'"type": "{cls.__name__}"']
+    for f in fields:
+        if not f.persist:
+            continue
+        value = f"o.{f.name}"
+        items.append(f'"{f.key}": ' + (f.encode.format(value) if f.encode else value))
+    return "def to_dict(o):\n    return {" + ", ".join(items) + "}\n"
+
+def _decoder_source(fields):
+    lines = ["def from_dict(d):", "    o = _new(_cls)"]
+    for f in fields:
+        if not f.persist:
+            lines.append(f"    o.{f.name} = {f.init}")
+            continue
+        raw = f'd["{f.key}"]' if f.default is REQUIRED else f'd.get("{f.key}", {f.default!r})'
+        lines.append(f"    o.{f.name} = " + (f.decode.format(raw) if f.decode else raw))
+    lines.append("    return o")
+    return "\n".join(lines) + "\n"
+
+# {champ} ou {champ?texte si vrai|texte si faux}
+_PLACEHOLDER = re.compile(r"\{(\w+)(?:\?([^|}]*)\|([^}]*))?\}")
+
+def _details_source(template):
+    def literal(text):
+        return text.replace("\\", "\\\\").replace('"', '\\"').replace("{", "{{").replace("}", "}}")
+
+    parts, choices, pos = [], [], 0
+    for m in _PLACEHOLDER.finditer(template):
+        parts.append(literal(template[pos:m.start()]))
+        name, if_true, if_false = m.groups()
+        if if_true is None:
+            parts.append(f"{{self.{name}}}")
+        else:
+            # Les libellés sont passés en arguments par défaut (pas d'échappement dans le f-string)
+            t, f = f"_c{len(choices)}", f"_c{len(choices) + 1}"
+            choices += [(t, if_true), (f, if_false)]
+            parts.append(f"{{{t} if self.{name} else {f}}}")
+        pos = m.end()
+    parts.append(literal(template[pos:]))
+
+    args = "".join(f", {n}={v!r}" for n, v in choices)
+    return f"def show_details(self{args}):\n    return f\"" + "".join(parts) + "\"\n"
+
+def fleet_schema(*fields, details=None):
+    """Décorateur : déclare les champs propres à la classe et génère son code."""
+    def decorate(cls):
+        cls._schema_fields = fields
+
+        if details is not None:
+            cls.show_details = _compile(_details_source(details), "show_details", cls)
+            update_abstractmethods(cls)
+
+        if isabstract(cls):
+            return cls
+
+        full = all_fields(cls)
+        cls.to_dict = _compile(_encoder_source(cls, full), "to_dict", cls)
+        cls.from_dict = staticmethod(_compile(_decoder_source(full), "from_dict", cls))
+        return cls
+    return decorate
@@ -0,0 +1,25 @@
+class SymbolTable:
+    """
+    Table de symboles partagée : une seule instance de chaque valeur
+    catégorielle (marque, modèle, race, couleur...) pour toute la flotte.
+    """
+    __slots__ = ("_symbols",)
+
+    def __init__(self):
+        self._symbols = {}
+
+    def intern(self, value):
+        """Renvoie l'instance partagée égale à `value` (l'enregistre si besoin)."""
+        if value is None:
+            return None
+        return self._symbols.setdefault(value, value)
+
+    def __len__(self):
+        return len(self._symbols)
+
+    def __contains__(self, value):
+        return value in self._symbols
+
+# Table unique utilisée par les constructeurs et le chargement
+SYMBOLS = SymbolTable()
+intern_symbol = SYMBOLS.intern
@@ -1,14 +1,24 @@
 from abc import ABC, abstractmethod
-from typing import List
 from .enums import VehicleStatus
-from .maintenance import Maintenance
+from .maintenance import Maintenance, MaintenanceLog
+from .symbols import intern_symbol
+from .schema import Field, interned, fleet_schema
 
+# to_dict / from_dict sont générés par @fleet_schema pour chaque classe concrète
+@fleet_schema(
+    Field("id"),
+    Field("daily_rate"),
+    Field("status", encode="{}.value", decode="_status.get({}, _AVAILABLE)", default=None),
+    Field("maintenance_log", encode="{}.to_dicts()", decode="_decode_log({})", default=()),
+)
 class TransportMode(ABC):
+    __slots__ = ("id", "daily_rate", "status", "maintenance_log")
+
     def __init__(self, t_id: int, daily_rate: float):
         self.id = t_id
         self.daily_rate = daily_rate
         self.status = VehicleStatus.AVAILABLE
-        self.maintenance_log: List[Maintenance] = []
+        self.maintenance_log = MaintenanceLog()
 
     @property
     def is_available(self):
@@ -17,60 +27,42 @@ class TransportMode(ABC):
     def add_maintenance(self, maintenance: Maintenance):
         self.maintenance_log.append(maintenance)
 
-    def to_dict(self):
-        m_logs = [m.to_dict() for m in self.maintenance_log]
-        return {
-            "type": self.__class__.__name__,
-            "id": self.id,
-            "daily_rate": self.daily_rate,
-            "status": self.status.value,
-            "maintenance_log": m_logs
-        }
-
     @abstractmethod
     def show_details(self):
         pass
 
+@fleet_schema(interned("brand"), interned("model"), Field("license_plate"), Field("year", default=2020))
 class MotorizedVehicle(TransportMode):
+    __slots__ = ("brand", "model", "license_plate", "year")
+
     def __init__(self, t_id, daily_rate, brand, model, license_plate, year):
         super().__init__(t_id, daily_rate)
-        self.brand = brand
-        self.model = model
+        self.brand = intern_symbol(brand)
+        self.model = intern_symbol(model)
         self.license_plate = license_plate
         self.year = year
 
-    def to_dict(self):
-        data = super().to_dict()
-        data.update({"brand": self.brand, "model": self.model, "license_plate": self.license_plate, "year": self.year})
-        return data
-
+@fleet_schema(Field("name"), interned("breed"), Field("birth_date", persist=False))
 class TransportAnimal(TransportMode):
+    __slots__ = ("name", "breed", "birth_date")
+
     def __init__(self, t_id, daily_rate, name, breed, birth_date):
         super().__init__(t_id, daily_rate)
         self.name = name
-        self.breed = breed
+        self.breed = intern_symbol(breed)
         self.birth_date = birth_date # Gardé pour compatibilité, mais on utilise 'age' dans les enfants
 
-    def to_dict(self):
-        data = super().to_dict()
-        data.update({"name": self.name, "breed": self.breed})
-        return data
-
+# On sauvegarde les IDs des animaux pour reconstruire le lien plus tard
+@fleet_schema(Field("seat_count"), Field("animals", key="animal_ids", encode="[a.id for a in {}]", decode="[]", default=()))
 class TowedVehicle(TransportMode):
+    __slots__ = ("seat_count", "animals")
+
     def __init__(self, t_id, daily_rate, seat_count):
         super().__init__(t_id, daily_rate)
         self.seat_count = seat_count
-        self.animals = [] 
+        self.animals = []
 
     def harness_animal(self, animal):
         self.animals.append(animal)
         print(f"✅ {animal.name} a été attelé.")
-
-    def to_dict(self):
-        data = super().to_dict()
-        # On sauvegarde les IDs pour reconstruire le lien plus tard
-        data.update({
-            "seat_count": self.seat_count,
-            "animal_ids": [a.id for a in self.animals]
-        })
-        return data
\ No newline at end of file
+        return True
@@ -100,10 +100,10 @@ def show_main_menu(system, storage):
 
         if choice == '0': break
         elif choice == '1' : list_fleet(fleet)
-        elif choice == '2' : add_menu_by_environment(fleet)
+        elif choice == '2' : add_menu_by_environment(system)
         elif choice == '3' : maintenance_menu(fleet)
-        elif choice == '4' : harness_menu(fleet)
-        elif choice == '5' : delete_menu(fleet)
+        elif choice == '4' : harness_menu(system)
+        elif choice == '5' : delete_menu(system)
         elif choice == '6' : show_single_vehicle_details(fleet)
         elif choice == '7' : statistics_menu(fleet)
         elif choice == '8':
@@ -131,9 +131,10 @@ def show_single_vehicle_details(fleet):
 
     table.add_row("Tarif Journalier", f"{obj.daily_rate}€")
 
-    ignored_keys = ['id', 'status', 'daily_rate', 'maintenance_log', 'animals', 'animal_ids']
+    ignored_keys = ['type', 'id', 'status', 'daily_rate', 'maintenance_log', 'animals', 'animal_ids']
 
-    for key, value in obj.__dict__.items():
+    # Les classes utilisent __slots__ (pas de __dict__) : on passe par to_dict()
+    for key, value in obj.to_dict().items():
         if key not in ignored_keys:
             pretty_key = key.replace("_", " ").title()
 
@@ -309,7 +310,8 @@ def visualize_menu(fleet):
     list_fleet(subset, titre)
 
 # --- 🌍 MENU AJOUT ---
-def add_menu_by_environment(fleet):
+def add_menu_by_environment(system):
+    fleet = system.fleet
     console.print(Panel("[1] ⛰️ TERRE\n[2] 🌊 MER\n[3] ☁️ AIR\n[0] Retour", title="Choix Environnement"))
     env = Prompt.ask("Votre choix", choices=["0", "1", "2", "3"])
 
@@ -335,25 +337,25 @@ def add_menu_by_environment(fleet):
             plate = ask_text(label_id)
             year = ask_int("Année")
 
-            if c=='1': fleet.append(Car(new_id, rate, brand, model, plate, year, ask_int("Nb Portes"), ask_bool("Climatisation ?")))
-            elif c=='2': fleet.append(Truck(new_id, rate, brand, model, plate, year, ask_float("Volume (m3)"), ask_float("Poids Max (T)")))
-            elif c=='3': fleet.append(Motorcycle(new_id, rate, brand, model, plate, year, ask_int("Cylindrée (cc)"), ask_bool("Avec TopCase ?")))
-            elif c=='4': fleet.append(Hearse(new_id, rate, brand, model, plate, year, ask_float("Long. Cercueil (m)"), ask_bool("Réfrigéré ?")))
-            elif c=='5': fleet.append(GoKart(new_id, rate, brand, model, plate, year, ask_text("Type Moteur"), ask_bool("Indoor ?")))
+            if c=='1': system.add_vehicle(Car(new_id, rate, brand, model, plate, year, ask_int("Nb Portes"), ask_bool("Climatisation ?")))
+            elif c=='2': system.add_vehicle(Truck(new_id, rate, brand, model, plate, year, ask_float("Volume (m3)"), ask_float("Poids Max (T)")))
+            elif c=='3': system.add_vehicle(Motorcycle(new_id, rate, brand, model, plate, year, ask_int("Cylindrée (cc)"), ask_bool("Avec TopCase ?")))
+            elif c=='4': system.add_vehicle(Hearse(new_id, rate, brand, model, plate, year, ask_float("Long. Cercueil (m)"), ask_bool("Réfrigéré ?")))
+            elif c=='5': system.add_vehicle(GoKart(new_id, rate, brand, model, plate, year, ask_text("Type Moteur"), ask_bool("Indoor ?")))
 
         elif c in ['6', '7', '8']:
             name = ask_text("Nom")
             breed = ask_text("Race")
             age = ask_int("Âge")
 
-            if c=='6': fleet.append(Horse(new_id, rate, name, breed, age, ask_int("Taille (cm)"), ask_int("Fer Av (mm)"), ask_int("Fer Arr (mm)")))
-            elif c=='7': fleet.append(Donkey(new_id, rate, name, breed, age, ask_float("Capacité (kg)"), ask_bool("Têtu ?")))
-            elif c=='8': fleet.append(Camel(new_id, rate, name, breed, age, ask_int("Nb Bosses"), ask_float("Réserve Eau (L)")))
+            if c=='6': system.add_vehicle(Horse(new_id, rate, name, breed, age, ask_int("Taille (cm)"), ask_int("Fer Av (mm)"), ask_int("Fer Arr (mm)")))
+            elif c=='7': system.add_vehicle(Donkey(new_id, rate, name, breed, age, ask_float("Capacité (kg)"), ask_bool("Têtu ?")))
+            elif c=='8': system.add_vehicle(Camel(new_id, rate, name, breed, age, ask_int("Nb Bosses"), ask_float("Réserve Eau (L)")))
 
         elif c in ['9', '10']:
             seats = ask_int("Nb Places")
-            if c=='9': fleet.append(Carriage(new_id, rate, seats, ask_bool("Avec Toit ?")))
-            elif c=='10': fleet.append(Cart(new_id, rate, seats, ask_float("Charge Max (kg)")))
+            if c=='9': system.add_vehicle(Carriage(new_id, rate, seats, ask_bool("Avec Toit ?")))
+            elif c=='10': system.add_vehicle(Cart(new_id, rate, seats, ask_float("Charge Max (kg)")))
 
     # ================= MER =================
     elif env == '2':
@@ -369,15 +371,15 @@ def add_menu_by_environment(fleet):
             plate = ask_text("Nom du Vaisseau ou Numéro de Coque")
             year = ask_int("Année de mise à l'eau")
 
-            if c=='1': fleet.append(Boat(new_id, rate, brand, model, plate, year, ask_float("Longueur (m)"), ask_float("Puissance (cv)")))
-            elif c=='2': fleet.append(Submarine(new_id, rate, brand, model, plate, year, ask_float("Prof. Max (m)"), ask_bool("Nucléaire ?")))
+            if c=='1': system.add_vehicle(Boat(new_id, rate, brand, model, plate, year, ask_float("Longueur (m)"), ask_float("Puissance (cv)")))
+            elif c=='2': system.add_vehicle(Submarine(new_id, rate, brand, model, plate, year, ask_float("Prof. Max (m)"), ask_bool("Nucléaire ?")))
 
         else: # Animaux Marins
             name = ask_text("Nom")
             breed = ask_text("Espèce")
             age = ask_int("Âge")
-            if c=='3': fleet.append(Whale(new_id, rate, name, breed, age, ask_float("Poids (T)"), ask_bool("Chante ?")))
-            elif c=='4': fleet.append(Dolphin(new_id, rate, name, breed, age, ask_float("Vitesse (km/h)"), ask_bool("Connaît des tours ?")))
+            if c=='3': system.add_vehicle(Whale(new_id, rate, name, breed, age, ask_float("Poids (T)"), ask_bool("Chante ?")))
+            elif c=='4': system.add_vehicle(Dolphin(new_id, rate, name, breed, age, ask_float("Vitesse (km/h)"), ask_bool("Connaît des tours ?")))
 
     # ================= AIR =================
     elif env == '3':
@@ -393,14 +395,14 @@ def add_menu_by_environment(fleet):
             plate = ask_text("Immatriculation (ex: F-GHIJ)")
             year = ask_int("Année")
 
-            if c=='1': fleet.append(Plane(new_id, rate, brand, model, plate, year, ask_float("Envergure (m)"), ask_int("Nb Moteurs")))
-            elif c=='2': fleet.append(Helicopter(new_id, rate, brand, model, plate, year, ask_int("Nb Pales"), ask_int("Alt. Max (m)")))
+            if c=='1': system.add_vehicle(Plane(new_id, rate, brand, model, plate, year, ask_float("Envergure (m)"), ask_int("Nb Moteurs")))
+            elif c=='2': system.add_vehicle(Helicopter(new_id, rate, brand, model, plate, year, ask_int("Nb Pales"), ask_int("Alt. Max (m)")))
         
         else:
             name = ask_text("Nom")
             age = ask_int("Âge")
-            if c=='3': fleet.append(Eagle(new_id, rate, name, ask_text("Espèce"), age, ask_int("Envergure (cm)"), ask_int("Alt. Max (m)")))
-            elif c=='4': fleet.append(Dragon(new_id, rate, name, "Dragon", age, ask_float("Portée Feu (m)"), ask_text("Couleur Écailles")))
+            if c=='3': system.add_vehicle(Eagle(new_id, rate, name, ask_text("Espèce"), age, ask_int("Envergure (cm)"), ask_int("Alt. Max (m)")))
+            elif c=='4': system.add_vehicle(Dragon(new_id, rate, name, "Dragon", age, ask_float("Portée Feu (m)"), ask_text("Couleur Écailles")))
 
     console.print(f"[bold green]✅ Élément ajouté avec succès ! (ID: {new_id})[/]")
 
@@ -476,7 +478,8 @@ def maintenance_menu(fleet):
     console.print("[bold green]✅ Maintenance enregistrée avec succès ![/]")
 
 # --- ATTELAGE ---
-def harness_menu(fleet):
+def harness_menu(system):
+    fleet = system.fleet
     list_fleet(fleet)
     vid = ask_int("ID Véhicule Tracté")
     v = next((x for x in fleet if x.id == vid), None)
@@ -491,11 +494,12 @@ def harness_menu(fleet):
     # Capture du print de harness_animal pour le styliser si besoin, 
     # mais ici on laisse la méthode de classe gérer le print
     console.rule("[bold]Résultat Attelage[/]")
-    v.harness_animal(a)
+    system.harness_animal(v, a)
     console.rule()
 
 # --- SUPPRESSION ---
-def delete_menu(fleet):
+def delete_menu(system):
+    fleet = system.fleet
     list_fleet(fleet)
     tid = ask_int("ID à supprimer")
     found = next((v for v in fleet if v.id == tid), None)
@@ -503,7 +507,7 @@ def delete_menu(fleet):
     if found:
         rprint(f"[bold red]❓ Supprimer : {found.show_details()} ?[/]")
         if Confirm.ask("Confirmer"):
-            fleet.remove(found)
+            system.remove_vehicle(found)
             console.print("[bold red]🗑️ Élément supprimé.[/]")
     else:
         console.print("[red]❌ Introuvable.[/]")
@@ -526,15 +530,23 @@ def statistics_menu(fleet):
                 console.print("[red]Flotte vide.[/]")
                 continue
 
-            # Calculs
-            nb_maint = sum(1 for v in fleet if v.status == VehicleStatus.UNDER_MAINTENANCE)
-            nb_rented = sum(1 for v in fleet if v.status == VehicleStatus.RENTED)
-            nb_avail = sum(1 for v in fleet if v.status == VehicleStatus.AVAILABLE)
+            # Calculs (réductions vectorisées si la flotte est stockée en colonnes)
+            if hasattr(fleet, "status_counts"):
+                counts = fleet.status_counts()
+                nb_maint = counts[VehicleStatus.UNDER_MAINTENANCE]
+                nb_rented = counts[VehicleStatus.RENTED]
+                nb_avail = counts[VehicleStatus.AVAILABLE]
+                potential = fleet.potential_daily_revenue()
+            else:
+                nb_maint = sum(1 for v in fleet if v.status == VehicleStatus.UNDER_MAINTENANCE)
+                nb_rented = sum(1 for v in fleet if v.status == VehicleStatus.RENTED)
+                nb_avail = sum(1 for v in fleet if v.status == VehicleStatus.AVAILABLE)
+                potential = sum(v.daily_rate for v in fleet)
             
             # Affichage "Fun" avec Rich
             console.rule("[bold blue]RAPPORT DE FLOTTE[/]")
             console.print(f"Total Véhicules : [bold cyan]{total}[/]")
-            console.print(f"💰 Revenu Potentiel/Jour : [bold green]{sum(v.daily_rate for v in fleet)}€[/]")
+            console.print(f"💰 Revenu Potentiel/Jour : [bold green]{potential}€[/]")
             
             # Barres visuelles
             pct_maint = (nb_maint / total) * 100
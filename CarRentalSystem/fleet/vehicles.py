@@ -1,126 +1,107 @@
 from .transport_base import MotorizedVehicle, TowedVehicle
 from .animals import Horse, Donkey
+from .symbols import intern_symbol
+from .schema import Field, interned, fleet_schema
 
 # --- TERRE ---
+@fleet_schema(Field("door_count"), Field("has_ac"),
+              details="[Voiture {year}] {brand} {model} - {door_count} portes, {has_ac?Clim|Pas de clim}")
 class Car(MotorizedVehicle):
+    __slots__ = ("door_count", "has_ac")
     def __init__(self, t_id, daily_rate, brand, model, license_plate, year, door_count, has_ac):
         super().__init__(t_id, daily_rate, brand, model, license_plate, year)
         self.door_count = door_count; self.has_ac = has_ac
-    
-    def show_details(self): 
-        clim = "Clim" if self.has_ac else "Pas de clim"
-        return f"[Voiture {self.year}] {self.brand} {self.model} - {self.door_count} portes, {clim}"
-    
-    def to_dict(self): d=super().to_dict(); d.update({"door_count": self.door_count, "has_ac": self.has_ac}); return d
 
+@fleet_schema(Field("cargo_volume"), Field("max_weight"),
+              details="[Camion {year}] {brand} {model} - {cargo_volume}m³, {max_weight}T")
 class Truck(MotorizedVehicle):
+    __slots__ = ("cargo_volume", "max_weight")
     def __init__(self, t_id, daily_rate, brand, model, license_plate, year, cargo_volume, max_weight):
         super().__init__(t_id, daily_rate, brand, model, license_plate, year)
         self.cargo_volume = cargo_volume; self.max_weight = max_weight
-    
-    def show_details(self): 
-        return f"[Camion {self.year}] {self.brand} {self.model} - {self.cargo_volume}m³, {self.max_weight}T"
-    
-    def to_dict(self): d=super().to_dict(); d.update({"cargo_volume": self.cargo_volume, "max_weight": self.max_weight}); return d
 
+@fleet_schema(Field("engine_displacement"), Field("has_top_case"),
+              details="[Moto {year}] {brand} {model} - {engine_displacement}cc, {has_top_case?Avec TopCase|Sans TopCase}")
 class Motorcycle(MotorizedVehicle):
+    __slots__ = ("engine_displacement", "has_top_case")
     def __init__(self, t_id, daily_rate, brand, model, license_plate, year, engine_displacement, has_top_case):
         super().__init__(t_id, daily_rate, brand, model, license_plate, year)
         self.engine_displacement = engine_displacement; self.has_top_case = has_top_case
-    
-    def show_details(self): 
-        top = "Avec TopCase" if self.has_top_case else "Sans TopCase"
-        return f"[Moto {self.year}] {self.brand} {self.model} - {self.engine_displacement}cc, {top}"
-    
-    def to_dict(self): d=super().to_dict(); d.update({"engine_displacement": self.engine_displacement, "has_top_case": self.has_top_case}); return d
 
+@fleet_schema(Field("max_coffin_length"), Field("has_refrigeration"),
+              details="[Corbillard {year}] {brand} {model} - Cercueil max {max_coffin_length}m, {has_refrigeration?Réfrigéré|Non réfrigéré}")
 class Hearse(MotorizedVehicle):
+    __slots__ = ("max_coffin_length", "has_refrigeration")
     def __init__(self, t_id, daily_rate, brand, model, license_plate, year, max_coffin_length, has_refrigeration):
         super().__init__(t_id, daily_rate, brand, model, license_plate, year)
         self.max_coffin_length = max_coffin_length; self.has_refrigeration = has_refrigeration
-    
-    def show_details(self): 
-        frigo = "Réfrigéré" if self.has_refrigeration else "Non réfrigéré"
-        return f"[Corbillard {self.year}] {self.brand} {self.model} - Cercueil max {self.max_coffin_length}m, {frigo}"
-    
-    def to_dict(self): d=super().to_dict(); d.update({"max_coffin_length": self.max_coffin_length, "has_refrigeration": self.has_refrigeration}); return d
 
+@fleet_schema(interned("engine_type"), Field("is_indoor"),
+              details="[Kart {year}] {brand} {model} - {engine_type}, {is_indoor?Indoor|Outdoor}")
 class GoKart(MotorizedVehicle):
+    __slots__ = ("engine_type", "is_indoor")
     def __init__(self, t_id, daily_rate, brand, model, license_plate, year, engine_type, is_indoor):
         super().__init__(t_id, daily_rate, brand, model, license_plate, year)
-        self.engine_type = engine_type; self.is_indoor = is_indoor
-    
-    def show_details(self): 
-        loc = "Indoor" if self.is_indoor else "Outdoor"
-        return f"[Kart {self.year}] {self.brand} {self.model} - {self.engine_type}, {loc}"
-    
-    def to_dict(self): d=super().to_dict(); d.update({"engine_type": self.engine_type, "is_indoor": self.is_indoor}); return d
+        self.engine_type = intern_symbol(engine_type); self.is_indoor = is_indoor
 
 # --- MER ---
+@fleet_schema(Field("length_meters"), Field("power_cv"),
+              details="[Bateau {year}] {brand} {model} - {length_meters}m, {power_cv}cv")
 class Boat(MotorizedVehicle):
+    __slots__ = ("length_meters", "power_cv")
     def __init__(self, t_id, daily_rate, brand, model, license_plate, year, length_meters, power_cv):
         super().__init__(t_id, daily_rate, brand, model, license_plate, year)
         self.length_meters = length_meters; self.power_cv = power_cv
-    
-    def show_details(self): 
-        return f"[Bateau {self.year}] {self.brand} {self.model} - {self.length_meters}m, {self.power_cv}cv"
-    
-    def to_dict(self): d=super().to_dict(); d.update({"length_meters": self.length_meters, "power_cv": self.power_cv}); return d
 
+@fleet_schema(Field("max_depth"), Field("is_nuclear"),
+              details="[Sous-Marin {year}] {brand} {model} - Prof. -{max_depth}m, {is_nuclear?Nucléaire|Diesel/Élec}")
 class Submarine(MotorizedVehicle):
+    __slots__ = ("max_depth", "is_nuclear")
     def __init__(self, t_id, daily_rate, brand, model, license_plate, year, max_depth, is_nuclear):
         super().__init__(t_id, daily_rate, brand, model, license_plate, year)
         self.max_depth = max_depth; self.is_nuclear = is_nuclear
-    
-    def show_details(self): 
-        moteur = "Nucléaire" if self.is_nuclear else "Diesel/Élec"
-        return f"[Sous-Marin {self.year}] {self.brand} {self.model} - Prof. -{self.max_depth}m, {moteur}"
-    
-    def to_dict(self): d=super().to_dict(); d.update({"max_depth": self.max_depth, "is_nuclear": self.is_nuclear}); return d
 
 # --- AIR ---
+@fleet_schema(Field("wingspan"), Field("engines_count"),
+              details="[Avion {year}] {brand} {model} - Env. {wingspan}m, {engines_count} moteurs")
 class Plane(MotorizedVehicle):
+    __slots__ = ("wingspan", "engines_count")
     def __init__(self, t_id, daily_rate, brand, model, license_plate, year, wingspan, engines_count):
         super().__init__(t_id, daily_rate, brand, model, license_plate, year)
         self.wingspan = wingspan; self.engines_count = engines_count
-    
-    def show_details(self): 
-        return f"[Avion {self.year}] {self.brand} {self.model} - Env. {self.wingspan}m, {self.engines_count} moteurs"
-    
-    def to_dict(self): d=super().to_dict(); d.update({"wingspan": self.wingspan, "engines_count": self.engines_count}); return d
 
+@fleet_schema(Field("rotor_count"), Field("max_altitude"),
+              details="[Hélico {year}] {brand} {model} - {rotor_count} pales, Alt. max {max_altitude}m")
 class Helicopter(MotorizedVehicle):
+    __slots__ = ("rotor_count", "max_altitude")
     def __init__(self, t_id, daily_rate, brand, model, license_plate, year, rotor_count, max_altitude):
         super().__init__(t_id, daily_rate, brand, model, license_plate, year)
         self.rotor_count = rotor_count; self.max_altitude = max_altitude
-    
-    def show_details(self): 
-        return f"[Hélico {self.year}] {self.brand} {self.model} - {self.rotor_count} pales, Alt. max {self.max_altitude}m"
-    
-    def to_dict(self): d=super().to_dict(); d.update({"rotor_count": self.rotor_count, "max_altitude": self.max_altitude}); return d
 
 # --- ATTELAGES ---
+@fleet_schema(Field("has_roof"))
 class Carriage(TowedVehicle):
+    __slots__ = ("has_roof",)
     def __init__(self, t_id, daily_rate, seat_count, has_roof):
         super().__init__(t_id, daily_rate, seat_count)
         self.has_roof = has_roof
     def harness_animal(self, animal):
-        if isinstance(animal, Horse) and animal.wither_height >= 140: super().harness_animal(animal)
-        else: print("❌ Seul un Cheval (>140cm) peut tirer une Calèche.")
+        if isinstance(animal, Horse) and animal.wither_height >= 140: return super().harness_animal(animal)
+        print("❌ Seul un Cheval (>140cm) peut tirer une Calèche."); return False
     def show_details(self):
         toit = "Avec toit" if self.has_roof else "Décapotable"
         att = f" avec {len(self.animals)} chevaux" if self.animals else " (vide)"
         return f"[Calèche] {self.seat_count} places, {toit} {att}"
-    def to_dict(self): d=super().to_dict(); d.update({"has_roof": self.has_roof}); return d
 
+@fleet_schema(Field("max_load_kg"))
 class Cart(TowedVehicle):
+    __slots__ = ("max_load_kg",)
     def __init__(self, t_id, daily_rate, seat_count, max_load_kg):
         super().__init__(t_id, daily_rate, seat_count)
         self.max_load_kg = max_load_kg
     def harness_animal(self, animal):
-        if isinstance(animal, Donkey): super().harness_animal(animal)
-        else: print("❌ Seul un Âne peut tirer une Charrette.")
+        if isinstance(animal, Donkey): return super().harness_animal(animal)
+        print("❌ Seul un Âne peut tirer une Charrette."); return False
     def show_details(self):
         att = f" avec {len(self.animals)} ânes" if self.animals else " (vide)"
         return f"[Charrette] {self.max_load_kg}kg max {att}"
-    def to_dict(self): d=super().to_dict(); d.update({"max_load_kg": self.max_load_kg}); return d
\ No newline at end of file
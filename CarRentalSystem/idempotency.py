@@ -0,0 +1,119 @@
+"""
+Clés d'idempotence (en-tête Idempotency-Key) des routes qui modifient.
+
+Un client qui renvoie sa requête après un délai dépassé ne doit ni créer une
+deuxième location, ni se voir répondre "déjà loué". La première exécution
+garde sa réponse (octets déjà encodés) sous la clé ; une nouvelle tentative
+avec la même clé et le même contenu la reçoit telle quelle, sans validation
+ni sauvegarde. Une tentative qui arrive pendant que la première s'exécute
+attend son résultat.
+
+Le stock est borné (nombre de clés) et les clés expirent après KEY_TTL_SECONDS.
+Les erreurs 5xx ne sont pas gardées : la tentative suivante refait le travail.
+Une réponse réussie est gardée dès que la modification est faite en mémoire,
+avant l'attente de la sauvegarde : si celle-ci échoue (503), la tentative
+suivante reçoit la réponse d'origine (la modification sera écrite avec la
+sauvegarde suivante) au lieu d'un "déjà loué".
+"""
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from starlette.exceptions import HTTPException
+from starlette.responses import Response
+
+from encoding import dumps
+
+MAX_KEYS = 10_000
+KEY_TTL_SECONDS = 24 * 3600
+
+class IdempotencyStore:
+    __slots__ = ("max_entries", "ttl", "clock", "replays", "_entries", "_pending")
+
+    def __init__(self, max_entries: int = MAX_KEYS, ttl: float = KEY_TTL_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self.replays = 0
+        # clé -> (empreinte, statut, octets, expiration), dans l'ordre d'arrivée (= d'expiration)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        # clé -> (empreinte, future du résultat) pour les requêtes en cours
+        self._pending: Dict[str, Tuple[str, asyncio.Future]] = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def fingerprint(request) -> str:
+        """Empreinte du contenu de la requête (route + paramètres), pour refuser une clé réutilisée."""
+        return hashlib.sha256(dumps(request)).hexdigest()
+
+    def _evict(self, now: float):
+        entries = self._entries
+        while entries and next(iter(entries.values()))[3] <= now:
+            entries.popitem(last=False)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    @staticmethod
+    def _response(status: int, body: bytes, replayed: bool) -> Response:
+        headers = {"Idempotent-Replayed": "true"} if replayed else None
+        return Response(body, status_code=status, media_type="application/json", headers=headers)
+
+    async def run(self, key: Optional[str], request, handler: Callable[[], Awaitable[object]],
+                  durable: Optional[Callable[[object], Awaitable[None]]] = None):
+        """
+        Exécute `handler` une seule fois par clé. Sans clé, simple appel.
+        request : ce qui identifie la requête (route, corps, paramètres).
+        durable : attente de la sauvegarde du résultat réussi, appelée une fois la réponse gardée.
+        """
+        if key is None:
+            result = await handler()
+            if durable is not None:
+                await durable(result)
+            return result
+
+        digest = self.fingerprint(request)
+        self._evict(self.clock())
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] != digest:
+                raise HTTPException(status_code=422, detail="Idempotency-Key déjà utilisée pour une autre requête")
+            self.replays += 1
+            return self._response(entry[1], entry[2], True)
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            if pending[0] != digest:
+                raise HTTPException(status_code=422, detail="Idempotency-Key déjà utilisée pour une autre requête")
+            result = await asyncio.shield(pending[1])
+            if result is None:
+                # La première tentative a échoué (5xx) : celle-ci recommence
+                return await self.run(key, request, handler, durable)
+            self.replays += 1
+            return self._response(*result, True)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = (digest, future)
+        result = None
+        try:
+            try:
+                value = await handler()
+                status, body = 200, dumps(value)
+            except HTTPException as e:
+                if e.status_code >= 500:
+                    raise
+                status, body = e.status_code, dumps({"detail": e.detail})
+            result = (status, body)
+            self._entries[key] = (digest, status, body, self.clock() + self.ttl)
+            self._evict(self.clock())
+            if status == 200 and durable is not None:
+                await durable(value)
+        finally:
+            del self._pending[key]
+            future.set_result(result)
+        return self._response(status, body, False)
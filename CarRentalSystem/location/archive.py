@@ -0,0 +1,189 @@
+"""
+Archive des locations clôturées ("froides"), hors du système en mémoire.
+
+Une partition par mois de retour : <dossier>/rentals-AAAA-MM.jsonl, une
+location (format Rental.to_dict) par ligne. Ajouter ne réécrit rien, et une
+requête sur une période n'ouvre que les mois concernés.
+Un petit index (index.json) garde les totaux de chaque mois, globaux et
+par client, pour les rapports et les historiques qui n'ont pas besoin du détail.
+"""
+import json
+import os
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+PARTITION_PREFIX = "rentals-"
+PARTITION_SUFFIX = ".jsonl"
+INDEX_FILE = "index.json"
+
+def month_key(day: date) -> str:
+    return f"{day.year:04d}-{day.month:02d}"
+
+def _add_customer(customers: Dict[str, list], record: dict):
+    # Clés en texte : celles de index.json une fois relu
+    row = customers.setdefault(str(record["customer_id"]), [0, 0.0])
+    row[0] += 1
+    row[1] += record.get("total_cost", 0.0)
+
+class RentalArchive:
+    __slots__ = ("directory", "_index")
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        # mois -> {"count", "revenue", "penalties", "last_id", "version", "customers": {id client: [nombre, montant]}}
+        self._index: Optional[Dict[str, dict]] = None
+
+    # --- Fichiers ---
+    def partition_path(self, month: str) -> str:
+        return os.path.join(self.directory, f"{PARTITION_PREFIX}{month}{PARTITION_SUFFIX}")
+
+    def _index_path(self) -> str:
+        return os.path.join(self.directory, INDEX_FILE)
+
+    @property
+    def index(self) -> Dict[str, dict]:
+        if self._index is None:
+            try:
+                with open(self._index_path(), 'r', encoding='utf-8') as f:
+                    self._index = json.load(f)
+            except FileNotFoundError:
+                self._index = {}
+        return self._index
+
+    def _write_index(self):
+        with open(self._index_path(), 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, indent=4)
+
+    def months(self) -> List[str]:
+        """Mois archivés (AAAA-MM), dans l'ordre."""
+        return sorted(self.index)
+
+    def _customers(self, month: str) -> Dict[str, list]:
+        """Totaux par client d'un mois ; un index plus ancien que ce champ est complété en relisant le mois."""
+        totals = self.index[month]
+        customers = totals.get("customers")
+        if customers is None:
+            customers = totals["customers"] = {}
+            for record in self.iter_month(month):
+                _add_customer(customers, record)
+            self._write_index()
+        return customers
+
+    # --- Écriture ---
+    def _archived_ids(self, month: str) -> set:
+        return {record["id"] for record in self.iter_month(month)}
+
+    def append(self, records: Iterable[dict]) -> int:
+        """
+        Ajoute des locations clôturées (dicts Rental.to_dict) à leur partition mensuelle.
+        Les ids déjà archivés sont ignorés : si la sauvegarde qui suit l'archivage
+        échoue, les mêmes locations seront proposées à nouveau sans être dupliquées.
+        """
+        by_month: Dict[str, List[dict]] = {}
+        for record in records:
+            by_month.setdefault(record["actual_return_date"][:7], []).append(record)
+
+        index = self.index
+        for month, batch in list(by_month.items()):
+            # Un id au-delà du dernier archivé du mois est forcément nouveau : partition lue seulement sinon
+            last_id = index.get(month, {}).get("last_id", 0)
+            if any(r.get("id", 0) <= last_id for r in batch):
+                known = self._archived_ids(month)
+                batch = [r for r in batch if r.get("id", 0) not in known]
+                if batch:
+                    by_month[month] = batch
+                else:
+                    del by_month[month]
+        if not by_month:
+            return 0
+
+        os.makedirs(self.directory, exist_ok=True)
+        for month, batch in by_month.items():
+            if month in index:
+                self._customers(month)  # Index ancien complété avant que le lot n'arrive dans la partition
+            totals = index.setdefault(month, {"count": 0, "revenue": 0.0, "penalties": 0.0, "last_id": 0,
+                                              "customers": {}})
+            with open(self.partition_path(month), 'a', encoding='utf-8') as f:
+                for record in batch:
+                    f.write(json.dumps(record, ensure_ascii=False))
+                    f.write("\n")
+
+            totals["count"] += len(batch)
+            totals["revenue"] += sum(r.get("total_cost", 0.0) for r in batch)
+            totals["penalties"] += sum(r.get("penalty", 0.0) for r in batch)
+            totals["last_id"] = max(totals["last_id"], max(r.get("id", 0) for r in batch))
+            totals["version"] = max(totals.get("version", 0), max(r.get("version", 0) for r in batch))
+            for record in batch:
+                _add_customer(totals["customers"], record)
+
+        self._write_index()
+        return sum(len(b) for b in by_month.values())
+
+    # --- Lecture (à la demande) ---
+    def iter_month(self, month: str) -> Iterator[dict]:
+        try:
+            with open(self.partition_path(month), 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+        except FileNotFoundError:
+            return
+
+    def iter_records(self, start: Optional[date] = None, end: Optional[date] = None,
+                     newest_first: bool = False, since: Optional[int] = None) -> Iterator[dict]:
+        """
+        Locations archivées dont le retour tombe dans [start, end] (mois hors
+        période jamais lus). newest_first : du mois le plus récent au plus
+        ancien, une seule partition en mémoire à la fois. since : seulement
+        les locations modifiées après cette version du système.
+        """
+        first = month_key(start) if start else None
+        last = month_key(end) if end else None
+        lo = start.isoformat() if start else None
+        hi = end.isoformat() if end else None
+
+        months = self.months()
+        for month in reversed(months) if newest_first else months:
+            if (first and month < first) or (last and month > last):
+                continue
+            if since is not None and self.index[month].get("version", 0) <= since:
+                continue
+            records = self.iter_month(month)
+            if newest_first:
+                records = sorted(records, key=lambda r: r["actual_return_date"], reverse=True)
+            for record in records:
+                returned = record["actual_return_date"]
+                if (lo and returned < lo) or (hi and returned > hi):
+                    continue
+                if since is not None and record.get("version", 0) <= since:
+                    continue
+                yield record
+
+    # --- Totaux (index seul, aucune partition lue) ---
+    def totals(self) -> dict:
+        index = self.index
+        return {
+            "count": sum(m["count"] for m in index.values()),
+            "revenue": sum(m["revenue"] for m in index.values()),
+            "penalties": sum(m["penalties"] for m in index.values()),
+        }
+
+    def count(self, month: str, customer_id: Optional[int] = None) -> int:
+        """Locations archivées d'un mois, toutes ou celles d'un client."""
+        if customer_id is None:
+            return self.index[month]["count"]
+        return self._customers(month).get(str(customer_id), (0, 0.0))[0]
+
+    def customer_totals(self, customer_id: int) -> Tuple[int, float]:
+        """(nombre, montant total) des locations archivées d'un client."""
+        key = str(customer_id)
+        count, revenue = 0, 0.0
+        for month in self.months():
+            row = self._customers(month).get(key)
+            if row is not None:
+                count += row[0]
+                revenue += row[1]
+        return count, revenue
+
+    def last_id(self) -> int:
+        return max((m["last_id"] for m in self.index.values()), default=0)
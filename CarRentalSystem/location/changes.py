@@ -0,0 +1,54 @@
+"""
+Journal des modifications : pour chaque entité (fleet, customers, rentals),
+la version du système à laquelle chaque id a changé pour la dernière fois.
+
+Sert aux exports incrémentaux (?since=<version>) : seuls les ids modifiés
+depuis sont relus. Un id journalisé mais absent des données est un élément
+supprimé.
+"""
+from typing import Dict, Iterable, Iterator, Optional
+
+import numpy as np
+
+ENTITIES = ("fleet", "customers", "rentals")
+
+class ChangeLog:
+    __slots__ = ("_stamps",)
+
+    def __init__(self):
+        self._stamps: Dict[str, Dict[int, int]] = {entity: {} for entity in ENTITIES}
+
+    def stamp(self, entity: str, ids: Iterable[int], version: int):
+        stamps = self._stamps[entity]
+        for i in ids:
+            stamps[i] = version
+
+    def version_of(self, entity: str, item_id: int) -> int:
+        """Version de la dernière modification connue (0 : jamais modifié depuis l'origine du journal)."""
+        return self._stamps[entity].get(item_id, 0)
+
+    def changed_since(self, entity: str, since: int) -> Iterator[int]:
+        """
+        Ids modifiés après la version `since`, triés, lus un à un. La sélection
+        est copiée à l'appel dans un tableau d'entiers (8 octets par id) : le
+        journal peut changer pendant la lecture.
+        """
+        stamps = self._stamps[entity]
+        ids = np.fromiter(stamps.keys(), dtype=np.int64, count=len(stamps))
+        versions = np.fromiter(stamps.values(), dtype=np.int64, count=len(stamps))
+        ids = ids[versions > since]
+        ids.sort()
+        return map(int, ids)
+
+    def pop(self, entity: str, item_id: int) -> int:
+        """Retire un id du journal (ex : location partie dans l'archive avec sa version)."""
+        return self._stamps[entity].pop(item_id, 0)
+
+    # --- Persistance (section "changes" de data.json) ---
+    def to_dict(self) -> dict:
+        # Clés en texte : JSON n'a pas de clés entières
+        return {entity: {str(i): v for i, v in stamps.items()} for entity, stamps in self._stamps.items()}
+
+    def load(self, data: Optional[dict]):
+        for entity in ENTITIES:
+            self._stamps[entity] = {int(i): v for i, v in (data or {}).get(entity, {}).items()}
@@ -0,0 +1,60 @@
+"""
+Journal des événements récents (flux GET /events de l'API).
+
+Chaque modification du système publie ses événements (véhicule ajouté,
+statut changé, location créée, retour, maintenance...) sous la version
+qu'elle a produite (CarRentalSystem.version) : c'est l'id de l'événement,
+qu'un client renvoie pour reprendre là où il s'était arrêté.
+
+Seuls les EVENT_BUFFER derniers événements sont gardés. `floor` est la
+version jusqu'à laquelle des événements peuvent manquer (oubliés, ou
+antérieurs au chargement) : un client resté en deçà doit tout relire.
+"""
+from collections import deque
+from typing import Callable, List, Optional, Tuple
+
+EVENT_BUFFER = 2048
+
+Event = Tuple[int, str, dict]  # (version, type, données)
+
+class EventLog:
+    __slots__ = ("capacity", "floor", "recording", "_events", "_listeners")
+
+    def __init__(self, capacity: int = EVENT_BUFFER):
+        self.capacity = capacity
+        self.floor = 0
+        self.recording = True  # False pendant le chargement : rien ne s'est "passé"
+        self._events: "deque[Event]" = deque()
+        self._listeners: List[Callable[[], None]] = []
+
+    def __len__(self):
+        return len(self._events)
+
+    def record(self, version: int, kind: str, data: dict):
+        if not self.recording:
+            return
+        self._events.append((version, kind, data))
+        if len(self._events) > self.capacity:
+            self.floor = self._events.popleft()[0]
+        for listener in self._listeners:
+            listener()
+
+    def after(self, version: int) -> Optional[List[Event]]:
+        """Événements de version > `version`, dans l'ordre ; None si certains ne sont plus connus."""
+        if version < self.floor:
+            return None
+        recent = []
+        for event in reversed(self._events):
+            if event[0] <= version:
+                break
+            recent.append(event)
+        recent.reverse()
+        return recent
+
+    # --- Abonnés (appelés à chaque événement, sans argument) ---
+    def subscribe(self, listener: Callable[[], None]):
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[], None]):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
@@ -0,0 +1,162 @@
+"""
+Accès à l'historique des locations (mémoire + archive mensuelle).
+
+Les vues en liste reçoivent des lignes résumées (RentalSummary) produites au
+fil de la lecture ; un objet Rental complet n'est reconstruit qu'à la
+demande, et seuls les derniers consultés sont gardés (LRU borné).
+"""
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Iterator, List, Optional, Tuple
+
+from .rental import Rental, parse_iso_date
+from .invoices import vehicle_label
+
+HISTORY_CACHE_SIZE = 256
+
+class RentalSummary:
+    """Ligne légère pour les listes d'historique."""
+    __slots__ = ("id", "customer_id", "vehicle_id", "vehicle_label", "start_date", "end_date",
+                 "actual_return_date", "total_cost", "penalty", "month")
+
+    def __init__(self, rental_id, customer_id, vehicle_id, label, start_date, end_date,
+                 actual_return_date, total_cost, penalty, month=None):
+        self.id = rental_id
+        self.customer_id = customer_id
+        self.vehicle_id = vehicle_id
+        self.vehicle_label = label
+        self.start_date = start_date
+        self.end_date = end_date
+        self.actual_return_date = actual_return_date
+        self.total_cost = total_cost
+        self.penalty = penalty
+        self.month = month  # Partition d'archive (None : location encore en mémoire)
+
+class RentalHistoryRepository:
+    __slots__ = ("system", "capacity", "_cache")
+
+    def __init__(self, system, capacity: int = HISTORY_CACHE_SIZE):
+        self.system = system
+        self.capacity = capacity
+        self._cache: "OrderedDict[int, Rental]" = OrderedDict()
+
+    # --- Lignes résumées ---
+    def _label(self, vehicle_id: int) -> str:
+        vehicle = self.system.find_vehicle(vehicle_id)
+        return vehicle_label(vehicle) if vehicle is not None else f"Véhicule #{vehicle_id} (retiré)"
+
+    def _summary_of_record(self, record: dict) -> RentalSummary:
+        returned = record["actual_return_date"]
+        return RentalSummary(
+            record["id"], record["customer_id"], record["vehicle_id"], self._label(record["vehicle_id"]),
+            parse_iso_date(record["start_date"]), parse_iso_date(record["end_date"]), parse_iso_date(returned),
+            record.get("total_cost", 0.0), record.get("penalty", 0.0), returned[:7],
+        )
+
+    @staticmethod
+    def _summary_of_rental(r: Rental) -> RentalSummary:
+        return RentalSummary(r.id, r.customer.id, r.vehicle.id, vehicle_label(r.vehicle), r.start_date, r.end_date,
+                             r.actual_return_date, r.total_cost, r.penalty)
+
+    def iter_summaries(self, customer_id: Optional[int] = None, start: Optional[date] = None,
+                       end: Optional[date] = None, skip: int = 0) -> Iterator[RentalSummary]:
+        """
+        Locations clôturées, des plus récentes aux plus anciennes (archive lue mois par mois).
+        skip : lignes à sauter ; sans période, les mois d'archive sautés en entier
+        (comptes de l'index) ne sont pas lus.
+        """
+        live = sorted((r for r in self.system.rentals if not r.is_active and r.actual_return_date is not None),
+                      key=lambda r: r.actual_return_date, reverse=True)
+        for r in live:
+            if customer_id is not None and r.customer.id != customer_id:
+                continue
+            if (start and r.actual_return_date < start) or (end and r.actual_return_date > end):
+                continue
+            if skip:
+                skip -= 1
+                continue
+            yield self._summary_of_rental(r)
+
+        archive = self.system.archive
+        if archive is None:
+            return
+        if skip and start is None and end is None:
+            for month in reversed(archive.months()):
+                n = archive.count(month, customer_id)
+                if skip < n:
+                    break
+                skip -= n
+                # Mois sauté : la lecture s'arrêtera au dernier jour du mois précédent
+                end = date(int(month[:4]), int(month[5:]), 1) - timedelta(days=1)
+        for record in archive.iter_records(start, end, newest_first=True):
+            if customer_id is None or record["customer_id"] == customer_id:
+                if skip:
+                    skip -= 1
+                    continue
+                yield self._summary_of_record(record)
+
+    def page(self, customer_id: Optional[int] = None, page: int = 1, page_size: int = 20) -> Tuple[List[RentalSummary], bool]:
+        """
+        Une page de résumés + "il en reste". Seuls les mois d'archive qui
+        contiennent la page sont lus (les plus récents sont sautés d'après l'index).
+        """
+        rows: List[RentalSummary] = []
+        for row in self.iter_summaries(customer_id, skip=(page - 1) * page_size):
+            if len(rows) == page_size:
+                return rows, True
+            rows.append(row)
+        return rows, False
+
+    def totals(self, customer_id: Optional[int] = None) -> Tuple[int, float]:
+        """(nombre, montant total) des locations clôturées : mémoire + index de l'archive (aucune partition lue)."""
+        count, spent = 0, 0.0
+        for r in self.system.rentals:
+            if not r.is_active and (customer_id is None or r.customer.id == customer_id):
+                count += 1
+                spent += r.total_cost
+        archive = self.system.archive
+        if archive is not None:
+            if customer_id is None:
+                t = archive.totals()
+                return count + t["count"], spent + t["revenue"]
+            archived, archived_spent = archive.customer_totals(customer_id)
+            count += archived
+            spent += archived_spent
+        return count, spent
+
+    # --- Objets Rental complets (à la demande) ---
+    def get(self, summary: RentalSummary) -> Optional[Rental]:
+        """Rental complète d'une ligne (mémoire, cache LRU, ou relue dans sa seule partition)."""
+        if summary.month is None:
+            return next((r for r in self.system.rentals if r.id == summary.id), None)
+
+        rental = self._cache.get(summary.id)
+        if rental is not None:
+            self._cache.move_to_end(summary.id)
+            return rental
+
+        record = next((rec for rec in self.system.archive.iter_month(summary.month) if rec["id"] == summary.id), None)
+        if record is None:
+            return None
+        customer = self.system.find_customer(record["customer_id"])
+        vehicle = self.system.find_vehicle(record["vehicle_id"])
+        if customer is None or vehicle is None:
+            return None
+
+        rental = Rental.restore(
+            customer, vehicle,
+            summary.start_date, summary.end_date,
+            rental_id=record["id"],
+            is_active=False,
+            actual_return_date=summary.actual_return_date,
+            total_cost=summary.total_cost,
+            penalty=summary.penalty,
+        )
+        self._cache[summary.id] = rental
+        if len(self._cache) > self.capacity:
+            self._cache.popitem(last=False)
+        return rental
+
+    def __len__(self):
+        """Nombre de Rental hydratées actuellement gardées en cache."""
+        return len(self._cache)
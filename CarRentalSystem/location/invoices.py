@@ -0,0 +1,147 @@
+"""
+Factures : rendu (fonction pure) et export groupé.
+
+Le rendu prend un "relevé" (tuple de valeurs simples) plutôt qu'une Rental :
+il peut ainsi être mis en cache par location et exécuté dans d'autres
+processus sans y envoyer les objets client / véhicule.
+"""
+import os
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# En dessous, lancer des processus coûte plus cher que le rendu lui-même
+MIN_PARALLEL_INVOICES = 2_000
+
+def vehicle_label(vehicle) -> str:
+    return f"{getattr(vehicle, 'brand', getattr(vehicle, 'name', 'Véhicule'))} {getattr(vehicle, 'model', getattr(vehicle, 'breed', ''))}"
+
+def invoice_record(rental) -> tuple:
+    """Tout ce qu'affiche la facture d'une location clôturée."""
+    return (
+        rental.id, rental.customer.last_name, rental.customer.first_name, vehicle_label(rental.vehicle),
+        rental.start_date, rental.actual_return_date, rental.vehicle.daily_rate, rental.penalty, rental.total_cost,
+    )
+
+def archived_invoice_record(record: dict, customer, vehicle) -> tuple:
+    """
+    Même relevé pour une location archivée (dict de l'archive). Client ou
+    véhicule retirés depuis : la facture reste exportée, avec ce que garde l'archive.
+    """
+    start, returned = date.fromisoformat(record["start_date"]), date.fromisoformat(record["actual_return_date"])
+    total_cost, penalty = record.get("total_cost", 0.0), record.get("penalty", 0.0)
+    if vehicle is not None:
+        label, daily_rate = vehicle_label(vehicle), vehicle.daily_rate
+    else:
+        label = f"Véhicule #{record['vehicle_id']} (retiré)"
+        daily_rate = round((total_cost - penalty) / max(1, (returned - start).days), 2)
+    last_name, first_name = (customer.last_name, customer.first_name) if customer is not None \
+        else (f"Client #{record['customer_id']}", "")
+    return (record["id"], last_name, first_name, label, start, returned, daily_rate, penalty, total_cost)
+
+def render_invoice(record: tuple) -> str:
+    """Génère une facture détaillée sous forme de texte."""
+    rental_id, last_name, first_name, label, start, returned, daily_rate, penalty, total_cost = record
+    days_base = max(1, (returned - start).days)
+    base_cost = total_cost - penalty
+    penalty_line = f"PÉNALITÉ RETARD  : +{penalty:.2f} €\n" if penalty > 0 else ""
+
+    return (
+        "========================================\n"
+        f"       FACTURE FINALE #{rental_id:04d}\n"
+        "========================================\n"
+        f"CLIENT   : {last_name} {first_name}\n"
+        f"VÉHICULE : {label}\n"
+        "----------------------------------------\n"
+        f"Début    : {start}\n"
+        f"Fin      : {returned}\n"
+        f"Durée    : {days_base} jours\n"
+        "----------------------------------------\n"
+        f"Tarif journalier : {daily_rate} €\n"
+        f"Sous-total       : {base_cost:.2f} €\n"
+        f"{penalty_line}"
+        "========================================\n"
+        f"TOTAL À PAYER    : {total_cost:.2f} €\n"
+        "========================================\n"
+    )
+
+def _render_chunk(records: List[tuple]) -> List[str]:
+    return [render_invoice(r) for r in records]
+
+# ==========================================
+# EXPORT GROUPÉ
+# ==========================================
+
+def closed_in_period(rentals: Iterable, start: Optional[date] = None, end: Optional[date] = None) -> Iterator:
+    """Locations clôturées dont le retour tombe dans [start, end]."""
+    for r in rentals:
+        if r.is_active or r.actual_return_date is None:
+            continue
+        if start and r.actual_return_date < start:
+            continue
+        if end and r.actual_return_date > end:
+            continue
+        yield r
+
+def _chunks(records: Iterable[tuple], size: int) -> Iterator[List[tuple]]:
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def render_many(records: Iterable[tuple], workers: Optional[int] = None, chunk_size: int = 500,
+                parallel: bool = True) -> Iterator[Tuple[int, str]]:
+    """
+    (id, texte) de chaque facture, dans l'ordre. En parallèle, au plus
+    2 paquets par processus sont en cours : la mémoire reste bornée.
+    """
+    workers = workers or os.cpu_count() or 1
+    if not parallel or workers == 1:
+        for record in records:
+            yield record[0], render_invoice(record)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in _chunks(records, chunk_size):
+            pending.append(([r[0] for r in chunk], pool.submit(_render_chunk, chunk)))
+            if len(pending) >= 2 * workers:
+                ids, future = pending.popleft()
+                yield from zip(ids, future.result())
+        while pending:
+            ids, future = pending.popleft()
+            yield from zip(ids, future.result())
+
+def export_invoices(rentals: Iterable, path: str, start: Optional[date] = None, end: Optional[date] = None,
+                    workers: Optional[int] = None, archived: Iterable[tuple] = ()) -> int:
+    """
+    Écrit les factures de la période dans `path` : une entrée par facture
+    si c'est un .zip, sinon un seul fichier texte. Renvoie le nombre exporté.
+    archived : relevés des locations de la période déjà sorties de la mémoire
+    (CarRentalSystem.archived_invoice_records), écrits avant ceux de `rentals`.
+    """
+    # Tout reste paresseux : relevés et textes sont produits au fil de l'écriture
+    parallel = len(rentals) >= MIN_PARALLEL_INVOICES if hasattr(rentals, "__len__") else True
+    records = chain(archived, (invoice_record(r) for r in closed_in_period(rentals, start, end)))
+    invoices = render_many(records, workers, parallel=parallel)
+
+    count = 0
+    if path.endswith(".zip"):
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for rental_id, text in invoices:
+                archive.writestr(f"facture_{rental_id:04d}.txt", text)
+                count += 1
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            for rental_id, text in invoices:
+                f.write(text)
+                f.write("\n")
+                count += 1
+    return count
@@ -0,0 +1,170 @@
+"""
+Grand livre du chiffre d'affaires : une table jours x classes de la flotte.
+
+Chaque clôture ajoute son montant, sa pénalité et 1 location à la case
+(jour de retour, classe). Les sommes cumulées par jour sont tenues à jour
+à la demande (seulement depuis le premier jour modifié) : le total d'une
+période quelconque, filtré ou non par classe, est alors une simple
+différence de deux lignes, quel que soit le nombre de locations.
+"""
+import os
+from datetime import date
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from fleet.registry import FLEET_CLASSES, CLASS_CODES, class_code
+
+# Colonnes de la 3e dimension
+REVENUE, PENALTIES, COUNT = 0, 1, 2
+GROWTH_DAYS = 366  # Marge ajoutée à chaque extension de la table
+
+class RevenueLedger:
+    __slots__ = ("_origin", "_size", "_daily", "_cum", "_dirty_from")
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._origin = 0           # Ordinal du jour d'index 0
+        self._size = 0             # Jours couverts (le reste de la table est de la marge)
+        self._daily = np.zeros((0, len(FLEET_CLASSES), 3))
+        self._cum = np.zeros((1, len(FLEET_CLASSES), 3))  # _cum[i] = somme des jours [0, i[
+        self._dirty_from: Optional[int] = None
+
+    # --- Table ---
+    def _ensure_days(self, first: int, last: int):
+        """Garantit que la table couvre les ordinaux [first, last]."""
+        if self._size == 0:
+            self._origin = first
+        elif first >= self._origin and last < self._origin + self._size:
+            return
+
+        origin = min(first, self._origin)
+        size = max(last, self._origin + self._size - 1) - origin + 1
+        if first >= self._origin and size <= len(self._daily):
+            self._size = size
+            return
+
+        # Réallocation avec marge : les jours suivants s'ajoutent sans recopie
+        shift = self._origin - origin
+        daily = np.zeros((size + GROWTH_DAYS, len(FLEET_CLASSES), 3))
+        daily[shift:shift + self._size] = self._daily[:self._size]
+        self._origin, self._size, self._daily = origin, size, daily
+        self._dirty_from = 0
+
+    def _mark(self, first_index: int):
+        if self._dirty_from is None or first_index < self._dirty_from:
+            self._dirty_from = first_index
+
+    def _refresh(self):
+        """Recalcule les sommes cumulées à partir du premier jour modifié."""
+        if self._dirty_from is None and len(self._cum) == self._size + 1:
+            return
+        start = min(self._dirty_from if self._dirty_from is not None else self._size, len(self._cum) - 1)
+        if len(self._cum) != self._size + 1:
+            cum = np.zeros((self._size + 1, len(FLEET_CLASSES), 3))
+            cum[:start + 1] = self._cum[:start + 1]
+            self._cum = cum
+        self._cum[start + 1:] = self._cum[start] + np.cumsum(self._daily[start:self._size], axis=0)
+        self._dirty_from = None
+
+    # --- Enregistrement ---
+    def record(self, vehicle, day: date, revenue: float, penalty: float = 0.0, count: int = 1):
+        """Ajoute une location clôturée (jour de retour, montant total, pénalité)."""
+        ordinal = day.toordinal()
+        self._ensure_days(ordinal, ordinal)
+        i = ordinal - self._origin
+        row = self._daily[i, class_code(vehicle)]
+        row[REVENUE] += revenue
+        row[PENALTIES] += penalty
+        row[COUNT] += count
+        self._mark(i)
+
+    def remove(self, vehicle, day: date, revenue: float, penalty: float = 0.0):
+        """Retire une clôture déjà enregistrée (location clôturée une seconde fois)."""
+        self.record(vehicle, day, -revenue, -penalty, count=-1)
+
+    def record_many(self, codes, days, revenues, penalties):
+        """Même chose pour des tableaux (codes de classe, ordinaux de retour, montants, pénalités)."""
+        codes = np.asarray(codes, dtype=np.int64)
+        days = np.asarray(days, dtype=np.int64)
+        if len(days) == 0:
+            return
+        self._ensure_days(int(days.min()), int(days.max()))
+        rows = days - self._origin
+        values = np.column_stack((np.asarray(revenues, dtype=np.float64),
+                                  np.asarray(penalties, dtype=np.float64),
+                                  np.ones(len(days))))
+        np.add.at(self._daily, (rows, codes), values)
+        self._mark(int(rows.min()))
+
+    # --- Requêtes (temps constant) ---
+    def _range(self, start: Optional[date], end: Optional[date]) -> np.ndarray:
+        """Totaux (classes x 3) des jours de retour dans [start, end]."""
+        self._refresh()
+        lo = 0 if start is None else start.toordinal() - self._origin
+        hi = self._size if end is None else end.toordinal() - self._origin + 1
+        lo, hi = max(0, lo), min(self._size, hi)
+        if hi <= lo:
+            return np.zeros((len(FLEET_CLASSES), 3))
+        return self._cum[hi] - self._cum[lo]
+
+    def query(self, start: Optional[date] = None, end: Optional[date] = None,
+              classes: Optional[Iterable[type]] = None) -> dict:
+        """CA, pénalités et nombre de locations sur [start, end], éventuellement pour certaines classes."""
+        totals = self._range(start, end)
+        if classes is not None:
+            totals = totals[[CLASS_CODES[cls] for cls in classes]]
+        revenue, penalties, count = totals.sum(axis=0).tolist()
+        return {"revenue": revenue, "penalties": penalties, "count": int(round(count))}
+
+    def by_class(self, start: Optional[date] = None, end: Optional[date] = None) -> Dict[str, dict]:
+        """Même chose, détaillé par classe (seulement les classes ayant au moins une location)."""
+        totals = self._range(start, end).tolist()
+        return {
+            cls.__name__: {"revenue": row[REVENUE], "penalties": row[PENALTIES], "count": int(round(row[COUNT]))}
+            for cls, row in zip(FLEET_CLASSES, totals) if row[COUNT]
+        }
+
+    # --- Persistance ---
+    def state(self) -> tuple:
+        """Copie (origine, table) : peut être écrite ailleurs pendant que le grand livre continue."""
+        return self._origin, self._daily[:self._size].copy()
+
+    @staticmethod
+    def write(path: str, state: tuple, version: int = 0):
+        """
+        Écrit la table avec la version de l'état sauvegardé (celle de data.json).
+        Fichier temporaire puis remplacement, comme data.json.
+        """
+        origin, daily = state
+        tmp = path + ".tmp"
+        with open(tmp, 'wb') as f:
+            np.savez(f, origin=origin, daily=daily, version=version)
+        os.replace(tmp, path)
+
+    def save(self, path: str, version: int = 0):
+        self.write(path, (self._origin, self._daily[:self._size]), version)
+
+    def load(self, path: str, version: Optional[int] = None) -> bool:
+        """
+        Remplace le contenu par celui du fichier. False si absent, illisible
+        ou d'une autre version que celle attendue (arrêt entre les deux écritures).
+        """
+        try:
+            with np.load(path) as data:
+                daily, origin = data["daily"], int(data["origin"])
+                saved = int(data["version"]) if "version" in data.files else None
+        except (OSError, KeyError, ValueError):
+            return False
+        if daily.shape[1:] != (len(FLEET_CLASSES), 3):
+            return False
+        if version is not None and saved != version:
+            return False
+
+        self.clear()
+        self._origin, self._size = origin, len(daily)
+        self._daily = np.concatenate((daily, np.zeros((GROWTH_DAYS, len(FLEET_CLASSES), 3))))
+        self._dirty_from = 0
+        return True
@@ -0,0 +1,212 @@
+"""
+Moteur de tarification.
+
+Un prix = tarif journalier x jours pondérés par la saison x remise longue durée
+x majoration de classe. Les règles sont interchangeables ; chaque changement
+incrémente `version` et invalide le cache des devis.
+
+Sans règle ajoutée, le moteur redonne exactement l'ancien calcul :
+max(1, jours) x tarif, et 10% du tarif par jour de retard.
+"""
+from bisect import bisect_right
+from datetime import date
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from fleet.registry import FLEET_CLASSES, CLASS_CODES, class_code
+
+PENALTY_RATE = 0.10  # Pénalité de retard : 10% du tarif journalier par jour de retard
+MAX_CACHED_QUOTES = 65_536  # Au-delà, le cache des devis repart de zéro
+
+# ==========================================
+# RÈGLES
+# ==========================================
+
+class SeasonalMultiplier:
+    """Multiplicateur appliqué aux jours de certains mois (ex : été x1.2), chaque année."""
+    __slots__ = ("months", "multiplier")
+
+    def __init__(self, months: Iterable[int], multiplier: float):
+        self.months = frozenset(months)
+        self.multiplier = multiplier
+
+class LongRentalDiscount:
+    """Remise à partir d'une durée minimale (la meilleure remise applicable l'emporte)."""
+    __slots__ = ("min_days", "discount")
+
+    def __init__(self, min_days: int, discount: float):
+        self.min_days = min_days
+        self.discount = discount
+
+class ClassSurcharge:
+    """Majoration (ou minoration) du prix pour certaines classes de la flotte."""
+    __slots__ = ("factors",)
+
+    def __init__(self, factors: Dict[type, float]):
+        self.factors = dict(factors)
+
+class PenaltyPolicy:
+    """Pénalité de retard : `rate` x tarif journalier par jour au-delà de la tolérance."""
+    __slots__ = ("rate", "grace_days")
+
+    def __init__(self, rate: float = PENALTY_RATE, grace_days: int = 0):
+        self.rate = rate
+        self.grace_days = grace_days
+
+# ==========================================
+# MOTEUR
+# ==========================================
+
+class PricingEngine:
+    __slots__ = ("version", "penalty_policy", "_seasons", "_discounts", "_surcharges",
+                 "_class_factors", "_month_factors", "_tiers", "_origin", "_prefix", "_quotes",
+                 "_class_list", "_tier_list")
+
+    def __init__(self):
+        self.version = 0
+        self.penalty_policy = PenaltyPolicy()
+        self._seasons = []
+        self._discounts = []
+        self._surcharges = []
+        self._quotes: Dict[tuple, float] = {}
+        self._rebuild()
+
+    # --- Gestion des règles ---
+    def add_rule(self, rule):
+        if isinstance(rule, SeasonalMultiplier):
+            self._seasons.append(rule)
+        elif isinstance(rule, LongRentalDiscount):
+            self._discounts.append(rule)
+        elif isinstance(rule, ClassSurcharge):
+            self._surcharges.append(rule)
+        elif isinstance(rule, PenaltyPolicy):
+            self.penalty_policy = rule
+        else:
+            raise TypeError(f"Règle de tarification inconnue : {type(rule).__name__}")
+        self._rebuild()
+
+    def clear_rules(self):
+        self._seasons, self._discounts, self._surcharges = [], [], []
+        self.penalty_policy = PenaltyPolicy()
+        self._rebuild()
+
+    def _rebuild(self):
+        """Recalcule les tables dérivées des règles et invalide les devis en cache."""
+        self.version += 1
+        self._quotes.clear()
+
+        months = np.ones(13)  # index 1..12
+        for season in self._seasons:
+            for m in season.months:
+                months[m] *= season.multiplier
+        self._month_factors = months
+
+        factors = np.ones(len(FLEET_CLASSES))
+        for surcharge in self._surcharges:
+            for cls, factor in surcharge.factors.items():
+                factors[CLASS_CODES[cls]] *= factor
+        self._class_factors = factors
+        self._class_list = factors.tolist()
+
+        tiers = sorted((d.min_days, d.discount) for d in self._discounts)
+        # Remise applicable pour une durée = meilleure remise parmi les paliers atteints
+        best = np.maximum.accumulate([0.0] + [t[1] for t in tiers])
+        self._tiers = (np.array([t[0] for t in tiers], dtype=np.int64), best)
+        self._tier_list = ([t[0] for t in tiers], best.tolist())
+
+        # Sommes préfixes des multiplicateurs jour par jour, construites à la demande
+        self._origin = 0
+        self._prefix = np.zeros(1)
+
+    # --- Jours pondérés par la saison (sommes préfixes) ---
+    def _ensure_days(self, first: int, last: int):
+        """Garantit que la table couvre les jours [first, last[ (ordinaux)."""
+        origin, size = self._origin, len(self._prefix) - 1
+        if size and origin <= first and last <= origin + size:
+            return
+        if size:
+            first, last = min(first, origin), max(last, origin + size - 1)
+        # Marge d'un an de chaque côté : les fenêtres voisines ne reconstruisent pas la table
+        first, last = first - 366, last + 366
+        months = np.array([date.fromordinal(o).month for o in range(first, last + 1)])
+        self._origin = first
+        self._prefix = np.concatenate(([0.0], np.cumsum(self._month_factors[months])))
+
+    def _weighted_days(self, starts: np.ndarray, days: np.ndarray) -> np.ndarray:
+        if len(self._seasons) == 0 or len(starts) == 0:
+            return days.astype(np.float64)
+        self._ensure_days(int(starts.min()), int((starts + days).max()))
+        lo = starts - self._origin
+        return self._prefix[lo + days] - self._prefix[lo]
+
+    def _discount_factor(self, days: np.ndarray) -> np.ndarray:
+        thresholds, best = self._tiers
+        if len(thresholds) == 0:
+            return np.ones(np.shape(days))
+        return 1.0 - best[np.searchsorted(thresholds, days, side="right")]
+
+    # --- Calcul vectoriel ---
+    def price(self, codes, rates, starts, days) -> np.ndarray:
+        """
+        Prix pour des tableaux (diffusables) de codes de classe, tarifs,
+        ordinaux de début et durées en jours (au moins 1).
+        """
+        codes, rates = np.asarray(codes, dtype=np.int64), np.asarray(rates, dtype=np.float64)
+        starts, days = np.broadcast_arrays(np.asarray(starts, dtype=np.int64), np.asarray(days, dtype=np.int64))
+        weighted = self._weighted_days(starts.ravel(), days.ravel()).reshape(days.shape)
+        return rates * self._class_factors[codes] * weighted * self._discount_factor(days)
+
+    def penalties(self, rates, ends, returned) -> Tuple[np.ndarray, np.ndarray]:
+        """(pénalités, jours de retard) pour des tableaux de tarifs et d'ordinaux."""
+        late = np.maximum(0, np.asarray(returned) - np.asarray(ends) - self.penalty_policy.grace_days)
+        return late * np.asarray(rates, dtype=np.float64) * self.penalty_policy.rate, late
+
+    # --- Devis ---
+    def quote(self, vehicle, start: date, end: date) -> float:
+        """Prix d'une location prévue (mis en cache par classe, tarif, période et version des règles)."""
+        code = class_code(vehicle)
+        key = (code, vehicle.daily_rate, start, end, self.version)
+        cached = self._quotes.get(key)
+        if cached is None:
+            if len(self._quotes) >= MAX_CACHED_QUOTES:
+                self._quotes.clear()
+            cached = self._quotes[key] = self._price_one(code, vehicle.daily_rate, start.toordinal(), end.toordinal())
+        return cached
+
+    def _price_one(self, code: int, rate: float, start: int, end: int) -> float:
+        """Même calcul que price() pour un seul devis, sans passer par des tableaux."""
+        days = max(1, end - start)
+        weighted = days
+        if self._seasons:
+            self._ensure_days(start, start + days)
+            lo = start - self._origin
+            weighted = float(self._prefix[lo + days] - self._prefix[lo])
+        thresholds, best = self._tier_list
+        return rate * self._class_list[code] * weighted * (1.0 - best[bisect_right(thresholds, days)])
+
+    def quote_many(self, vehicles: Sequence, windows: Sequence[Tuple[date, date]]) -> np.ndarray:
+        """
+        Devis de chaque véhicule pour chaque période, en un seul calcul :
+        tableau (len(vehicles), len(windows)). Les véhicules de même classe
+        et même tarif partagent une seule ligne de calcul.
+        """
+        rows: Dict[tuple, int] = {}
+        row_of = np.fromiter((rows.setdefault((class_code(v), v.daily_rate), len(rows)) for v in vehicles),
+                             dtype=np.int64, count=len(vehicles))
+        codes = np.array([k[0] for k in rows], dtype=np.int64)
+        rates = np.array([k[1] for k in rows], dtype=np.float64)
+
+        starts = np.array([s.toordinal() for s, _ in windows], dtype=np.int64)
+        days = np.maximum(1, np.array([e.toordinal() for _, e in windows], dtype=np.int64) - starts)
+
+        unique = self.price(codes[:, None], rates[:, None], starts[None, :], days[None, :])
+        return unique[row_of]
+
+    def penalty(self, vehicle, end: date, returned: date) -> Tuple[float, int]:
+        """(pénalité, jours de retard) d'un retour."""
+        late = max(0, returned.toordinal() - end.toordinal() - self.penalty_policy.grace_days)
+        return late * vehicle.daily_rate * self.penalty_policy.rate, late
+
+# Moteur partagé par les locations, le système et les interfaces
+PRICING = PricingEngine()
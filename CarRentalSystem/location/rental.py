@@ -1,37 +1,75 @@
 from datetime import date, timedelta, datetime
+from functools import lru_cache
 from fleet.transport_base import TransportMode, MotorizedVehicle, TransportAnimal
 from clients.customer import Customer
 from fleet.enums import VehicleStatus
+from .pricing import PRICING
+from .invoices import invoice_record, render_invoice
 
-from datetime import datetime
+@lru_cache(maxsize=4096)
+def parse_iso_date(value: str) -> date:
+    """AAAA-MM-JJ -> date. Mis en cache : un historique réutilise sans cesse les mêmes jours."""
+    return date.fromisoformat(value)
+
+def as_date(value, error="Format de date invalide. Utilisez AAAA-MM-JJ") -> date:
+    """Accepte une date, un datetime ou une chaîne ISO."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return parse_iso_date(value)
+    except (TypeError, ValueError):
+        raise ValueError(error)
 
 class Rental:
-    def __init__(self, customer, vehicle, start_date_str, end_date_str, from_history=False):
+    __slots__ = ("id", "customer", "vehicle", "from_history", "start_date", "end_date", "actual_return_date", "total_cost", "penalty", "is_active", "_invoice")
+
+    def __init__(self, customer, vehicle, start_date, end_date, from_history=False):
         self.id = 0
         self.customer = customer
         self.vehicle = vehicle
         self.from_history = from_history
 
-        try:
-            self.start_date = datetime.strptime(start_date_str, "%Y-%m-%d")
-            self.end_date = datetime.strptime(end_date_str, "%Y-%m-%d")
-        except ValueError:
-            raise ValueError("Format de date invalide. Utilisez AAAA-MM-JJ")
+        self.start_date = as_date(start_date)
+        self.end_date = as_date(end_date)
         
         self.actual_return_date = None
         self.total_cost = 0.0
         self.penalty = 0.0
         self.is_active = False
+        self._invoice = None  # (relevé, texte) de la dernière facture rendue
 
         self._validate_rental()
         
         self.is_active = True
         self.vehicle.status = VehicleStatus.RENTED
 
+    @classmethod
+    def restore(cls, customer, vehicle, start_date: date, end_date: date, rental_id=0, is_active=False,
+                actual_return_date=None, total_cost=0.0, penalty=0.0):
+        """
+        Recrée une location de l'historique telle qu'elle a été sauvegardée :
+        dates déjà converties, pas de validation ni de changement de statut du véhicule.
+        """
+        rental = cls.__new__(cls)
+        rental.id = rental_id
+        rental.customer = customer
+        rental.vehicle = vehicle
+        rental.from_history = True
+        rental.start_date = start_date
+        rental.end_date = end_date
+        rental.actual_return_date = actual_return_date
+        rental.total_cost = total_cost
+        rental.penalty = penalty
+        rental.is_active = is_active
+        rental._invoice = None
+        return rental
+
     def _validate_rental(self):
 
         if self.start_date > self.end_date:
-            raise ValueError(f"Erreur: La date de fin ({self.end_date.date()}) est avant le début.")
+            raise ValueError(f"Erreur: La date de fin ({self.end_date}) est avant le début.")
         
         if not self.from_history and not self.vehicle.is_available:
             nom = getattr(self.vehicle, 'brand', getattr(self.vehicle, 'name', 'Véhicule'))
@@ -40,27 +78,19 @@ class Rental:
         
     def calculate_cost(self):
         """Calcule le coût théorique (avant retour réel)."""
-        duration = (self.end_date - self.start_date).days
-        days = max(1, duration)
-        
-        return days * self.vehicle.daily_rate
+        return PRICING.quote(self.vehicle, self.start_date, self.end_date)
     
-    def close_rental(self, return_date_str):
-        """Clôture la location et calcule le prix final."""
-        try:
-            self.actual_return_date = datetime.strptime(return_date_str, "%Y-%m-%d")
-        except ValueError:
-            raise ValueError("Date retour invalide.")
+    def close_rental(self, return_date):
+        """
+        Clôture la location et calcule le prix final.
+        Le grand livre n'est pas alimenté ici : passer par CarRentalSystem.close_rental.
+        """
+        self.actual_return_date = as_date(return_date, "Date retour invalide.")
         
-        delta_reel = (self.actual_return_date - self.start_date).days
-        cout_base = max(1, delta_reel) * self.vehicle.daily_rate
-        self.penalty = 0.0
+        cout_base = PRICING.quote(self.vehicle, self.start_date, self.actual_return_date)
+        self.penalty, jours_retard = PRICING.penalty(self.vehicle, self.end_date, self.actual_return_date)
 
-        cout_base = max(1, delta_reel) * self.vehicle.daily_rate
-
-        if self.actual_return_date > self.end_date:
-            jours_retard = (self.actual_return_date - self.end_date).days
-            self.penalty = (jours_retard * self.vehicle.daily_rate) * 0.10
+        if jours_retard:
             print(f"⚠️ Retard de {jours_retard} jours. Pénalité: {self.penalty}€")
         
         self.total_cost = cout_base + self.penalty
@@ -76,10 +106,12 @@ class Rental:
             "id": getattr(self, 'id', 0),
             "customer_id": self.customer.id, 
             "vehicle_id": self.vehicle.id,
-            "start_date": self.start_date.strftime("%Y-%m-%d"),
-            "end_date": self.end_date.strftime("%Y-%m-%d"),
+            "start_date": self.start_date.isoformat(),
+            "end_date": self.end_date.isoformat(),
+            "actual_return_date": self.actual_return_date.isoformat() if self.actual_return_date else None,
             "is_active": self.is_active, 
-            "total_cost": self.total_cost
+            "total_cost": self.total_cost,
+            "penalty": self.penalty
         }
 
     def generate_invoice(self):
@@ -87,27 +119,8 @@ class Rental:
         if self.is_active:
             return "❌ La location est encore en cours. Impossible de générer la facture finale."
 
-        days_base = max(1, (self.actual_return_date - self.start_date).days)
-        base_cost = days_base * self.vehicle.daily_rate
-
-        invoice =  "========================================\n"
-        invoice += f"       FACTURE FINALE #{self.id:04d}\n"
-        invoice += "========================================\n"
-        invoice += f"CLIENT   : {self.customer.last_name} {self.customer.first_name}\n"
-        invoice += f"VÉHICULE : {getattr(self.vehicle, 'brand', getattr(self.vehicle, 'name', 'Véhicule'))} {getattr(self.vehicle, 'model', getattr(self.vehicle, 'breed', ''))}\n"
-        invoice += "----------------------------------------\n"
-        invoice += f"Début    : {self.start_date.date()}\n"
-        invoice += f"Fin      : {self.actual_return_date.date()}\n"
-        invoice += f"Durée    : {days_base} jours\n"
-        invoice += "----------------------------------------\n"
-        invoice += f"Tarif journalier : {self.vehicle.daily_rate} €\n"
-        invoice += f"Sous-total       : {base_cost:.2f} €\n"
-
-        if self.penalty > 0:
-            invoice += f"PÉNALITÉ RETARD  : +{self.penalty:.2f} €\n"
-        
-        invoice += "========================================\n"
-        invoice += f"TOTAL À PAYER    : {self.total_cost:.2f} €\n"
-        invoice += "========================================\n"
-        
-        return invoice
\ No newline at end of file
+        # Facture mise en cache, rendue à nouveau seulement si l'un de ses champs a changé
+        record = invoice_record(self)
+        if self._invoice is None or self._invoice[0] != record:
+            self._invoice = (record, render_invoice(record))
+        return self._invoice[1]
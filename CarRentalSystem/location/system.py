@@ -1,18 +1,78 @@
-from datetime import date
-from typing import List, Optional, Type
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+import numpy as np
 
 # Imports des modules voisins
-from fleet.transport_base import TransportMode
+from fleet.transport_base import TransportMode, TowedVehicle
+from fleet.harness import HarnessIndex
+from fleet.index import FleetIndex
 from fleet.enums import VehicleStatus
+from fleet.maintenance import MAINTENANCE_TYPES, Maintenance
+from fleet.registry import FLEET_CLASSES, CLASS_CODES, class_code
 from clients.customer import Customer
-from .rental import Rental
+from clients.eligibility import filter_eligible
+from .rental import Rental, as_date, parse_iso_date
+from .pricing import PRICING
+from .ledger import RevenueLedger
+from .invoices import archived_invoice_record
+from .archive import RentalArchive
+from .history import RentalHistoryRepository
+from .changes import ChangeLog
+from .events import EventLog
+
+# Les locations clôturées depuis plus longtemps partent dans l'archive
+ARCHIVE_HORIZON_DAYS = 90
 
 class CarRentalSystem:
-    def __init__(self):
+    def __init__(self, columnar: bool = False):
         # Les 3 listes principales (Base de données en mémoire)
         self.fleet: List[TransportMode] = []
+        # Ids triés (globalement et par classe) pour la pagination ; la flotte colonnaire a le sien
+        self.fleet_index: Optional[FleetIndex] = FleetIndex()
+        if columnar:
+            # Flotte en colonnes NumPy (analytique), mêmes usages qu'une liste
+            from fleet.columnar import ColumnarFleet
+            self.fleet = ColumnarFleet()
+            self.fleet_index = None
         self.customers: List[Customer] = []
         self.rentals: List[Rental] = []
+        # Attelages : animal <-> véhicule tracté
+        self.harness = HarnessIndex()
+        # Tarification (règles partagées avec Rental)
+        self.pricing = PRICING
+        # CA par jour de retour et par classe (alimenté à chaque clôture), propre à ce système
+        self.ledger = RevenueLedger()
+        # Locations "froides" (hors mémoire), branchée par le StorageManager
+        self.archive: Optional[RentalArchive] = None
+        self.archive_horizon_days = ARCHIVE_HORIZON_DAYS
+        self.last_rental_id = 0
+        # Historique consulté à la demande (résumés + LRU de Rental hydratées)
+        self.history = RentalHistoryRepository(self)
+        # Numéro de version de l'état : +1 à chaque modification (caches de réponses, ETag)
+        self.version = 0
+        # Version de la dernière modification de chaque id (exports incrémentaux)
+        self.changes = ChangeLog()
+        # Derniers événements publiés (flux temps réel de l'API)
+        self.events = EventLog()
+
+    def touch(self, **changed: Iterable[int]) -> int:
+        """
+        Signale une modification (les méthodes ci-dessous le font elles-mêmes).
+        changed : ids modifiés par entité, ex : touch(rentals=[12], fleet=[3]).
+        """
+        self.version += 1
+        for entity, ids in changed.items():
+            self.changes.stamp(entity, ids, self.version)
+        return self.version
+
+    def publish(self, kind: str, data: dict):
+        """Événement de la modification qui vient d'être comptée (id = version courante)."""
+        self.events.record(self.version, kind, data)
+
+    def _publish_status(self, vehicle):
+        self.publish("vehicle_status", {"id": vehicle.id, "status": vehicle.status})
 
     # ==========================================
     # 1. GESTION (CRUD)
@@ -20,13 +80,59 @@ class CarRentalSystem:
     
     def add_vehicle(self, vehicle: TransportMode):
         self.fleet.append(vehicle)
+        if self.fleet_index is not None:
+            self.fleet_index.add(vehicle)
+        self.touch(fleet=[vehicle.id])
+        if self.events.recording:  # Pas de to_dict pour rien pendant un chargement
+            self.publish("vehicle_added", vehicle.to_dict())
         # Pas de print ici pour ne pas polluer l'interface, on laisse l'UI gérer
 
     def find_vehicle(self, v_id: int) -> Optional[TransportMode]:
-        return next((v for v in self.fleet if v.id == v_id), None)
+        if hasattr(self.fleet, "find"):
+            return self.fleet.find(v_id)
+        return self.fleet_index.find(v_id)
+
+    def remove_vehicle(self, vehicle: TransportMode):
+        self.fleet.remove(vehicle)
+        if self.fleet_index is not None:
+            self.fleet_index.remove(vehicle)
+        self.harness.forget(vehicle)
+        self.touch(fleet=[vehicle.id])
+        self.publish("vehicle_removed", {"id": vehicle.id})
+
+    def harness_animal(self, towed: TowedVehicle, animal) -> bool:
+        """Attelle un animal (règles de la calèche/charrette) et tient l'index à jour."""
+        attached_to = self.harness.towed_of(animal.id)
+        if attached_to is not None:
+            print(f"❌ {animal.name} est déjà attelé au véhicule #{attached_to.id}.")
+            return False
+
+        if not towed.harness_animal(animal):
+            return False
+        self.harness.link(towed, animal)
+        self.touch(fleet=[towed.id, animal.id])
+        self.publish("vehicle_harnessed", {"towed_id": towed.id, "animal_id": animal.id})
+        return True
+
+    def add_maintenance(self, vehicle: TransportMode, maintenance: Maintenance, immobilize: bool = False):
+        """Enregistre une intervention ; immobilize : le véhicule passe "En Maintenance"."""
+        vehicle.add_maintenance(maintenance)
+        if immobilize:
+            vehicle.status = VehicleStatus.UNDER_MAINTENANCE
+        self.touch(fleet=[vehicle.id])
+        self.publish("maintenance", {"vehicle_id": vehicle.id, **maintenance.to_dict()})
+        if immobilize:
+            self._publish_status(vehicle)
+
+    def set_vehicle_status(self, vehicle: TransportMode, status: VehicleStatus):
+        """Change le statut à la main (ex : fin de maintenance)."""
+        vehicle.status = status
+        self.touch(fleet=[vehicle.id])
+        self._publish_status(vehicle)
 
     def add_customer(self, customer: Customer):
         self.customers.append(customer)
+        self.touch(customers=[customer.id])
 
     def find_customer(self, c_id: int) -> Optional[Customer]:
         return next((c for c in self.customers if c.id == c_id), None)
@@ -51,26 +157,55 @@ class CarRentalSystem:
             print(f"❌ Indisponible : Ce véhicule est actuellement {vehicule.status.value}.")
             return None
 
-        # Création
-        new_id = len(self.rentals) + 1
-        rental = Rental(new_id, vehicule, client, start, end)
+        # Création (le véhicule passe en "Loué")
+        rental = Rental(client, vehicule, start, end)
         
         # Enregistrement
-        self.rentals.append(rental)
+        self.add_rental(rental)
         
-        # Mise à jour du statut du véhicule
-        vehicule.status = VehicleStatus.RENTED
-        
-        print(f"✅ Location validée pour {rental.total_price}€")
+        print(f"✅ Location validée pour {rental.calculate_cost()}€")
+        return rental
+
+    def find_rental(self, rental_id: int) -> Optional[Rental]:
+        """Location en mémoire (liste rangée par id croissant) ; None si inconnue ou archivée."""
+        i = bisect_left(self.rentals, rental_id, key=lambda r: r.id)
+        if i < len(self.rentals) and self.rentals[i].id == rental_id:
+            return self.rentals[i]
+        return None
+
+    def add_rental(self, rental: Rental) -> Rental:
+        """Enregistre une nouvelle location avec un id jamais utilisé (archive comprise)."""
+        self.last_rental_id += 1
+        rental.id = self.last_rental_id
+        self.rentals.append(rental)
+        self.touch(rentals=[rental.id], fleet=[rental.vehicle.id])
+        self.publish("rental_created", rental.to_dict())
+        self._publish_status(rental.vehicle)
         return rental
 
-    def return_vehicle(self, rental_id: int):
+    def close_rental(self, rental: Rental, return_date) -> float:
+        """
+        Clôture une location et l'inscrit au grand livre. Renvoie le prix final.
+        Une location déjà clôturée (date de retour corrigée) remplace sa ligne du
+        grand livre au lieu d'en ajouter une seconde.
+        """
+        previous = None
+        if not rental.is_active and rental.actual_return_date is not None:
+            previous = (rental.actual_return_date, rental.total_cost, rental.penalty)
+
+        total = rental.close_rental(return_date)
+        if previous is not None:
+            self.ledger.remove(rental.vehicle, *previous)
+        self.ledger.record(rental.vehicle, rental.actual_return_date, rental.total_cost, rental.penalty)
+        self.record_returns([rental])
+        return total
+
+    def return_vehicle(self, rental_id: int, return_date=None):
         """Clôture une location."""
-        rental = next((r for r in self.rentals if r.id == rental_id), None)
+        rental = self.find_rental(rental_id)
 
         if rental and rental.is_active:
-            rental.close_rental()
-            rental.vehicle.status = VehicleStatus.AVAILABLE
+            self.close_rental(rental, return_date or date.today())
 
             if hasattr(rental.vehicle, 'brand'):
                 nom_vehicule = f"{rental.vehicle.brand} {rental.vehicle.model}"
@@ -83,6 +218,194 @@ class CarRentalSystem:
         else:
             print("❌ Erreur : Location introuvable ou déjà terminée.")
 
+    def close_rentals(self, returns: Iterable[Tuple[int, object]]) -> dict:
+        """
+        Clôture de fin de journée : une liste de (id location, date retour).
+        Coûts et pénalités calculés en une fois (moteur de tarification) sur tout le lot,
+        un seul message récapitulatif. La sauvegarde (une seule) reste à l'appelant.
+        """
+        active = {r.id: r for r in self.rentals if r.is_active}
+        rentals, dates, errors = [], [], []
+        # Colonnes plates (jours en ordinaux) : pas de tuple par ligne à allouer
+        codes, starts, ends, returned, rates = [], [], [], [], []
+        for rental_id, return_date in returns:
+            rental = active.pop(rental_id, None)
+            if rental is None:
+                errors.append((rental_id, "Location introuvable ou déjà terminée."))
+                continue
+            try:
+                day = as_date(return_date, "Date retour invalide.")
+            except ValueError as e:
+                active[rental_id] = rental
+                errors.append((rental_id, str(e)))
+                continue
+            rentals.append(rental)
+            dates.append(day)
+            codes.append(class_code(rental.vehicle))
+            starts.append(rental.start_date.toordinal())
+            ends.append(rental.end_date.toordinal())
+            returned.append(day.toordinal())
+            rates.append(rental.vehicle.daily_rate)
+
+        summary = {"closed": len(rentals), "late": 0, "revenue": 0.0, "penalties": 0.0, "errors": errors}
+        if not rentals:
+            return summary
+
+        returned = np.array(returned, dtype=np.int64)
+        starts = np.array(starts, dtype=np.int64)
+        base = self.pricing.price(codes, rates, starts, np.maximum(1, returned - starts))
+        penalties, late_days = self.pricing.penalties(rates, ends, returned)
+        totals = base + penalties
+
+        for rental, day, penalty, total in zip(rentals, dates, penalties.tolist(), totals.tolist()):
+            rental.actual_return_date = day
+            rental.penalty = penalty
+            rental.total_cost = total
+            rental.is_active = False
+
+        self.ledger.record_many(codes, returned, totals, penalties)
+
+        if hasattr(self.fleet, "set_status"):
+            self.fleet.set_status([r.vehicle.id for r in rentals], VehicleStatus.AVAILABLE)
+        else:
+            for rental in rentals:
+                rental.vehicle.status = VehicleStatus.AVAILABLE
+
+        self.record_returns(rentals)
+        summary["late"] = int(np.count_nonzero(late_days))
+        summary["revenue"] = float(totals.sum())
+        summary["penalties"] = float(penalties.sum())
+        print(f"🚗 {len(rentals)} retours clôturés ({summary['late']} en retard) - {summary['revenue']:.2f}€ "
+              f"dont {summary['penalties']:.2f}€ de pénalités.")
+        return summary
+
+    def record_returns(self, rentals: List[Rental]):
+        """Compte des retours déjà clôturés (journal des modifications + événements)."""
+        self.touch(rentals=[r.id for r in rentals], fleet=[r.vehicle.id for r in rentals])
+        for rental in rentals:
+            self.publish("rental_returned", rental.to_dict())
+            self._publish_status(rental.vehicle)
+
+    def cold_rentals(self, today: Optional[date] = None) -> List[Rental]:
+        """Locations clôturées avant l'horizon : celles à déplacer dans l'archive."""
+        if self.archive is None:
+            return []
+        cutoff = (today or date.today()) - timedelta(days=self.archive_horizon_days)
+        return [r for r in self.rentals
+                if not r.is_active and r.actual_return_date is not None and r.actual_return_date < cutoff]
+
+    def archive_records(self, rentals: List[Rental]) -> List[dict]:
+        """Lignes d'archive : chaque location emporte la version de sa dernière modification."""
+        return [dict(r.to_dict(), version=self.changes.version_of("rentals", r.id)) for r in rentals]
+
+    def forget_archived(self, rentals: List[Rental]) -> int:
+        """Retire de la mémoire des locations désormais dans l'archive."""
+        if not rentals:
+            return 0
+        archived = {id(r) for r in rentals}
+        self.rentals = [r for r in self.rentals if id(r) not in archived]
+        for r in rentals:
+            self.changes.pop("rentals", r.id)
+        self.touch()
+        return len(rentals)
+
+    def archive_closed_rentals(self, today: Optional[date] = None) -> int:
+        """
+        Déplace vers l'archive les locations clôturées avant l'horizon. Renvoie le nombre archivé.
+        Tout se fait ici, fichiers compris ; l'API passe par les trois étapes
+        ci-dessus pour écrire l'archive hors de la boucle (PersistenceWriter).
+        """
+        cold = self.cold_rentals(today)
+        if cold:
+            self.archive.append(self.archive_records(cold))
+        return self.forget_archived(cold)
+
+    def rebuild_ledger(self):
+        """Reconstruit le grand livre depuis l'archive et les locations clôturées en mémoire."""
+        self.ledger.clear()
+        codes, days, revenues, penalties = [], [], [], []
+        records = self.archive.iter_records() if self.archive is not None else ()
+        for record in records:
+            vehicle = self.find_vehicle(record["vehicle_id"])
+            if vehicle is None:
+                continue
+            codes.append(class_code(vehicle))
+            days.append(parse_iso_date(record["actual_return_date"]).toordinal())
+            revenues.append(record.get("total_cost", 0.0))
+            penalties.append(record.get("penalty", 0.0))
+        for r in self.rentals:
+            if not r.is_active and r.actual_return_date is not None:
+                codes.append(class_code(r.vehicle))
+                days.append(r.actual_return_date.toordinal())
+                revenues.append(r.total_cost)
+                penalties.append(r.penalty)
+        self.ledger.record_many(codes, days, revenues, penalties)
+
+    def archived_invoice_records(self, start: Optional[date] = None, end: Optional[date] = None,
+                                 skip: Iterable[int] = ()) -> Iterator[tuple]:
+        """
+        Relevés de facture des locations archivées rendues dans [start, end]
+        (seuls les mois de la période sont lus). skip : ids déjà exportés depuis
+        la mémoire (location archivée entre-temps).
+        """
+        if self.archive is None:
+            return
+        skip = set(skip)
+        customers = {c.id: c for c in self.customers}
+        for record in self.archive.iter_records(start, end):
+            if record["id"] in skip:
+                continue
+            yield archived_invoice_record(record, customers.get(record["customer_id"]),
+                                          self.find_vehicle(record["vehicle_id"]))
+
+    def revenue_report(self, start=None, end=None, vehicle_types: Optional[Iterable[type]] = None) -> dict:
+        """
+        CA, pénalités et nombre de locations clôturées (par jour de retour) sur
+        [start, end], toutes classes ou seulement `vehicle_types`, avec le détail par classe.
+        Lu dans le grand livre : aucune location parcourue.
+        """
+        start = as_date(start, "Date début invalide.") if start else None
+        end = as_date(end, "Date fin invalide.") if end else None
+        if start and end and end < start:
+            raise ValueError("La date de fin doit être après la date de début.")
+
+        classes = None
+        if vehicle_types is not None:
+            # Un type abstrait (ex : TransportAnimal) couvre toutes ses sous-classes
+            classes = [cls for cls in FLEET_CLASSES if issubclass(cls, tuple(vehicle_types))]
+        report = self.ledger.query(start, end, classes)
+        names = {cls.__name__ for cls in classes} if classes is not None else None
+        report["by_class"] = {name: row for name, row in self.ledger.by_class(start, end).items()
+                              if names is None or name in names}
+        return report
+
+    def closed_revenue(self) -> float:
+        """Chiffre d'affaires des locations clôturées : mémoire + totaux de l'archive (sans la relire)."""
+        total = sum(r.total_cost for r in self.rentals if not r.is_active)
+        if self.archive is not None:
+            total += self.archive.totals()["revenue"]
+        return total
+
+    def status_counts(self) -> Dict[VehicleStatus, int]:
+        """Nombre de véhicules par statut (réduction vectorisée si la flotte est en colonnes)."""
+        if hasattr(self.fleet, "status_counts"):
+            return self.fleet.status_counts()
+        counts = dict.fromkeys(VehicleStatus, 0)
+        for v in self.fleet:
+            counts[v.status] += 1
+        return counts
+
+    def active_rental_counts(self, today: Optional[date] = None) -> Tuple[int, int]:
+        """(locations en cours, dont en retard : date de fin passée sans retour)."""
+        today = today or date.today()
+        active = overdue = 0
+        for r in self.rentals:
+            if r.is_active:
+                active += 1
+                if r.end_date < today:
+                    overdue += 1
+        return active, overdue
+
     # ==========================================
     # 3. RECHERCHE (SEARCH)
     # ==========================================
@@ -113,6 +436,97 @@ class CarRentalSystem:
         
         return results
 
+    # --- Pages (curseur = dernier id reçu) ---
+    def page_vehicles(self, after: Optional[int] = None, limit: int = 50,
+                      vehicle_types: Optional[Iterable[type]] = None, status: Optional[VehicleStatus] = None,
+                      min_price: Optional[float] = None, max_price: Optional[float] = None):
+        """
+        Éléments de la flotte d'id > after, triés par id, filtrés par classe(s)
+        (un type abstrait couvre ses sous-classes), statut et fourchette de prix.
+        Renvoie (éléments, curseur suivant ou None).
+        """
+        codes = None
+        if vehicle_types is not None:
+            codes = [CLASS_CODES[cls] for cls in FLEET_CLASSES if issubclass(cls, tuple(vehicle_types))]
+        pager = self.fleet if self.fleet_index is None else self.fleet_index
+        return pager.page(after, limit, codes, status, min_price, max_price)
+
+    @staticmethod
+    def _page_by_id(items: list, after: Optional[int], limit: int, keep=None):
+        """Page d'une liste rangée par id croissant (ids attribués dans l'ordre)."""
+        start = 0 if after is None else bisect_right(items, after, key=lambda x: x.id)
+        tail = (items[i] for i in range(start, len(items)))
+        results = []
+        for item in tail if keep is None else filter(keep, tail):
+            if len(results) == limit:
+                return results, results[-1].id
+            results.append(item)
+        return results, None
+
+    def page_customers(self, after: Optional[int] = None, limit: int = 50):
+        return self._page_by_id(self.customers, after, limit)
+
+    def page_rentals(self, after: Optional[int] = None, limit: int = 50, customer_id: Optional[int] = None,
+                     vehicle_id: Optional[int] = None, active: Optional[bool] = None):
+        def keep(r):
+            return ((customer_id is None or r.customer.id == customer_id)
+                    and (vehicle_id is None or r.vehicle.id == vehicle_id)
+                    and (active is None or r.is_active == active))
+        return self._page_by_id(self.rentals, after, limit, keep)
+
+    def eligible_vehicles(self, customer: Customer, window: Optional[Tuple[date, date]] = None) -> List[TransportMode]:
+        """
+        Catalogue louable par un client : disponible, âge et permis compatibles,
+        et (si une période est donnée) sans location active qui la chevauche.
+        Seuls les véhicules "Disponible" sont proposés, comme create_rental et
+        quote_matrix : un véhicule loué n'est pas réservable à l'avance.
+        """
+        candidates = filter_eligible(self.search_vehicles(), customer)
+        if window is None:
+            return candidates
+
+        start, end = window
+        if start > end:
+            raise ValueError("La date de fin est avant le début.")
+
+        busy = {
+            r.vehicle.id for r in self.rentals
+            if r.is_active and r.start_date <= end and start <= r.end_date
+        }
+        return [v for v in candidates if v.id not in busy]
+
+    def quote_matrix(self, vehicles: List[TransportMode], windows: List[Tuple[date, date]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Prix et disponibilité de chaque véhicule pour chaque période,
+        en un seul calcul : deux tableaux (len(vehicles), len(windows)).
+        Disponible = statut "Disponible" et aucune location active qui chevauche.
+        """
+        for start, end in windows:
+            if start > end:
+                raise ValueError("La date de fin est avant le début.")
+
+        prices = self.pricing.quote_many(vehicles, windows)
+        free = np.fromiter((v.status == VehicleStatus.AVAILABLE for v in vehicles), dtype=bool, count=len(vehicles))
+        available = np.repeat(free[:, None], len(windows), axis=1)
+
+        # Un même id peut être demandé plusieurs fois : chaque ligne est marquée
+        rows_of: Dict[int, List[int]] = {}
+        for i, v in enumerate(vehicles):
+            rows_of.setdefault(v.id, []).append(i)
+        booked = [(row, r.start_date.toordinal(), r.end_date.toordinal())
+                  for r in self.rentals if r.is_active and r.vehicle.id in rows_of
+                  for row in rows_of[r.vehicle.id]]
+        if booked and windows:
+            rows, r_start, r_end = np.array(booked, dtype=np.int64).T
+            w_start = np.array([s.toordinal() for s, _ in windows], dtype=np.int64)
+            w_end = np.array([e.toordinal() for _, e in windows], dtype=np.int64)
+            overlap = (r_start[:, None] <= w_end[None, :]) & (w_start[None, :] <= r_end[:, None])
+            busy = np.zeros_like(available)
+            np.logical_or.at(busy, rows, overlap)
+            available &= ~busy
+
+        return prices, available
+
     # ==========================================
     # 4. RAPPORTS (REPORTS)
     # ==========================================
@@ -129,11 +543,37 @@ class CarRentalSystem:
                 print(r.show_details())
         print("--------------------------------------")
 
+    def maintenance_summary(self) -> dict:
+        """Agrégats d'entretien de toute la flotte (lus sur les journaux, sans parcourir les entrées)."""
+        total_cost, downtime, count = 0.0, 0.0, 0
+        by_type = [0] * len(MAINTENANCE_TYPES)
+        last_service = None
+
+        for v in self.fleet:
+            log = v.maintenance_log
+            if not len(log):
+                continue
+            count += len(log)
+            total_cost += log.total_cost
+            downtime += log.total_downtime_days
+            by_type = [a + b for a, b in zip(by_type, log.count_by_type)]
+            if last_service is None or log.last_service_date > last_service:
+                last_service = log.last_service_date
+
+        return {
+            "count": count,
+            "total_cost": total_cost,
+            "total_downtime_days": downtime,
+            "count_by_type": {t: n for t, n in zip(MAINTENANCE_TYPES, by_type) if n},
+            "last_service_date": last_service,
+        }
+
     def generate_revenue_report(self):
         """Calcule le chiffre d'affaires total."""
-        total_revenue = sum(r.total_price for r in self.rentals)
+        total_revenue = self.closed_revenue()
+        archived = self.archive.totals()["count"] if self.archive is not None else 0
         print(f"\n--- 💰 RAPPORT FINANCIER ---")
-        print(f"Nombre total de contrats : {len(self.rentals)}")
+        print(f"Nombre total de contrats : {len(self.rentals) + archived}")
         print(f"Chiffre d'Affaires Total : {total_revenue}€")
         print("----------------------------")
         return total_revenue
\ No newline at end of file
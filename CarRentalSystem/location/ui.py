@@ -44,7 +44,7 @@ def menu_locations(system):
 
             try:
                 new_rental = Rental(customer, vehicle, s_str, e_str)
-                system.rentals.append(new_rental)
+                system.add_rental(new_rental)
                 cost = new_rental.calculate_cost()
                 
                 console.print(Panel(f"Location Validée !\nCoût estimé : {cost} €", style="green"))
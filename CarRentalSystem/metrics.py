@@ -0,0 +1,202 @@
+"""
+Métriques au format texte Prometheus (GET /metrics), sans service externe.
+
+Trois sortes de séries, avec étiquettes :
+  - Counter   : total qui ne fait que monter (requêtes, octets écrits) ;
+  - Histogram : répartition de durées par seaux cumulés, + somme et nombre ;
+  - Gauge     : valeur lue au moment de la collecte (fonction appelée à chaque
+                scrape : taille de la flotte, locations en cours...).
+Les mesures peuvent venir d'un autre thread (écrivain de sauvegarde) : chaque
+série est protégée par un verrou, tenu le temps d'une addition.
+
+METRICS est le registre partagé (comme PRICING) ; MetricsMiddleware
+mesure chaque requête HTTP de l'application qu'il enveloppe.
+"""
+import math
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Seaux de latence (secondes) : de la milliseconde à la dizaine de secondes
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_labels(names: Tuple[str, ...], values: Tuple, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+class _Metric:
+    __slots__ = ("name", "help", "labelnames", "_lock")
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}", *self._samples()]
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+class Counter(_Metric):
+    __slots__ = ("_values", "collect")
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = (),
+                 collect: Optional[Callable[[], Iterable[Tuple[tuple, float]]]] = None):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[tuple, float] = {}
+        self.collect = collect  # Total tenu ailleurs (ex : compteur d'un objet), lu à chaque collecte
+
+    def inc(self, amount: float = 1.0, *labels):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels) -> float:
+        return self._values.get(labels, 0.0)
+
+    def _samples(self) -> List[str]:
+        if self.collect is not None:
+            items = [(tuple(labels), v) for labels, v in self.collect()]
+        else:
+            with self._lock:
+                items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(v)}" for labels, v in items]
+
+class Histogram(_Metric):
+    __slots__ = ("buckets", "_series")
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = (), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[tuple, list] = {}  # étiquettes -> [comptes par seau (+Inf compris), somme]
+
+    def observe(self, value: float, *labels):
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][i] += 1
+            series[1] += value
+
+    def count(self, *labels) -> int:
+        series = self._series.get(labels)
+        return sum(series[0]) if series else 0
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((labels, (list(counts), total)) for labels, (counts, total) in self._series.items())
+        lines = []
+        for labels, (counts, total) in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets + (math.inf,), counts):
+                cumulative += n
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+class Gauge(_Metric):
+    __slots__ = ("collect",)
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = (),
+                 collect: Optional[Callable[[], Iterable[Tuple[tuple, float]]]] = None):
+        super().__init__(name, help, labelnames)
+        self.collect = collect  # -> [(étiquettes, valeur), ...], appelée à chaque collecte
+
+    def _samples(self) -> List[str]:
+        if self.collect is None:
+            return []
+        return [f"{self.name}{_format_labels(self.labelnames, tuple(labels))} {_format_value(v)}"
+                for labels, v in self.collect()]
+
+class MetricsRegistry:
+    __slots__ = ("_metrics",)
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        # Même nom : même série (un module rechargé ne crée pas de doublon)
+        existing = self._metrics.get(metric.name)
+        if existing is not None and type(existing) is type(metric):
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Iterable[str] = (), collect=None) -> Counter:
+        counter = self._register(Counter(name, help, labelnames, collect))
+        if collect is not None:
+            counter.collect = collect
+        return counter
+
+    def histogram(self, name: str, help: str, labelnames: Iterable[str] = (), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def gauge(self, name: str, help: str, labelnames: Iterable[str] = (), collect=None) -> Gauge:
+        gauge = self._register(Gauge(name, help, labelnames, collect))
+        gauge.collect = collect  # La dernière fonction de collecte déclarée l'emporte (api rechargée)
+        return gauge
+
+    def render(self) -> str:
+        """Toutes les séries, format d'exposition texte Prometheus 0.0.4."""
+        lines = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+METRICS = MetricsRegistry()
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+REQUESTS = METRICS.counter("http_requests_total", "Requêtes HTTP traitées", ("method", "route", "status"))
+REQUEST_SECONDS = METRICS.histogram("http_request_duration_seconds", "Durée des requêtes HTTP (corps compris)",
+                                    ("method", "route"))
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI : nombre et durée des requêtes par route. La route est le
+    modèle de chemin ("/rentals/{rental_id}/return"), pas l'URL reçue, pour
+    garder un nombre de séries borné.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "inconnue"
+            method = scope.get("method", "")
+            REQUESTS.inc(1, method, path, str(status))
+            REQUEST_SECONDS.observe(time.perf_counter() - start, method, path)
@@ -0,0 +1,152 @@
+"""
+Écriture sur disque en arrière-plan pour l'API asynchrone.
+
+Les routes modifient le système en mémoire (boucle d'événements, donc une
+à la fois), puis signalent qu'il faut sauvegarder. Un seul écrivain :
+une copie de l'état est prise sur la boucle, et l'écriture (JSON + grand
+livre) part dans un thread dédié. Toutes les modifications arrivées pendant
+une écriture partent ensemble dans la suivante : au plus une écriture en
+cours et une en attente, quel que soit le nombre de requêtes.
+
+L'archivage des locations froides est une étape à part, au plus une fois
+par ARCHIVE_INTERVAL_SECONDS : les locations sont choisies sur la boucle,
+l'archive est écrite dans le thread de l'écrivain, avant la copie suivante.
+"""
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import List, Optional, Tuple
+
+from metrics import METRICS
+
+try:
+    import fcntl
+except ImportError:  # Windows : pas de verrou, un seul processus de l'API à lancer soi-même
+    fcntl = None
+
+ARCHIVE_INTERVAL_SECONDS = 3600.0
+
+DISK_WAIT_SECONDS = METRICS.histogram("persistence_disk_wait_seconds",
+                                      "Attente d'une requête \"disk\" jusqu'à l'écriture de sa modification")
+
+def lock_data_file(filename: str):
+    """
+    Verrou exclusif sur <fichier>.lock, gardé tant que le processus vit : un
+    seul processus de l'API peut posséder (et réécrire) la sauvegarde. Un
+    deuxième (ex : uvicorn --workers 4) échoue au démarrage au lieu d'écraser
+    en silence les écritures du premier. Renvoie le fichier ouvert, à garder.
+    """
+    if fcntl is None:
+        return None
+    handle = open(filename + ".lock", "w")
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        handle.close()
+        raise RuntimeError(f"{os.path.abspath(filename)} est déjà tenu par un autre processus de l'API. "
+                           f"Pour plusieurs workers : python serve.py --workers N")
+    return handle
+
+class Durability(Enum):
+    MEMORY = "memory"  # Réponse dès la modification en mémoire, sauvegarde programmée
+    DISK = "disk"      # Réponse une fois la modification écrite sur disque
+
+class PersistenceWriter:
+    __slots__ = ("storage", "system", "writes", "archive_interval", "_archived_at", "_executor", "_loop", "_task",
+                 "_dirty", "_generation", "_saved", "_waiters")
+
+    def __init__(self, storage, system, archive_interval: float = ARCHIVE_INTERVAL_SECONDS):
+        self.storage = storage
+        self.system = system
+        self.writes = 0  # Écritures réellement faites (pour mesurer le regroupement)
+        self.archive_interval = archive_interval
+        self._archived_at: Optional[float] = None  # Dernier archivage (None : jamais, fait à la première écriture)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="persistence")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._dirty: Optional[asyncio.Event] = None
+        self._generation = 0  # Numéro de la dernière modification signalée
+        self._saved = 0       # Dernière modification écrite sur disque
+        self._waiters: List[Tuple[int, asyncio.Future]] = []
+
+    def _ensure_started(self):
+        """Démarre l'écrivain sur la boucle courante (une nouvelle boucle le redémarre)."""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._loop = loop
+            self._dirty = asyncio.Event()
+            self._waiters = []
+            self._task = loop.create_task(self._run())
+
+    async def commit(self, durability: Durability = Durability.DISK):
+        """Signale une modification ; attend son écriture si la durabilité demandée est DISK."""
+        self._ensure_started()
+        self._generation += 1
+        self._dirty.set()
+        if durability is Durability.DISK:
+            future = self._loop.create_future()
+            self._waiters.append((self._generation, future))
+            start = time.perf_counter()
+            try:
+                await future
+            finally:
+                DISK_WAIT_SECONDS.observe(time.perf_counter() - start)
+
+    async def flush(self):
+        """Attend que tout ce qui a été signalé soit sur disque."""
+        if self._saved < self._generation:
+            await self.commit(Durability.DISK)
+
+    async def _archive(self, loop: asyncio.AbstractEventLoop):
+        """Déplace les locations froides vers l'archive (fichiers écrits hors de la boucle)."""
+        now = time.monotonic()
+        if self._archived_at is not None and now - self._archived_at < self.archive_interval:
+            return
+        self._archived_at = now
+        cold = self.system.cold_rentals()
+        if cold:
+            records = self.system.archive_records(cold)
+            await loop.run_in_executor(self._executor, self.system.archive.append, records)
+            self.system.forget_archived(cold)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._dirty.wait()
+            self._dirty.clear()
+            generation = self._generation
+            error = None
+            try:
+                await self._archive(loop)
+            except Exception as e:
+                # Les locations restent en mémoire : nouvel essai au prochain archivage
+                print(f"❌ Erreur archivage : {e}")
+            try:
+                # Copie prise sans rendre la main à la boucle : état cohérent
+                snapshot = self.storage.snapshot(self.system)
+                await loop.run_in_executor(self._executor, self.storage.write_snapshot, snapshot)
+                self._saved = generation
+                self.writes += 1
+            except Exception as e:
+                print(f"❌ Erreur Save : {e}")
+                error = e
+
+            pending = []
+            for waited, future in self._waiters:
+                if waited > generation:
+                    pending.append((waited, future))
+                elif not future.done():
+                    if error is None:
+                        future.set_result(generation)
+                    else:
+                        future.set_exception(error)
+            self._waiters = pending
+
+    async def close(self):
+        """Dernière écriture puis arrêt de la tâche (fin de l'application)."""
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
@@ -0,0 +1,67 @@
+"""
+Cache des réponses JSON des routes de lecture, avec ETag.
+
+Une réponse est gardée sous forme d'octets déjà sérialisés, par (route,
+paramètres) et pour une version donnée du système (CarRentalSystem.version).
+Tant que rien n'a changé, la même requête ne reconstruit ni dicts ni JSON ;
+et un client qui renvoie l'ETag reçu (If-None-Match) obtient un 304 vide.
+"""
+import zlib
+from collections import OrderedDict
+from typing import Callable
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from encoding import dumps
+
+MAX_CACHED_RESPONSES = 512
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encodée par encoding.dumps (orjson si disponible)."""
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+class ResponseCache:
+    __slots__ = ("system", "max_entries", "hits", "misses", "_version", "_entries")
+
+    def __init__(self, system, max_entries: int = MAX_CACHED_RESPONSES):
+        self.system = system
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._version = system.version
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()  # clé -> (octets, etag)
+
+    def lookup(self, key: tuple, build: Callable[[], object]) -> tuple:
+        """(octets, etag) de la réponse ; `build` n'est appelé que si l'état a changé depuis."""
+        if self._version != self.system.version:
+            # Une seule version valide à la fois : tout le reste est périmé
+            self._entries.clear()
+            self._version = self.system.version
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        body = dumps(build())
+        # Version + empreinte du contenu : reste unique après un redémarrage (version repartie de 0)
+        entry = (body, f'"{self._version}-{zlib.crc32(body):08x}"')
+        self._entries[key] = entry
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def respond(self, request: Request, build: Callable[[], object]) -> Response:
+        """Réponse de la route (clé = chemin + paramètres), ou 304 si le client a déjà cette version."""
+        key = (request.url.path, tuple(sorted(request.query_params.multi_items())))
+        body, etag = self.lookup(key, build)
+        headers = {"ETag": etag}
+        sent = [tag.strip().removeprefix("W/") for tag in request.headers.get("if-none-match", "").split(",")]
+        if etag in sent or "*" in sent:
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
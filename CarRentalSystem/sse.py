@@ -0,0 +1,28 @@
+"""
+Mise en forme Server-Sent Events (text/event-stream) des événements du système.
+
+Les événements d'une même modification partagent une version : seul le
+dernier du groupe porte l'id. Un client coupé au milieu d'un groupe reprend
+donc à la version précédente et le reçoit en entier (jamais à moitié).
+"""
+from typing import Iterable, Optional
+
+from encoding import dumps
+
+MEDIA_TYPE = "text/event-stream"
+RETRY_MS = 3000  # Délai de reconnexion conseillé au navigateur
+KEEPALIVE = b": ping\n\n"
+
+def message(kind: str, data, event_id: Optional[int] = None) -> bytes:
+    head = f"event: {kind}\n" + (f"id: {event_id}\n" if event_id is not None else "")
+    # JSON compact : jamais de saut de ligne, une seule ligne data
+    return head.encode() + b"data: " + dumps(data) + b"\n\n"
+
+def format_events(events: Iterable[tuple]) -> bytes:
+    """(version, type, données) -> messages SSE, id sur le dernier événement de chaque version."""
+    events = list(events)
+    chunks = []
+    for i, (version, kind, data) in enumerate(events):
+        last_of_version = i + 1 == len(events) or events[i + 1][0] != version
+        chunks.append(message(kind, data, version if last_of_version else None))
+    return b"".join(chunks)
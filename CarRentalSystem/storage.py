@@ -1,42 +1,97 @@
-import json
-from datetime import date
+import os
+import time
+from datetime import date, timedelta
 from fleet.enums import VehicleStatus, MaintenanceType
 from fleet.maintenance import Maintenance
-# Import de TOUS les types
-from fleet.vehicles import Car, Truck, Motorcycle, Hearse, GoKart, Carriage, Cart, Boat, Plane, Helicopter, Submarine
-from fleet.animals import Horse, Donkey, Camel, Whale, Eagle, Dragon, Dolphin
+# Import de TOUS les types (par nom de classe)
+from fleet.registry import CLASS_BY_NAME
 from clients.customer import Customer
-from location.rental import Rental
+from location.rental import Rental, parse_iso_date
 from location.system import CarRentalSystem
+from location.archive import RentalArchive
+from location.ledger import RevenueLedger
+from encoding import dumps, loads
+from metrics import METRICS
 from fleet.transport_base import MotorizedVehicle, TransportAnimal, TowedVehicle, Maintenance
 
+SNAPSHOT_SECONDS = METRICS.histogram("storage_snapshot_seconds", "Copie de l'état avant sauvegarde (bloque la boucle)")
+SAVE_SECONDS = METRICS.histogram("storage_save_seconds", "Écriture de la sauvegarde (data.json + grand livre)")
+SAVED_BYTES = METRICS.counter("storage_written_bytes_total", "Octets écrits par les sauvegardes")
+LOAD_SECONDS = METRICS.histogram("storage_load_seconds", "Chargement complet de la sauvegarde")
+
 class StorageManager:
-    def __init__(self, filename="data.json"):
+    def __init__(self, filename="data.json", archive_dir=None, compact=False):
         self.filename = filename
+        # compact : JSON sur une ligne (plus petit et plus rapide), sinon indenté et lisible
+        self.compact = compact
+        # Locations clôturées anciennes : data.json -> data_archive/rentals-AAAA-MM.jsonl
+        self.archive_dir = archive_dir or os.path.splitext(filename)[0] + "_archive"
+        # Grand livre du CA (jours x classes), sauvegardé à côté : data_ledger.npz
+        self.ledger_file = os.path.splitext(filename)[0] + "_ledger.npz"
 
     def save_system(self, system):
         """Sauvegarde tout : Flotte, Clients, Locations"""
+        try:
+            # Seules les locations actives et récentes restent dans data.json
+            system.archive_closed_rentals()
+            self.write_snapshot(self.snapshot(system))
+        except Exception as e:
+            print(f"❌ Erreur Save : {e}")
+
+    def snapshot(self, system) -> tuple:
+        """
+        Copie de tout ce qui doit être écrit, prise d'un coup : l'écriture
+        (write_snapshot) peut ensuite se faire dans un autre thread.
+        Aucun fichier touché ici : l'archivage est une étape à part (save_system, PersistenceWriter).
+        """
+        start = time.perf_counter()
         data = {
             "fleet": [v.to_dict() for v in system.fleet],
             "customers": [c.to_dict() for c in system.customers],
-            "rentals": [r.to_dict() for r in system.rentals]
+            "rentals": [r.to_dict() for r in system.rentals],
+            "last_rental_id": system.last_rental_id,
+            "version": system.version,
+            "changes": system.changes.to_dict()
         }
+        snapshot = data, system.ledger.state()
+        SNAPSHOT_SECONDS.observe(time.perf_counter() - start)
+        return snapshot
+
+    def write_snapshot(self, snapshot: tuple):
+        data, ledger_state = snapshot
+        start = time.perf_counter()
+        # Fichier temporaire puis remplacement : jamais de data.json à moitié écrit
+        tmp = self.filename + ".tmp"
+        with open(tmp, 'wb') as f:
+            written = f.write(dumps(data, indent=not self.compact))
+        os.replace(tmp, self.filename)
+        # Même version que data.json : un grand livre resté d'avant (arrêt entre les deux) est reconnu au chargement
+        RevenueLedger.write(self.ledger_file, ledger_state, data["version"])
+        SAVE_SECONDS.observe(time.perf_counter() - start)
+        SAVED_BYTES.inc(written + os.path.getsize(self.ledger_file))
+
+    def load_system(self, columnar=False):
+        """Charge tout et retourne un objet CarRentalSystem prêt à l'emploi"""
+        start = time.perf_counter()
         try:
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
-        except Exception as e:
-            print(f"❌ Erreur Save : {e}")
+            return self._load_system(columnar)
+        finally:
+            LOAD_SECONDS.observe(time.perf_counter() - start)
 
-    def load_system(self):
-        """Charge tout et retourne un objet CarRentalSystem prêt à l'emploi"""
-        system = CarRentalSystem()
+    def _load_system(self, columnar):
+        system = CarRentalSystem(columnar=columnar)
+        system.archive = RentalArchive(self.archive_dir)
 
         try:
-            with open(self.filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.filename, 'rb') as f:
+                data = loads(f.read())
         except FileNotFoundError:
+            system.rebuild_ledger()
             return system
         
+        # Reconstruction de l'état sauvegardé : aucun événement à publier
+        system.events.recording = False
+
         # ==========================================
         # 1. CHARGEMENT DE LA FLOTTE
         # ==========================================
@@ -44,51 +99,19 @@ class StorageManager:
         fleet_map = {}
 
         for item in fleet_data:
-            typ = item.get("type")
-            tid = item["id"]
-            rate = item["daily_rate"]
-            obj = None
-
-            if typ=="Car": obj=Car(tid,rate,item["brand"],item["model"],item["license_plate"],item.get("year",2020),item["door_count"],item["has_ac"])
-            elif typ=="Truck": obj=Truck(tid,rate,item["brand"],item["model"],item["license_plate"],item.get("year",2020),item["cargo_volume"],item["max_weight"])
-            elif typ=="Motorcycle": obj=Motorcycle(tid,rate,item["brand"],item["model"],item["license_plate"],item.get("year",2020),item["engine_displacement"],item["has_top_case"])
-            elif typ=="Hearse": obj=Hearse(tid,rate,item["brand"],item["model"],item["license_plate"],item.get("year",2020),item["max_coffin_length"],item["has_refrigeration"])
-            elif typ=="GoKart": obj=GoKart(tid,rate,item["brand"],item["model"],item["license_plate"],item.get("year",2020),item["engine_type"],item["is_indoor"])
-            elif typ=="Boat": obj=Boat(tid,rate,item["brand"],item["model"],item["license_plate"],item.get("year",2020),item["length_meters"],item["power_cv"])
-            elif typ=="Submarine": obj=Submarine(tid,rate,item["brand"],item["model"],item["license_plate"],item.get("year",2020),item["max_depth"],item["is_nuclear"])
-            elif typ=="Plane": obj=Plane(tid,rate,item["brand"],item["model"],item["license_plate"],item.get("year",2020),item["wingspan"],item["engines_count"])
-            elif typ=="Helicopter": obj=Helicopter(tid,rate,item["brand"],item["model"],item["license_plate"],item.get("year",2020),item["rotor_count"],item["max_altitude"])
-
-            elif typ=="Horse": obj=Horse(tid,rate,item["name"],item["breed"],item.get("age",5),item["wither_height"],item.get("shoe_size_front",0),item.get("shoe_size_rear",0))
-            elif typ=="Donkey": obj=Donkey(tid,rate,item["name"],item["breed"],item.get("age",5),item["pack_capacity_kg"],item["is_stubborn"])
-            elif typ=="Camel": obj=Camel(tid,rate,item["name"],item["breed"],item.get("age",5),item["hump_count"],item["water_reserve"])
-            elif typ=="Whale": obj=Whale(tid,rate,item["name"],item["breed"],item.get("age",10),item["weight_tonnes"],item["can_sing"])
-            elif typ=="Dolphin": obj=Dolphin(tid,rate,item["name"],item["breed"],item.get("age",5),item["swim_speed"],item["knows_tricks"])
-            elif typ=="Eagle": obj=Eagle(tid,rate,item["name"],item["breed"],item.get("age",5),item["wingspan_cm"],item["max_altitude"])
-            elif typ=="Dragon": obj=Dragon(tid,rate,item["name"],item["breed"],item.get("age",100),item["fire_range"],item["scale_color"])
-
-            elif typ=="Carriage": obj=Carriage(tid,rate,item["seat_count"],item["has_roof"])
-            elif typ=="Cart": obj=Cart(tid,rate,item["seat_count"],item["max_load_kg"])
-
-            if obj:
-                for s in VehicleStatus:
-                    if s.value == item.get("status"): obj.status = s
-
-                for l in item.get("maintenance_log",[]):
-                    y,m,d = map(int, l["date"].split('-'))
-                    mt = next((t for t in MaintenanceType if t.value==l["type"]), None)
-                    if mt: obj.add_maintenance(Maintenance(l["id"], date(y,m,d), mt, l["cost"], l["description"], l.get("duration",1.0)))
-
-                system.fleet.append(obj)
+            cls = CLASS_BY_NAME.get(item.get("type"))
+            if cls:
+                # Décodeur "à plat" généré depuis le schéma de la classe (fleet/schema.py)
+                obj = cls.from_dict(item)
+                system.add_vehicle(obj)
+                # En mode colonnaire, l'objet suivi est la vue créée par le stockage
+                obj = system.fleet[-1]
                 fleet_map[obj.id] = obj
-        
-        for item in fleet_data:
-            if item.get("animal_ids"):
-                vehicle = fleet_map.get(item["id"])
-                if vehicle:
-                    for aid in item["animal_ids"]:
-                        anim = fleet_map.get(aid)
-                        if anim: vehicle.animals.append(anim)
+
+                # Attelages reconstruits dans la même passe (liens en attente si l'animal vient après)
+                for aid in item.get("animal_ids", ()):
+                    system.harness.expect(obj, aid, fleet_map)
+                system.harness.resolve(obj)
 
         # ==========================================
         # 2. CHARGEMENT DES CLIENTS
@@ -120,20 +143,70 @@ class StorageManager:
         # 3. CHARGEMENT DES LOCATIONS
         # ==========================================
         rent_data = data.get("rentals", [])
+        # Les clôturées hors horizon vont directement dans l'archive, sans créer d'objet Rental
+        cutoff = (date.today() - timedelta(days=system.archive_horizon_days)).isoformat()
+        cold = []
+        last_id = max(data.get("last_rental_id", 0), system.archive.last_id(),
+                      max((r.get("id", 0) for r in rent_data), default=0))
+        changes = data.get("changes") or {}
+        rental_versions = changes.get("rentals", {})
+
+        # Anciennes sauvegardes (ids absents, nuls ou en double) : id neuf, puis tri par id
+        # (find_rental et la pagination cherchent par dichotomie dans system.rentals)
+        seen = set()
+        renumbered = False
+        for r in rent_data:
+            if r.get("id", 0) <= 0 or r["id"] in seen:
+                last_id += 1
+                r["id"] = last_id
+                renumbered = True
+            seen.add(r["id"])
+        rent_data.sort(key=lambda r: r["id"])
 
         for r in rent_data:
+            returned = r.get("actual_return_date")
+            if not r["is_active"] and returned and returned < cutoff:
+                # Part dans l'archive avec la version de sa dernière modification
+                r["version"] = rental_versions.get(str(r["id"]), 0)
+                cold.append(r)
+                continue
+
             veh = fleet_map.get(r["vehicle_id"])
             cust = customer_map.get(r["customer_id"])
 
             if veh and cust:
-                y1, m1, d1 = map(int, r["start_date"].split('-'))
-                y2, m2, d2 = map(int, r["end_date"].split('-'))
-
-                new_rental = Rental(cust, veh, r["start_date"], r["end_date"], from_history=True)
-
-                new_rental.id = r.get("id", len(system.rentals) + 1)
-                new_rental.is_active = r["is_active"]
+                # Une seule conversion par date (parseur ISO en cache), sans revalidation
+                new_rental = Rental.restore(
+                    cust, veh,
+                    parse_iso_date(r["start_date"]),
+                    parse_iso_date(r["end_date"]),
+                    rental_id=r["id"],
+                    is_active=r["is_active"],
+                    actual_return_date=parse_iso_date(returned) if returned else None,
+                    total_cost=r.get("total_cost", 0.0),
+                    penalty=r.get("penalty", 0.0),
+                )
                 system.rentals.append(new_rental)
 
+        system.last_rental_id = last_id
+        # Version et journal des modifications tels que sauvegardés (le chargement lui-même ne compte pas)
+        system.changes.load(changes)
+        system.version = data.get("version", 0)
+        # Les événements d'avant le chargement ne sont plus connus
+        system.events.floor = system.version
+        system.events.recording = True
+        if cold:
+            system.archive.append(cold)
+            for r in cold:
+                system.changes.pop("rentals", r["id"])
+        # Grand livre absent (ancienne sauvegarde) ou d'une autre version que data.json :
+        # reconstruit une fois depuis l'historique
+        rebuilt = not system.ledger.load(self.ledger_file, system.version)
+        if rebuilt:
+            system.rebuild_ledger()
+        if cold or rebuilt or renumbered:
+            # data.json sans ce qui vient d'être archivé, ids corrigés, grand livre écrit sur disque
+            self.save_system(system)
+
         print(f"📂 Chargement complet OK")
         return system
\ No newline at end of file
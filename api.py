@@ -1,21 +1,114 @@
+import asyncio
+import math
+import os
+import tempfile
+from contextlib import asynccontextmanager
 import uvicorn
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import List, Optional
+from datetime import date
 
 # Vos imports
-from CarRentalSystem.location.system import CarRentalSystem
 from CarRentalSystem.storage import StorageManager
-from CarRentalSystem.location.rental import Rental
+from CarRentalSystem.persistence import PersistenceWriter, Durability, lock_data_file
+from CarRentalSystem.response_cache import ResponseCache, FastJSONResponse
+from CarRentalSystem.exports import EXPORTS, ndjson_chunks
+from CarRentalSystem.idempotency import IdempotencyStore
+from CarRentalSystem.admission import RateLimiter, AdmissionQueue, Overloaded
+from CarRentalSystem import sse
+# Mêmes modules que ceux du stockage (import "fleet.*", "location.*") : un seul PRICING
+from location.system import CarRentalSystem
+from location.rental import Rental
+from location.invoices import export_invoices
+from fleet.registry import CLASS_BY_NAME, ENVIRONMENTS
+from fleet.enums import VehicleStatus, MaintenanceType
+from fleet.maintenance import Maintenance
+# Registre partagé avec storage / persistence / admission (même module, donc mêmes séries)
+from metrics import METRICS, CONTENT_TYPE, MetricsMiddleware
 
 # 1. Initialisation
-app = FastAPI(title="Rent-A-Dream API 🚀")
-storage = StorageManager("data.json")
+# Sauvegardes fréquentes (écrivain en arrière-plan) : JSON compact
+storage = StorageManager("data.json", compact=True)
+# Ce processus est le seul propriétaire de data.json (plusieurs workers : serve.py)
+owner_lock = lock_data_file(storage.filename)
 system = storage.load_system()
 
 if system is None:
     system = CarRentalSystem()
 
+# Les routes modifient la mémoire puis confient la sauvegarde à un écrivain unique
+writer = PersistenceWriter(storage, system)
+# Réponses des routes de lecture déjà sérialisées, valables tant que system.version ne bouge pas
+responses = ResponseCache(system)
+# Réponses des créations / retours par Idempotency-Key : une nouvelle tentative ne refait rien
+idempotency = IdempotencyStore()
+# Routes qui modifient : débit limité par client, et file bornée devant le système et l'écrivain
+limiter = RateLimiter()
+admission = AdmissionQueue()
+
+@asynccontextmanager
+async def lifespan(app):
+    yield
+    await writer.close()
+
+app = FastAPI(title="Rent-A-Dream API 🚀", lifespan=lifespan, default_response_class=FastJSONResponse)
+# Nombre et durée des requêtes par route (GET /metrics)
+app.add_middleware(MetricsMiddleware)
+
+# Séries lues au moment de la collecte : état du système et compteurs des composants de l'API
+METRICS.gauge("fleet_vehicles", "Véhicules de la flotte par statut", ("status",),
+              lambda: [((status.value,), n) for status, n in system.status_counts().items()])
+METRICS.gauge("rentals_active", "Locations en cours", (), lambda: [((), system.active_rental_counts()[0])])
+METRICS.gauge("rentals_overdue", "Locations en cours dont la date de fin est passée", (),
+              lambda: [((), system.active_rental_counts()[1])])
+METRICS.gauge("admission_in_flight", "Requêtes en cours de traitement (routes qui modifient)", (),
+              lambda: [((), admission.in_flight)])
+METRICS.gauge("admission_queued", "Requêtes en attente dans la file d'admission", (),
+              lambda: [((), admission.queued)])
+METRICS.counter("admission_rejected_total", "Requêtes refusées avant traitement", ("reason",),
+                lambda: [(("rate_limited",), limiter.rejected), (("overloaded",), admission.rejected)])
+METRICS.counter("persistence_writes_total", "Écritures disque faites par l'écrivain", (),
+                lambda: [((), writer.writes)])
+METRICS.counter("idempotent_replays_total", "Réponses rejouées pour une Idempotency-Key connue", (),
+                lambda: [((), idempotency.replays)])
+METRICS.counter("response_cache_requests_total", "Lectures servies depuis le cache de réponses ou reconstruites",
+                ("result",), lambda: [(("hit",), responses.hits), (("miss",), responses.misses)])
+
+async def persist(durability: Durability, **changed):
+    """
+    Sauvegarde au niveau demandé : "memory" répond tout de suite, "disk" attend l'écriture.
+    changed : ids modifiés hors des méthodes du système (journal des exports incrémentaux).
+    """
+    # Toute route qui modifie passe par ici : les réponses en cache deviennent périmées
+    system.touch(**changed)
+    try:
+        await writer.commit(durability)
+    except Exception:
+        raise HTTPException(status_code=503, detail="Modification faite mais sauvegarde impossible")
+
+async def admit(request: Request, x_api_key: Optional[str] = Header(None)):
+    """Dépendance des routes qui modifient : 429 si le client dépasse son débit, 503 si la file est pleine."""
+    if request.client is not None:
+        address = request.client.host
+    else:
+        # Servi sur la socket Unix (serve.py) : seuls les workers locaux s'y connectent
+        address = request.headers.get("x-forwarded-for", "inconnu")
+    client = x_api_key or address
+    wait = limiter.check(client)
+    if wait:
+        raise HTTPException(status_code=429, detail="Trop de requêtes, réessayez plus tard",
+                            headers={"Retry-After": str(math.ceil(wait))})
+    try:
+        async with admission.slot():
+            yield
+    except Overloaded as e:
+        raise HTTPException(status_code=503, detail="Serveur surchargé, réessayez plus tard",
+                            headers={"Retry-After": str(e.retry_after)})
+
 # 2. Modèles de données (Le contrat d'interface)
 # Ce sont les données que le Streamlit doit envoyer pour créer une location
 class RentalRequest(BaseModel):
@@ -24,72 +117,355 @@ class RentalRequest(BaseModel):
     start_date: str  # Format YYYY-MM-DD
     end_date: str    # Format YYYY-MM-DD
 
+# Une ligne de la clôture de fin de journée
+class ReturnRequest(BaseModel):
+    rental_id: int
+    return_date: str  # Format YYYY-MM-DD
+
+# Devis groupés : une liste d'ids OU un filtre sur la flotte, et une ou plusieurs périodes
+class QuoteWindow(BaseModel):
+    start_date: str  # Format YYYY-MM-DD
+    end_date: str    # Format YYYY-MM-DD
+
+class QuoteRequest(BaseModel):
+    windows: List[QuoteWindow]
+    vehicle_ids: Optional[List[int]] = None
+    vehicle_type: Optional[str] = None  # Nom de classe, ex : "Car", "Dragon"
+    max_price: Optional[float] = None
+    available_only: bool = False
+
+# Intervention d'entretien sur un véhicule
+class MaintenanceRequest(BaseModel):
+    type: str  # Valeur de MaintenanceType, ex : "Vidange"
+    cost: float
+    description: str = ""
+    duration: float = 1.0  # Jours d'immobilisation
+    immobilize: bool = True
+
 # --- ROUTES (ENDPOINTS) ---
 
 @app.get("/")
-def home():
+async def home():
     return {"message": "API Rent-A-Dream opérationnelle !"}
 
+@app.get("/metrics")
+async def get_metrics():
+    """Métriques au format texte Prometheus (à collecter en local)."""
+    return PlainTextResponse(METRICS.render(), media_type=CONTENT_TYPE)
+
+@app.get("/admission")
+async def get_admission():
+    """Compteurs du contrôle d'admission (file des routes qui modifient, refus pour débit)."""
+    return {**admission.stats(), "rate_limited": limiter.rejected}
+
+SSE_KEEPALIVE_SECONDS = 15
+
+# --- Pages : ?after=<dernier id reçu>&limit=..., et ?fields=id,status,... pour ne garder que ces champs ---
+MAX_PAGE_SIZE = 1000
+
+def page_response(items, next_after, fields: Optional[str]):
+    keep = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+    rows = []
+    for item in items:
+        d = item.to_dict()
+        rows.append(d if keep is None else {k: d[k] for k in keep if k in d})
+    return {"items": rows, "next_after": next_after}
+
+def parse_status(value: str) -> VehicleStatus:
+    """Nom (AVAILABLE) ou libellé (Disponible) d'un statut."""
+    for status in VehicleStatus:
+        if value.upper() == status.name or value == status.value:
+            return status
+    raise HTTPException(status_code=400, detail=f"Statut inconnu : {value}")
+
 @app.get("/fleet")
-def get_fleet():
-    """Renvoie tout le parc en JSON."""
-    return [v.to_dict() for v in system.fleet]
+async def get_fleet(request: Request, after: Optional[int] = None, limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+                    status: Optional[str] = None, vehicle_type: Optional[List[str]] = Query(None),
+                    environment: Optional[str] = None, min_price: Optional[float] = None,
+                    max_price: Optional[float] = None, fields: Optional[str] = None):
+    """Une page du parc (par id croissant), filtrée par statut, type(s), milieu et prix."""
+    vehicle_types = None
+    if environment:
+        if environment.lower() not in ENVIRONMENTS:
+            raise HTTPException(status_code=400, detail=f"Milieu inconnu : {environment} (terre, mer, air)")
+        vehicle_types = list(ENVIRONMENTS[environment.lower()])
+    if vehicle_type:
+        unknown = [name for name in vehicle_type if name not in CLASS_BY_NAME]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Types inconnus : {unknown}")
+        wanted = [CLASS_BY_NAME[name] for name in vehicle_type]
+        vehicle_types = wanted if vehicle_types is None else [cls for cls in wanted if cls in vehicle_types]
 
-@app.get("/customers")
-def get_customers():
-    """Renvoie tous les clients."""
-    return [c.to_dict() for c in system.customers]
+    status_filter = parse_status(status) if status else None
+    return responses.respond(request, lambda: page_response(
+        *system.page_vehicles(after, limit, vehicle_types, status_filter, min_price, max_price), fields))
 
-@app.get("/rentals")
-def get_rentals():
-    """Renvoie toutes les locations (pour l'admin)."""
-    # Assurez-vous d'avoir ajouté to_dict() dans la classe Rental !
-    return [r.to_dict() for r in system.rentals] 
-
-@app.post("/rentals/")
-def create_rental(data: RentalRequest):
-    """Crée une nouvelle location."""
-    # 1. On cherche les objets réels à partir des IDs reçus
-    customer = next((c for c in system.customers if c.id == data.customer_id), None)
-    vehicle = next((v for v in system.fleet if v.id == data.vehicle_id), None)
+@app.get("/customers")
+async def get_customers(request: Request, after: Optional[int] = None,
+                        limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE), fields: Optional[str] = None):
+    """Une page des clients (par id croissant)."""
+    return responses.respond(request, lambda: page_response(*system.page_customers(after, limit), fields))
 
+@app.get("/customers/{customer_id}/eligible-vehicles")
+async def get_eligible_vehicles(customer_id: int, start_date: Optional[str] = None, end_date: Optional[str] = None):
+    """Renvoie les véhicules que ce client a le droit de louer (âge, permis, période)."""
+    customer = system.find_customer(customer_id)
     if not customer:
         raise HTTPException(status_code=404, detail="Client introuvable")
-    if not vehicle:
-        raise HTTPException(status_code=404, detail="Véhicule introuvable")
-    
+
     try:
-        # 2. On utilise votre classe Rental existante
-        new_rental = Rental(customer, vehicle, data.start_date, data.end_date)
-        system.rentals.append(new_rental)
-        
-        # 3. On sauvegarde immédiatement
-        storage.save_system(system)
-        
-        return {
-            "message": "Location créée", 
-            "cost": new_rental.total_cost,
-            "rental_id": len(system.rentals) # Ou un vrai ID si vous en avez mis un
-        }
+        window = None
+        if start_date and end_date:
+            window = (date.fromisoformat(start_date), date.fromisoformat(end_date))
+        return FastJSONResponse([v.to_dict() for v in system.eligible_vehicles(customer, window)])
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@app.post("/rentals/{rental_index}/return")
-def return_vehicle(rental_index: int, return_date: str):
-    """Clôture une location."""
+@app.post("/quotes")
+async def get_quotes(data: QuoteRequest):
+    """Prix et disponibilité de chaque véhicule demandé pour chaque période (une seule passe)."""
     try:
-        if rental_index < 0 or rental_index >= len(system.rentals):
-            raise HTTPException(status_code=404, detail="Location introuvable")
-            
-        rental = system.rentals[rental_index]
-        final_cost = rental.close_rental(return_date)
-        storage.save_system(system)
-        
-        return {"message": "Retour validé", "final_cost": final_cost, "penalty": rental.penalty}
-        
+        windows = [(date.fromisoformat(w.start_date), date.fromisoformat(w.end_date)) for w in data.windows]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Format de date invalide. Utilisez AAAA-MM-JJ")
+
+    if data.vehicle_ids is not None:
+        vehicles = [system.find_vehicle(v_id) for v_id in data.vehicle_ids]
+        missing = [v_id for v_id, v in zip(data.vehicle_ids, vehicles) if v is None]
+        if missing:
+            raise HTTPException(status_code=404, detail=f"Véhicules introuvables : {missing}")
+    else:
+        vehicle_type = None
+        if data.vehicle_type:
+            vehicle_type = CLASS_BY_NAME.get(data.vehicle_type)
+            if vehicle_type is None:
+                raise HTTPException(status_code=400, detail=f"Type inconnu : {data.vehicle_type}")
+        vehicles = system.search_vehicles(vehicle_type, data.available_only, data.max_price)
+
+    try:
+        prices, available = system.quote_matrix(vehicles, windows)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    # Renvoyée telle quelle (sans jsonable_encoder) : les tableaux NumPy sont encodés directement
+    return FastJSONResponse({
+        "windows": [{"start_date": s.isoformat(), "end_date": e.isoformat()} for s, e in windows],
+        "vehicle_ids": [v.id for v in vehicles],
+        "prices": prices.round(2),
+        "available": available,
+    })
+
+@app.get("/rentals")
+async def get_rentals(request: Request, after: Optional[int] = None, limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+                      customer_id: Optional[int] = None, vehicle_id: Optional[int] = None,
+                      active: Optional[bool] = None, fields: Optional[str] = None):
+    """Une page des locations en mémoire (pour l'admin), filtrable par client, véhicule et état."""
+    return responses.respond(request, lambda: page_response(
+        *system.page_rentals(after, limit, customer_id, vehicle_id, active), fields))
+
+@app.post("/rentals/", dependencies=[Depends(admit)])
+async def create_rental(data: RentalRequest, durability: Durability = Durability.DISK,
+                        idempotency_key: Optional[str] = Header(None)):
+    """Crée une nouvelle location (avec Idempotency-Key, une nouvelle tentative renvoie la même réponse)."""
+    async def handler():
+        # 1. On cherche les objets réels à partir des IDs reçus
+        customer = next((c for c in system.customers if c.id == data.customer_id), None)
+        vehicle = next((v for v in system.fleet if v.id == data.vehicle_id), None)
+
+        if not customer:
+            raise HTTPException(status_code=404, detail="Client introuvable")
+        if not vehicle:
+            raise HTTPException(status_code=404, detail="Véhicule introuvable")
+
+        try:
+            # 2. On utilise votre classe Rental existante
+            new_rental = Rental(customer, vehicle, data.start_date, data.end_date)
+            system.add_rental(new_rental)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        return {
+            "message": "Location créée",
+            "cost": new_rental.total_cost,
+            "rental_id": new_rental.id
+        }
+
+    async def save(result):
+        # 3. On sauvegarde (écrivain en arrière-plan), une fois la réponse gardée
+        await persist(durability)
+
+    return await idempotency.run(idempotency_key, ("POST /rentals/", data.model_dump(), durability), handler, save)
+
+@app.post("/rentals/{rental_id}/return", dependencies=[Depends(admit)])
+async def return_vehicle(rental_id: int, return_date: str, durability: Durability = Durability.DISK,
+                         idempotency_key: Optional[str] = Header(None)):
+    """Clôture une location (par id : l'archivage déplace les locations dans la liste)."""
+    async def handler():
+        try:
+            rental = system.find_rental(rental_id)
+            if rental is None:
+                raise HTTPException(status_code=404, detail="Location introuvable")
+            if not rental.is_active:
+                raise HTTPException(status_code=409, detail="Location déjà terminée")
+            final_cost = system.close_rental(rental, return_date)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        return {"message": "Retour validé", "final_cost": final_cost, "penalty": rental.penalty}
+
+    async def save(result):
+        await persist(durability)
+
+    return await idempotency.run(idempotency_key, ("POST /rentals/{rental_id}/return", rental_id, return_date,
+                                                   durability), handler, save)
+
+@app.post("/rentals/returns", dependencies=[Depends(admit)])
+async def close_rentals(returns: List[ReturnRequest], durability: Durability = Durability.DISK,
+                        idempotency_key: Optional[str] = Header(None)):
+    """Clôture de fin de journée : tous les retours du lot, une seule sauvegarde."""
+    async def handler():
+        summary = system.close_rentals((r.rental_id, r.return_date) for r in returns)
+        summary["errors"] = [{"rental_id": rid, "detail": msg} for rid, msg in summary["errors"]]
+        return summary
+
+    async def save(summary):
+        if summary["closed"]:
+            await persist(durability)
+
+    return await idempotency.run(idempotency_key, ("POST /rentals/returns", [r.model_dump() for r in returns],
+                                                   durability), handler, save)
+
+@app.post("/fleet/{vehicle_id}/maintenance", dependencies=[Depends(admit)])
+async def add_maintenance(vehicle_id: int, data: MaintenanceRequest, durability: Durability = Durability.DISK):
+    """Enregistre une intervention (et immobilise le véhicule si demandé)."""
+    vehicle = system.find_vehicle(vehicle_id)
+    if vehicle is None:
+        raise HTTPException(status_code=404, detail="Véhicule introuvable")
+    m_type = next((t for t in MaintenanceType if t.value == data.type), None)
+    if m_type is None:
+        raise HTTPException(status_code=400, detail=f"Type inconnu : {data.type}")
+
+    maintenance = Maintenance(len(vehicle.maintenance_log) + 1, date.today(), m_type, data.cost,
+                              data.description, data.duration)
+    system.add_maintenance(vehicle, maintenance, immobilize=data.immobilize)
+    await persist(durability)
+    return {"message": "Intervention enregistrée", "vehicle_id": vehicle.id, "status": vehicle.status}
+
+@app.post("/fleet/{vehicle_id}/status", dependencies=[Depends(admit)])
+async def set_vehicle_status(vehicle_id: int, status: str, durability: Durability = Durability.DISK):
+    """Change le statut d'un véhicule (ex : remise en service après maintenance)."""
+    vehicle = system.find_vehicle(vehicle_id)
+    if vehicle is None:
+        raise HTTPException(status_code=404, detail="Véhicule introuvable")
+    system.set_vehicle_status(vehicle, parse_status(status))
+    await persist(durability)
+    return {"vehicle_id": vehicle.id, "status": vehicle.status}
+
+@app.get("/reports/revenue")
+async def get_revenue_report(request: Request, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                             vehicle_type: Optional[List[str]] = Query(None)):
+    """CA, pénalités et nombre de retours sur la période (grand livre), filtrables par classe(s)."""
+    vehicle_types = None
+    if vehicle_type:
+        unknown = [name for name in vehicle_type if name not in CLASS_BY_NAME]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Types inconnus : {unknown}")
+        vehicle_types = [CLASS_BY_NAME[name] for name in vehicle_type]
+
+    def build():
+        try:
+            report = system.revenue_report(start_date, end_date, vehicle_types)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return {"start_date": start_date, "end_date": end_date, **report}
+
+    return responses.respond(request, build)
+
+@app.get("/invoices/export")
+async def export_invoices_file(start_date: Optional[str] = None, end_date: Optional[str] = None, format: str = "zip"):
+    """Toutes les factures des retours de la période, en un .zip (une facture par fichier) ou un .txt."""
+    if format not in ("zip", "txt"):
+        raise HTTPException(status_code=400, detail="Format attendu : zip ou txt")
+    try:
+        start = date.fromisoformat(start_date) if start_date else None
+        end = date.fromisoformat(end_date) if end_date else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Format de date invalide. Utilisez AAAA-MM-JJ")
+
+    # Écrit sur disque au fil du rendu, puis envoyé et supprimé
+    fd, path = tempfile.mkstemp(suffix=f".{format}")
+    os.close(fd)
+    # Locations en mémoire, plus celles de la période déjà parties dans l'archive
+    rentals = list(system.rentals)
+    archived = system.archived_invoice_records(start, end, skip=[r.id for r in rentals])
+    # Rendu long (et lecture de l'archive) : hors de la boucle d'événements
+    await run_in_threadpool(export_invoices, rentals, path, start, end, None, archived)
+    return FileResponse(path, filename=f"factures.{format}", background=BackgroundTask(os.remove, path))
+
+@app.get("/export/{entity}.ndjson")
+async def export_ndjson(entity: str, since: Optional[int] = Query(None, ge=0)):
+    """
+    Export NDJSON en flux (fleet, rentals, maintenance). since : seulement ce
+    qui a changé après cette version ; l'en-tête X-Change-Version donne la
+    version à repasser au prochain export.
+    """
+    if entity not in EXPORTS:
+        raise HTTPException(status_code=404, detail=f"Export inconnu. Disponibles : {sorted(EXPORTS)}")
+    version = system.version
+
+    async def stream():
+        for chunk in ndjson_chunks(EXPORTS[entity](system, since)):
+            yield chunk
+            # Rend la main entre deux morceaux : les autres requêtes ne sont pas bloquées
+            await asyncio.sleep(0)
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson",
+                             headers={"X-Change-Version": str(version)})
+
+@app.get("/events")
+async def stream_events(since: Optional[int] = Query(None, ge=0), last_event_id: Optional[str] = Header(None)):
+    """
+    Flux Server-Sent Events des modifications : vehicle_added / vehicle_removed /
+    vehicle_status / vehicle_harnessed / maintenance / rental_created / rental_returned.
+    L'id d'un événement est la version du système ; un client qui se reconnecte
+    (en-tête Last-Event-ID, ou ?since=) reçoit ce qu'il a manqué. Si ce n'est plus
+    possible, un événement "reset" donne la version à partir de laquelle tout
+    relire (ex : /export/{entity}.ndjson?since=<ancien id>).
+    """
+    cursor = system.version
+    if last_event_id and last_event_id.isdigit():
+        cursor = int(last_event_id)
+    elif since is not None:
+        cursor = since
+
+    async def stream():
+        nonlocal cursor
+        wake = asyncio.Event()
+        system.events.subscribe(wake.set)
+        try:
+            yield f"retry: {sse.RETRY_MS}\n\n".encode()
+            while True:
+                events = system.events.after(cursor)
+                if events is None or cursor > system.version:
+                    yield sse.message("reset", {"from": cursor, "version": system.version}, system.version)
+                    cursor = system.version
+                    continue
+                if events:
+                    yield sse.format_events(events)
+                    cursor = events[-1][0]
+                    continue
+                # Rien de nouveau : attente du prochain événement (ping pour garder la connexion)
+                wake.clear()
+                try:
+                    await asyncio.wait_for(wake.wait(), SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield sse.KEEPALIVE
+        finally:
+            system.events.unsubscribe(wake.set)
+
+    return StreamingResponse(stream(), media_type=sse.MEDIA_TYPE,
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
 # Lancement pour le débogage direct (facultatif)
 if __name__ == "__main__":
     uvicorn.run(app, host="127.0.0.1", port=8000)
\ No newline at end of file
@@ -0,0 +1,77 @@
+"""
+Benchmark du contrôle d'admission (CarRentalSystem/admission.py).
+
+Pendant une rafale d'un client agressif (N réservations simultanées, même
+clé d'API), un client normal fait 20 réservations. Compare, sans puis avec
+limites : statuts reçus par chacun et latence du client normal.
+
+Usage : python benchmarks/bench_admission.py [N]
+"""
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import date, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+for folder in (os.path.join(current_dir, "..", "CarRentalSystem"), os.path.join(current_dir, ".."), current_dir):
+    if folder not in sys.path:
+        sys.path.append(folder)
+
+import httpx
+
+from fleet.enums import VehicleStatus
+from bench_api_load import write_data, percentile
+
+REGULAR = 20
+
+async def burst(api, n):
+    start = date.today() + timedelta(days=1)
+    statuses = {"rafale": Counter(), "normal": Counter()}
+    latencies = []
+
+    async def book(client, vehicle_id, who):
+        payload = {"customer_id": 1, "vehicle_id": vehicle_id,
+                   "start_date": start.isoformat(), "end_date": (start + timedelta(days=3)).isoformat()}
+        t0 = time.perf_counter()
+        response = await client.post("/rentals/", json=payload, headers={"X-API-Key": who})
+        if who == "normal":
+            latencies.append(time.perf_counter() - t0)
+        statuses[who][response.status_code] += 1
+
+    transport = httpx.ASGITransport(app=api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        requests = [book(client, v, "rafale") for v in range(1, n + 1)]
+        requests += [book(client, v, "normal") for v in range(n + 1, n + REGULAR + 1)]
+        await asyncio.gather(*requests)
+        await api.writer.flush()
+    return statuses, latencies
+
+def main(n=1000):
+    with tempfile.TemporaryDirectory() as tmp:
+        write_data(os.path.join(tmp, "data.json"), n + REGULAR)
+        os.chdir(tmp)  # api.py charge ./data.json à l'import
+        with contextlib.redirect_stdout(io.StringIO()):
+            import api
+        limits = (api.limiter.rate, api.limiter.burst, api.admission.max_in_flight)
+
+        print(f"Rafale de {n} réservations + {REGULAR} d'un client normal")
+        for label, (rate, burst_size, in_flight) in (("sans limite", (float("inf"), float("inf"), n + REGULAR)),
+                                                      ("avec limites", limits)):
+            api.system.rentals.clear()
+            for v in api.system.fleet:
+                v.status = VehicleStatus.AVAILABLE
+            api.limiter.rate, api.limiter.burst, api.admission.max_in_flight = rate, burst_size, in_flight
+            api.limiter._buckets.clear()
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                statuses, latencies = asyncio.run(burst(api, n))
+            print(f"  {label:<13} rafale {dict(statuses['rafale'])}  normal {dict(statuses['normal'])}  "
+                  f"p99 normal {percentile(latencies, 99) * 1e3:>7.1f}ms")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
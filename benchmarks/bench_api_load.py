@@ -0,0 +1,95 @@
+"""
+Test de charge de l'API : N réservations simultanées (500 par défaut).
+
+Chaque requête réserve un véhicule différent. Mesure la latence (p50 / p99)
+pour les deux niveaux de durabilité, et le nombre d'écritures disque
+réellement faites (les modifications arrivées pendant une écriture partent
+ensemble dans la suivante).
+
+Usage : python benchmarks/bench_api_load.py [N]
+"""
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "..", "CarRentalSystem")
+for folder in (project_folder, os.path.join(current_dir, "..")):
+    if folder not in sys.path:
+        sys.path.append(folder)
+
+import httpx
+
+from fleet.vehicles import Car
+from fleet.enums import VehicleStatus
+from clients.customer import Customer
+
+def write_data(path, n):
+    cars = [Car(i, 40.0 + i % 60, "Peugeot", "208", f"AA-{i}", 2020, 5, True) for i in range(1, n + 1)]
+    client = Customer(1, "Doe", "John", 30, "B-1", "j@x", "06", "john", "pw")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"fleet": [c.to_dict() for c in cars], "customers": [client.to_dict()], "rentals": []}, f)
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+async def book_all(api, n, durability):
+    start = date.today() + timedelta(days=1)
+    latencies = []
+
+    async def book(client, vehicle_id):
+        payload = {"customer_id": 1, "vehicle_id": vehicle_id,
+                   "start_date": start.isoformat(), "end_date": (start + timedelta(days=3)).isoformat()}
+        t0 = time.perf_counter()
+        response = await client.post(f"/rentals/?durability={durability}", json=payload)
+        latencies.append(time.perf_counter() - t0)
+        assert response.status_code == 200, response.text
+
+    transport = httpx.ASGITransport(app=api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        writes = api.writer.writes
+        t0 = time.perf_counter()
+        await asyncio.gather(*(book(client, vehicle_id) for vehicle_id in range(1, n + 1)))
+        elapsed = time.perf_counter() - t0
+        await api.writer.flush()
+    return elapsed, latencies, api.writer.writes - writes
+
+def main(n=500):
+    with tempfile.TemporaryDirectory() as tmp:
+        write_data(os.path.join(tmp, "data.json"), n)
+        os.chdir(tmp)  # api.py charge ./data.json à l'import
+        with contextlib.redirect_stdout(io.StringIO()):
+            import api
+        # Mesure du débit brut : un seul client, sans limite ni file bornée (voir bench_admission.py)
+        api.limiter.rate = api.limiter.burst = float("inf")
+        api.admission.max_in_flight = n
+
+        print(f"{n} réservations simultanées (POST /rentals/)")
+        for durability in ("memory", "disk"):
+            # Remise à zéro entre deux passes
+            api.system.rentals.clear()
+            for v in api.system.fleet:
+                v.status = VehicleStatus.AVAILABLE
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                elapsed, latencies, writes = asyncio.run(book_all(api, n, durability))
+            print(f"  durabilité {durability:<7} total {elapsed:>6.2f}s  "
+                  f"p50 {percentile(latencies, 50) * 1e3:>7.1f}ms  p99 {percentile(latencies, 99) * 1e3:>7.1f}ms  "
+                  f"({writes} écritures disque)")
+
+        # Référence : l'ancienne route sauvegardait tout le système à chaque requête
+        t0 = time.perf_counter()
+        api.storage.save_system(api.system)
+        save = time.perf_counter() - t0
+        print(f"  ancien comportement : {n} sauvegardes de {save * 1e3:.1f}ms à la suite, "
+              f"soit ~{n * save:.1f}s pour la dernière requête")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
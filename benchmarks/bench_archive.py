@@ -0,0 +1,70 @@
+"""
+Benchmark : démarrage avec un long historique de locations.
+
+data.json contient N locations clôturées anciennes + 100 actives.
+1er chargement : migration (les anciennes partent dans l'archive mensuelle).
+Chargements suivants : seul l'ensemble actif est lu et hydraté.
+
+Usage : python benchmarks/bench_archive.py [N]
+"""
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "..", "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.vehicles import Car
+from clients.customer import Customer
+from storage import StorageManager
+
+def write_data(path, n_closed, n_active=100):
+    cars = [Car(i, 40.0 + i % 60, "Peugeot", "208", f"AA-{i}", 2020, 5, True) for i in range(1, 501)]
+    client = Customer(1, "Doe", "John", 30, "B-1", "j@x", "06", "john", "pw")
+    today = date.today()
+    rentals = []
+    for i in range(n_closed + n_active):
+        active = i >= n_closed
+        start = today - timedelta(days=2 if active else 120 + i % 1500)
+        end = start + timedelta(days=1 + i % 10)
+        rentals.append({
+            "id": i + 1, "customer_id": 1, "vehicle_id": 1 + i % 500,
+            "start_date": start.isoformat(), "end_date": end.isoformat(),
+            "actual_return_date": None if active else end.isoformat(),
+            "is_active": active, "total_cost": 0.0 if active else 100.0, "penalty": 0.0,
+        })
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"fleet": [c.to_dict() for c in cars], "customers": [client.to_dict()], "rentals": rentals}, f)
+
+def timed_load(storage):
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        system = storage.load_system()
+    return time.perf_counter() - t0, system
+
+def main(n=200_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "data.json")
+        write_data(path, n)
+        size_before = os.path.getsize(path)
+        storage = StorageManager(path)
+
+        first, system = timed_load(storage)
+        second, system = timed_load(storage)
+
+        print(f"Historique : {n:,} locations clôturées + 100 actives")
+        print(f"  1er chargement (migration vers l'archive) {first:>7.2f}s")
+        print(f"  chargements suivants                      {second:>7.2f}s  ({len(system.rentals)} locations en mémoire)")
+        print(f"  data.json : {size_before / 1e6:.1f} Mo -> {os.path.getsize(path) / 1e6:.2f} Mo, "
+              f"{len(system.archive.months())} partitions mensuelles")
+        print(f"  CA clôturé (index de l'archive) : {system.closed_revenue():,.0f}€")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,72 @@
+"""
+Microbenchmark des encodeurs/décodeurs générés par fleet/schema.py.
+
+Compare, pour chaque classe, le to_dict généré (un seul dict littéral) avec
+l'ancien schéma "super().to_dict() + d.update()", et le from_dict généré
+avec l'ancien chargement (constructeur + recherche du statut dans l'Enum).
+
+Usage : python benchmarks/bench_codec.py [N]
+"""
+import os
+import sys
+import timeit
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "..", "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.vehicles import Car
+from fleet.animals import Horse
+from fleet.enums import VehicleStatus
+
+# --- Ancienne implémentation (reproduite pour comparaison) ---
+def legacy_car_to_dict(v):
+    d = {"type": v.__class__.__name__, "id": v.id, "daily_rate": v.daily_rate,
+         "status": v.status.value, "maintenance_log": [m.to_dict() for m in v.maintenance_log]}
+    d.update({"brand": v.brand, "model": v.model, "license_plate": v.license_plate, "year": v.year})
+    d.update({"door_count": v.door_count, "has_ac": v.has_ac})
+    return d
+
+def legacy_horse_to_dict(v):
+    d = {"type": v.__class__.__name__, "id": v.id, "daily_rate": v.daily_rate,
+         "status": v.status.value, "maintenance_log": [m.to_dict() for m in v.maintenance_log]}
+    d.update({"name": v.name, "breed": v.breed})
+    d.update({"age": v.age, "wither_height": v.wither_height, "shoe_size_front": v.shoe_size_front, "shoe_size_rear": v.shoe_size_rear})
+    return d
+
+def legacy_car_from_dict(item):
+    obj = Car(item["id"], item["daily_rate"], item["brand"], item["model"], item["license_plate"], item.get("year", 2020), item["door_count"], item["has_ac"])
+    for s in VehicleStatus:
+        if s.value == item.get("status"): obj.status = s
+    return obj
+
+def legacy_horse_from_dict(item):
+    obj = Horse(item["id"], item["daily_rate"], item["name"], item["breed"], item.get("age", 5), item["wither_height"], item.get("shoe_size_front", 0), item.get("shoe_size_rear", 0))
+    for s in VehicleStatus:
+        if s.value == item.get("status"): obj.status = s
+    return obj
+
+def rate(func, arg, n):
+    seconds = min(timeit.repeat(lambda: func(arg), number=n, repeat=3))
+    return n / seconds
+
+def main(n=200_000):
+    car = Car(1, 50.0, "Peugeot", "208", "AA-123-BB", 2020, 5, True)
+    horse = Horse(2, 35.0, "Jolly", "Frison", 5, 160, 100, 100)
+    cases = [
+        ("Car", car, legacy_car_to_dict, legacy_car_from_dict),
+        ("Horse", horse, legacy_horse_to_dict, legacy_horse_from_dict),
+    ]
+
+    print(f"Débit (objets/s, {n} itérations)")
+    print(f"{'Classe':<8} {'Opération':<10} {'Avant':>12} {'Généré':>12} {'Gain':>7}")
+    for name, obj, legacy_enc, legacy_dec in cases:
+        item = obj.to_dict()
+        for op, old, new, arg in (("encode", legacy_enc, type(obj).to_dict, obj),
+                                  ("decode", legacy_dec, type(obj).from_dict, item)):
+            before, after = rate(old, arg, n), rate(new, arg, n)
+            print(f"{name:<8} {op:<10} {before:>12,.0f} {after:>12,.0f} {after / before:>6.2f}x")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,69 @@
+"""
+Benchmark de l'encodage JSON (CarRentalSystem/encoding.py).
+
+Sérialise toute la flotte (N éléments) et la liste des locations (N) :
+json standard indenté (ancienne sauvegarde), jsonable_encoder + json
+(chemin par défaut de FastAPI), puis encoding.dumps (orjson s'il est installé).
+
+Usage : python benchmarks/bench_encoding.py [N]
+"""
+import gc
+import json
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "..", "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fastapi.encoders import jsonable_encoder
+
+from fleet.vehicles import Car
+from fleet.animals import Horse
+from clients.customer import Customer
+from location.rental import Rental
+import encoding
+
+def build(n):
+    fleet = [Car(i, 40.0 + i % 60, "Peugeot", "208", f"AA-{i}", 2020, 5, True) if i % 2 else
+             Horse(i, 30.0 + i % 40, f"Cheval {i}", "Arabe", 5, 150, 10, 12) for i in range(1, n + 1)]
+    client = Customer(1, "Doe", "John", 30, "B-1", "j@x", "06", "john", "pw")
+    origin = date(2024, 1, 1)
+    rentals = [Rental.restore(client, fleet[i], origin + timedelta(days=i % 300),
+                              origin + timedelta(days=i % 300 + 3), rental_id=i + 1, is_active=True)
+               for i in range(n)]
+    return [v.to_dict() for v in fleet], [r.to_dict() for r in rentals]
+
+def timed(func):
+    gc.disable()
+    try:
+        t0 = time.perf_counter()
+        result = func()
+        return time.perf_counter() - t0, result
+    finally:
+        gc.enable()
+
+def main(n=100_000):
+    fleet, rentals = build(n)
+    cases = (
+        ("json indenté (sauvegarde)", lambda d: json.dumps(d, indent=4, ensure_ascii=False).encode("utf-8")),
+        ("jsonable_encoder + json (FastAPI)", lambda d: json.dumps(jsonable_encoder(d), ensure_ascii=False,
+                                                                   separators=(",", ":")).encode("utf-8")),
+        (f"encoding.dumps ({encoding.BACKEND})", encoding.dumps),
+        (f"encoding.dumps indenté ({encoding.BACKEND})", lambda d: encoding.dumps(d, indent=True)),
+    )
+    for label, data in (("flotte", fleet), ("locations", rentals)):
+        print(f"{label} : {n:,} éléments")
+        reference = None
+        for name, encode in cases:
+            elapsed, body = timed(lambda: encode(data))
+            reference = reference or elapsed
+            print(f"  {name:<36} {elapsed:>7.3f}s  {len(body) / 1e6:>6.1f} Mo  ({reference / elapsed:.1f}x)")
+        elapsed, _ = timed(lambda: encoding.loads(encoding.dumps(data)))
+        print(f"  {'aller-retour dumps + loads':<36} {elapsed:>7.3f}s")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,62 @@
+"""
+Benchmark de l'export NDJSON (CarRentalSystem/exports.py).
+
+Exporte N locations : d'un bloc (liste de dicts puis un seul tableau JSON,
+comme un client qui lirait GET /rentals en entier) puis en flux par morceaux.
+Compare le pic mémoire (tracemalloc) en plus des locations déjà chargées.
+
+Usage : python benchmarks/bench_export.py [N]
+"""
+import os
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "..", "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.vehicles import Car
+from clients.customer import Customer
+from location.rental import Rental
+from location.system import CarRentalSystem
+from encoding import dumps
+from exports import iter_rentals, ndjson_chunks
+
+def build(n):
+    system = CarRentalSystem()
+    client = Customer(1, "Doe", "John", 30, "B-1", "j@x", "06", "john", "pw")
+    car = Car(1, 50.0, "Peugeot", "208", "AA-1", 2020, 5, True)
+    origin = date(2024, 1, 1)
+    system.rentals = [Rental.restore(client, car, origin + timedelta(days=i % 300),
+                                     origin + timedelta(days=i % 300 + 3), rental_id=i + 1, is_active=True)
+                      for i in range(n)]
+    return system
+
+def measure(func):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    size = func()
+    elapsed = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, size
+
+def main(n=200_000):
+    system = build(n)
+
+    def whole():
+        return len(dumps([r.to_dict() for r in system.rentals]))
+
+    def streamed():
+        return sum(len(chunk) for chunk in ndjson_chunks(iter_rentals(system)))
+
+    print(f"Export de {n} locations")
+    for label, func in (("tableau JSON d'un bloc", whole), ("flux NDJSON", streamed)):
+        elapsed, peak, size = measure(func)
+        print(f"  {label:<24} {elapsed:>6.2f}s  pic mémoire {peak / 1e6:>8.1f} Mo  ({size / 1e6:.1f} Mo produits)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
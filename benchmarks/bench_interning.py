@@ -0,0 +1,99 @@
+"""
+Benchmark de l'internement des champs catégoriels sur une flotte synthétique.
+
+On génère N véhicules/animaux en JSON (comme data.json), on les relit avec
+json.loads (chaque valeur devient une nouvelle chaîne) puis on les construit
+avec les constructeurs de fleet/. On compare la mémoire des chaînes
+catégorielles retenues :
+  - avant : une chaîne par objet et par champ (ce que produisait le chargement)
+  - après : les instances partagées de la table de symboles
+
+Usage : python benchmarks/bench_interning.py [N]
+"""
+import json
+import os
+import random
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "..", "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.vehicles import Car, GoKart
+from fleet.animals import Horse, Dragon
+from fleet.symbols import SYMBOLS
+
+CATEGORICAL_FIELDS = ("brand", "model", "breed", "scale_color", "engine_type")
+
+BRANDS = {
+    "Peugeot": ["208", "308", "3008", "508"],
+    "Renault": ["Clio", "Megane", "Captur", "Austral"],
+    "Tesla": ["Model 3", "Model Y", "Model S", "Cybertruck"],
+    "Toyota": ["Yaris", "Corolla", "RAV4"],
+}
+HORSE_BREEDS = ["Shetland", "Pur-Sang Arabe", "Frison", "Percheron", "Mustang", "Selle Français"]
+DRAGON_BREEDS = ["Rouge de Feu", "Noir des Abysses", "Vert des Forêts", "Doré Impérial"]
+COLORS = ["Rouge", "Noir", "Vert", "Doré", "Blanc"]
+
+def synthetic_records(start, count, rng):
+    records = []
+    for i in range(start, start + count):
+        kind = rng.random()
+        if kind < 0.6:
+            brand = rng.choice(list(BRANDS))
+            records.append({"type": "Car", "id": i, "brand": brand, "model": rng.choice(BRANDS[brand]),
+                            "plate": f"AA-{i:07d}"})
+        elif kind < 0.7:
+            records.append({"type": "GoKart", "id": i, "brand": "Sodikart", "model": "RT8",
+                            "plate": f"K-{i:07d}", "engine_type": rng.choice(["2T", "4T", "Électrique"])})
+        elif kind < 0.95:
+            records.append({"type": "Horse", "id": i, "name": f"Cheval {i}", "breed": rng.choice(HORSE_BREEDS)})
+        else:
+            records.append({"type": "Dragon", "id": i, "name": f"Dragon {i}", "breed": rng.choice(DRAGON_BREEDS),
+                            "scale_color": rng.choice(COLORS)})
+    return records
+
+def build(item):
+    typ = item["type"]
+    if typ == "Car":
+        return Car(item["id"], 50.0, item["brand"], item["model"], item["plate"], 2020, 5, True)
+    if typ == "GoKart":
+        return GoKart(item["id"], 60.0, item["brand"], item["model"], item["plate"], 2022, item["engine_type"], True)
+    if typ == "Horse":
+        return Horse(item["id"], 35.0, item["name"], item["breed"], 5, 160, 100, 100)
+    return Dragon(item["id"], 5000.0, item["name"], item["breed"], 100, 100.0, item["scale_color"])
+
+def main(n=1_000_000, chunk=100_000):
+    rng = random.Random(42)
+    fleet = []
+    bytes_before = 0
+    retained = {}  # id(chaîne) -> taille, pour les chaînes réellement retenues
+
+    t0 = time.perf_counter()
+    for start in range(0, n, chunk):
+        raw = json.dumps(synthetic_records(start, min(chunk, n - start), rng), ensure_ascii=False)
+        for item in json.loads(raw):
+            # Avant : chaque objet gardait la chaîne fraîchement décodée
+            for field in CATEGORICAL_FIELDS:
+                if field in item:
+                    bytes_before += sys.getsizeof(item[field])
+
+            obj = build(item)
+            for field in CATEGORICAL_FIELDS:
+                value = getattr(obj, field, None)
+                if value is not None:
+                    retained[id(value)] = sys.getsizeof(value)
+            fleet.append(obj)
+    elapsed = time.perf_counter() - t0
+
+    bytes_after = sum(retained.values())
+    print(f"Flotte synthétique : {len(fleet):,} éléments (construits en {elapsed:.1f}s)")
+    print(f"Symboles distincts : {len(SYMBOLS)}")
+    print(f"Chaînes catégorielles avant : {bytes_before / 1e6:9.1f} Mo")
+    print(f"Chaînes catégorielles après : {bytes_after / 1e6:9.3f} Mo")
+    print(f"Mémoire économisée          : {(bytes_before - bytes_after) / 1e6:9.1f} Mo")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
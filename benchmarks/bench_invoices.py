@@ -0,0 +1,64 @@
+"""
+Benchmark des factures (location/invoices.py).
+
+1) Rental.generate_invoice : premier rendu puis appels servis par le cache.
+2) Export groupé de N factures (50k par défaut) en .zip et en .txt,
+   rendu dans le processus courant puis avec un pool de processus.
+
+Usage : python benchmarks/bench_invoices.py [N]
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "..", "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.vehicles import Car
+from clients.customer import Customer
+from location.rental import Rental
+from location import invoices
+
+def build(n):
+    client = Customer(1, "Doe", "John", 30, "B-1", "j@x", "06", "john", "pw")
+    car = Car(1, 50.0, "Peugeot", "208", "AA-123-BB", 2020, 5, True)
+    origin = date(2024, 1, 1)
+    rentals = []
+    for i in range(n):
+        start = origin + timedelta(days=i % 300)
+        end = start + timedelta(days=1 + i % 10)
+        rentals.append(Rental.restore(client, car, start, end, rental_id=i + 1,
+                                      actual_return_date=end + timedelta(days=i % 3),
+                                      total_cost=50.0 * (1 + i % 12), penalty=5.0 * (i % 3)))
+    return rentals
+
+def timed(func):
+    t0 = time.perf_counter()
+    result = func()
+    return time.perf_counter() - t0, result
+
+def main(n=50_000):
+    rentals = build(n)
+
+    first, _ = timed(lambda: [r.generate_invoice() for r in rentals])
+    cached, _ = timed(lambda: [r.generate_invoice() for r in rentals])
+    print(f"generate_invoice x {n:,}")
+    print(f"  {'premier rendu':<22} {first:>7.2f}s")
+    print(f"  {'depuis le cache':<22} {cached:>7.2f}s  ({first / cached:.1f}x)")
+
+    workers = os.cpu_count() or 1
+    print(f"Export de {n:,} factures ({workers} processeurs)")
+    with tempfile.TemporaryDirectory() as tmp:
+        for ext in ("zip", "txt"):
+            path = os.path.join(tmp, f"factures.{ext}")
+            for label, pool_size in (("un processus", 1), (f"pool x{workers}", workers)):
+                elapsed, count = timed(lambda: invoices.export_invoices(rentals, path, workers=pool_size))
+                assert count == n
+                print(f"  .{ext} {label:<14} {elapsed:>7.2f}s  ({os.path.getsize(path) / 1e6:.1f} Mo)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
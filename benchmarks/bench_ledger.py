@@ -0,0 +1,75 @@
+"""
+Benchmark du grand livre (location/ledger.py).
+
+N locations clôturées réparties sur 5 ans et 18 classes. Compare, pour 1000
+périodes aléatoires filtrées par classe, le parcours de toutes les locations
+et la lecture des sommes cumulées.
+
+Usage : python benchmarks/bench_ledger.py [N]
+"""
+import gc
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+import numpy as np
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "..", "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.registry import FLEET_CLASSES
+from location.ledger import RevenueLedger
+
+def timed(func):
+    gc.disable()
+    try:
+        t0 = time.perf_counter()
+        result = func()
+        return time.perf_counter() - t0, result
+    finally:
+        gc.enable()
+
+def main(n=1_000_000, queries=1_000):
+    rng = np.random.default_rng(0)
+    origin = date(2020, 1, 1).toordinal()
+    codes = rng.integers(0, len(FLEET_CLASSES), n)
+    days = origin + rng.integers(0, 5 * 365, n)
+    revenues = rng.uniform(50, 500, n).round(2)
+    penalties = np.where(rng.random(n) < 0.1, 10.0, 0.0)
+
+    ledger = RevenueLedger()
+    build, _ = timed(lambda: ledger.record_many(codes, days, revenues, penalties))
+
+    random.seed(0)
+    windows = []
+    for _ in range(queries):
+        start = date.fromordinal(origin + random.randrange(5 * 365))
+        windows.append((start, start + timedelta(days=random.randrange(1, 365)), random.sample(FLEET_CLASSES, 3)))
+
+    rows = list(zip(codes.tolist(), days.tolist(), revenues.tolist()))
+    def scan():
+        totals = []
+        for start, end, classes in windows[:20]:
+            lo, hi = start.toordinal(), end.toordinal()
+            wanted = {FLEET_CLASSES.index(cls) for cls in classes}
+            totals.append(sum(r for c, d, r in rows if lo <= d <= hi and c in wanted))
+        return totals
+
+    scanned, expected = timed(scan)
+    first, _ = timed(lambda: ledger.query())  # Sommes cumulées calculées ici
+    queried, got = timed(lambda: [ledger.query(s, e, c)["revenue"] for s, e, c in windows])
+    assert np.allclose(expected, got[:20])
+
+    print(f"{n:,} locations clôturées sur 5 ans")
+    print(f"  {'enregistrement (record_many)':<32} {build:>8.3f}s")
+    print(f"  {'sommes cumulées (1re requête)':<32} {first:>8.3f}s")
+    print(f"  {'parcours complet / requête':<32} {scanned / 20 * 1e3:>8.2f}ms")
+    print(f"  {'grand livre / requête':<32} {queried / queries * 1e3:>8.3f}ms  "
+          f"({scanned / 20 / (queried / queries):,.0f}x)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,96 @@
+"""
+Benchmark mémoire : octets par entité avec __slots__ (actuel) vs __dict__ (avant).
+
+Le "avant" est reproduit par une classe jumelle sans __slots__ qui porte
+exactement les mêmes attributs (mêmes objets valeurs, partagés), de sorte
+que seule la surcharge du conteneur d'attributs est mesurée.
+
+Usage : python benchmarks/bench_memory.py [N]
+"""
+import os
+import sys
+import tracemalloc
+from datetime import date
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "..", "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.vehicles import Car, Truck, Carriage
+from fleet.animals import Horse, Dragon
+from fleet.maintenance import Maintenance
+from fleet.enums import MaintenanceType
+from clients.customer import Customer
+from location.rental import Rental
+
+def slot_names(obj):
+    """Tous les attributs déclarés dans les __slots__ de la hiérarchie."""
+    names = []
+    for klass in type(obj).__mro__:
+        for name in getattr(klass, "__slots__", ()):
+            if name not in names:
+                names.append(name)
+    return names
+
+def make_dict_twin(template):
+    """Classe équivalente 'à l'ancienne' (attributs dans un __dict__)."""
+    names = slot_names(template)
+    values = [getattr(template, n) for n in names]
+
+    def __init__(self):
+        for n, val in zip(names, values):
+            setattr(self, n, val)
+
+    return type(type(template).__name__ + "Dict", (), {"__init__": __init__})
+
+def bytes_per_entity(factory, n):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objs = [factory() for _ in range(n)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    total = sum(s.size_diff for s in stats)
+    # On retire le coût de la liste qui contient les objets
+    total -= sys.getsizeof(objs)
+    return total / n
+
+def slotted_clone(template):
+    """Copie rapide d'un objet à slots (mêmes valeurs, nouvel objet)."""
+    names = slot_names(template)
+    values = [getattr(template, n) for n in names]
+    cls = type(template)
+
+    def factory():
+        o = object.__new__(cls)
+        for n, val in zip(names, values):
+            setattr(o, n, val)
+        return o
+    return factory
+
+def main(n=100_000):
+    client = Customer(1, "Dupont", "Jean", 30, "B-123", "jean@mail.com", "0600", "jdupont", "pass")
+    car = Car(1, 50.0, "Peugeot", "208", "AA-123-BB", 2020, 5, True)
+    templates = {
+        "Car": car,
+        "Truck": Truck(2, 250.0, "Volvo", "FH16", "BB-456-CC", 2019, 20.0, 10.0),
+        "Horse": Horse(3, 35.0, "Jolly", "Frison", 5, 160, 100, 100),
+        "Dragon": Dragon(4, 5000.0, "Smaug", "Rouge", 150, 100.0, "Doré"),
+        "Carriage": Carriage(5, 120.0, 4, True),
+        "Customer": client,
+        "Rental": Rental(client, car, "2024-01-01", "2024-01-06", from_history=True),
+        "Maintenance": Maintenance(1, date(2024, 1, 1), MaintenanceType.CLEANING, 20.0, "Lavage", 0.5),
+    }
+
+    print(f"Benchmark mémoire ({n} entités par classe)")
+    print(f"{'Classe':<12} {'__dict__ (avant)':>18} {'__slots__ (après)':>18} {'Gain':>8}")
+    for name, template in templates.items():
+        before = bytes_per_entity(make_dict_twin(template), n)
+        after = bytes_per_entity(slotted_clone(template), n)
+        gain = (1 - after / before) * 100 if before else 0.0
+        print(f"{name:<12} {before:>16.1f} o {after:>16.1f} o {gain:>7.1f}%")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
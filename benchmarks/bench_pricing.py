@@ -0,0 +1,64 @@
+"""
+Benchmark du moteur de tarification (location/pricing.py).
+
+Devis de V véhicules x W périodes avec des règles actives (saison, remises,
+majoration) : un PricingEngine.quote par couple contre un seul quote_many.
+
+Usage : python benchmarks/bench_pricing.py [V] [W]
+"""
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "..", "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+import numpy as np
+
+from fleet.vehicles import Car, Truck
+from fleet.animals import Horse
+from location.pricing import PricingEngine, SeasonalMultiplier, LongRentalDiscount, ClassSurcharge
+
+def make_engine():
+    engine = PricingEngine()
+    engine.add_rule(SeasonalMultiplier((7, 8), 1.3))
+    engine.add_rule(SeasonalMultiplier((12,), 1.15))
+    engine.add_rule(LongRentalDiscount(7, 0.10))
+    engine.add_rule(LongRentalDiscount(28, 0.25))
+    engine.add_rule(ClassSurcharge({Truck: 1.2}))
+    return engine
+
+def main(n_vehicles=5_000, n_windows=200):
+    vehicles = []
+    for i in range(n_vehicles):
+        if i % 3 == 0:
+            vehicles.append(Car(i, 40.0 + i % 40, "Peugeot", "208", f"AA-{i}", 2020, 5, True))
+        elif i % 3 == 1:
+            vehicles.append(Truck(i, 150.0 + i % 20, "Volvo", "FH", f"BB-{i}", 2019, 20.0, 10.0))
+        else:
+            vehicles.append(Horse(i, 30.0 + i % 10, "Jolly", "Frison", 5, 160, 100, 100))
+
+    origin = date(2024, 1, 1)
+    windows = [(origin + timedelta(days=3 * k), origin + timedelta(days=3 * k + 1 + k % 30)) for k in range(n_windows)]
+    print(f"Devis : {n_vehicles:,} véhicules x {n_windows} périodes = {n_vehicles * n_windows:,} prix")
+
+    engine = make_engine()
+    t0 = time.perf_counter()
+    loop = [[engine.quote(v, s, e) for s, e in windows] for v in vehicles]
+    t_loop = time.perf_counter() - t0
+
+    engine = make_engine()
+    t0 = time.perf_counter()
+    grid = engine.quote_many(vehicles, windows)
+    t_many = time.perf_counter() - t0
+
+    assert np.allclose(grid, np.array(loop))
+    print(f"{'quote (boucle)':<16} {t_loop:>8.3f}s")
+    print(f"{'quote_many':<16} {t_many:>8.3f}s  ({t_loop / t_many:.0f}x)")
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
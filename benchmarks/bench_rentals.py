@@ -0,0 +1,61 @@
+"""
+Benchmark : construction de N locations (1M par défaut).
+
+Compare l'ancien constructeur (datetime.strptime sur chaque date) avec
+les chemins actuels de Rental :
+  - chaînes ISO (parseur date.fromisoformat en cache),
+  - objets date passés directement,
+  - Rental.restore (chemin du chargement : aucune revalidation).
+
+Usage : python benchmarks/bench_rentals.py [N]
+"""
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "..", "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.vehicles import Car
+from clients.customer import Customer
+from location.rental import Rental, parse_iso_date
+
+def legacy_rental(customer, vehicle, start_date_str, end_date_str):
+    """Ancien travail du constructeur : strptime sur les deux dates + validation."""
+    start = datetime.strptime(start_date_str, "%Y-%m-%d")
+    end = datetime.strptime(end_date_str, "%Y-%m-%d")
+    if start > end:
+        raise ValueError("dates")
+    return Rental(customer, vehicle, start, end, from_history=True)
+
+def timed(label, func, n, baseline=None):
+    t0 = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - t0
+    gain = f"{baseline / elapsed:>6.2f}x" if baseline else "      -"
+    print(f"{label:<28} {elapsed:>8.2f}s {n / elapsed:>12,.0f}/s {gain}")
+    return elapsed
+
+def main(n=1_000_000):
+    client = Customer(1, "Doe", "John", 30, "B-1", "j@x", "06", "john", "pw")
+    car = Car(1, 50.0, "Peugeot", "208", "AA-123-BB", 2020, 5, True)
+
+    # Historique réaliste : ~3 ans de dates de début, durées de 1 à 14 jours
+    origin = date(2022, 1, 1)
+    spans = [(origin + timedelta(days=i % 1095), origin + timedelta(days=i % 1095 + 1 + i % 14)) for i in range(n)]
+    as_str = [(s.isoformat(), e.isoformat()) for s, e in spans]
+    parse_iso_date.cache_clear()
+
+    print(f"Construction de {n:,} locations")
+    base = timed("strptime (avant)", lambda: [legacy_rental(client, car, s, e) for s, e in as_str], n)
+    timed("chaînes ISO (cache)", lambda: [Rental(client, car, s, e, from_history=True) for s, e in as_str], n, base)
+    timed("objets date", lambda: [Rental(client, car, s, e, from_history=True) for s, e in spans], n, base)
+    timed("Rental.restore", lambda: [Rental.restore(client, car, s, e) for s, e in spans], n, base)
+    timed("restore + parse (chargement)",
+          lambda: [Rental.restore(client, car, parse_iso_date(s), parse_iso_date(e)) for s, e in as_str], n, base)
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
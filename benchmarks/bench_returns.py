@@ -0,0 +1,99 @@
+"""
+Benchmark : clôture de fin de journée de N retours (100k par défaut).
+
+1) En mémoire : boucle "un retour à la fois" (CarRentalSystem.close_rental, un message
+   par retard) contre CarRentalSystem.close_rentals (calcul NumPy sur le lot).
+2) Avec persistance, comme l'API : un retour = une réécriture de data.json,
+   contre un lot = une seule sauvegarde (mesuré sur M retours, 300 par défaut).
+
+Usage : python benchmarks/bench_returns.py [N] [M]
+"""
+import contextlib
+import gc
+import io
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "..", "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.vehicles import Car
+from clients.customer import Customer
+from location.rental import Rental
+from location.system import CarRentalSystem
+from storage import StorageManager
+
+def build(n):
+    system = CarRentalSystem()
+    client = Customer(1, "Doe", "John", 30, "B-1", "j@x", "06", "john", "pw")
+    origin = date(2024, 1, 1)
+    returns = []
+    for i in range(n):
+        car = Car(i, 40.0 + i % 60, "Peugeot", "208", f"AA-{i}", 2020, 5, True)
+        system.add_vehicle(car)
+        start = origin + timedelta(days=i % 300)
+        end = start + timedelta(days=1 + i % 10)
+        rental = Rental(client, car, start, end)
+        rental.id = i + 1
+        system.rentals.append(rental)
+        # Environ un retour sur trois en retard
+        returns.append((rental.id, (end + timedelta(days=i % 3 - 1)).isoformat()))
+    return system, returns
+
+def close_one_by_one(system, returns, save=None):
+    by_id = {r.id: r for r in system.rentals}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for rental_id, return_date in returns:
+            system.close_rental(by_id[rental_id], return_date)
+            if save:
+                save(system)
+
+def close_batch(system, returns, save=None):
+    with contextlib.redirect_stdout(io.StringIO()):
+        summary = system.close_rentals(returns)
+    if save:
+        save(system)
+    return summary
+
+def timed(func, *args):
+    # Comme timeit : GC coupé pendant la mesure (sinon le coût dépend de la taille du tas)
+    gc.collect()
+    gc.disable()
+    try:
+        t0 = time.perf_counter()
+        func(*args)
+        return time.perf_counter() - t0
+    finally:
+        gc.enable()
+
+def main(n=100_000, m=300):
+    print(f"En mémoire : {n:,} retours")
+    system, returns = build(n)
+    loop = timed(close_one_by_one, system, returns)
+    expected = sum(r.total_cost for r in system.rentals)
+    del system, returns
+
+    system, returns = build(n)
+    batch = timed(close_batch, system, returns)
+    assert abs(sum(r.total_cost for r in system.rentals) - expected) < 1e-6 * max(1.0, expected)
+    del system, returns
+    print(f"  {'un par un':<12} {loop:>8.2f}s")
+    print(f"  {'par lot':<12} {batch:>8.2f}s  ({loop / batch:.2f}x)")
+
+    print(f"Avec sauvegarde JSON : {m:,} retours")
+    with tempfile.TemporaryDirectory() as tmp:
+        save = StorageManager(os.path.join(tmp, "data.json")).save_system
+        with contextlib.redirect_stdout(io.StringIO()):
+            loop = timed(close_one_by_one, *build(m), save)
+            batch = timed(close_batch, *build(m), save)
+    print(f"  {'un par un':<12} {loop:>8.2f}s")
+    print(f"  {'par lot':<12} {batch:>8.2f}s  ({loop / batch:.0f}x)")
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
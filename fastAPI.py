@@ -1,6 +1,6 @@
 import sys
 import os
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 
 # =========================================================
 # 🔧 LE CORRECTIF (HACK DU CHEMIN)
@@ -23,18 +23,24 @@ if project_folder not in sys.path:
 from location.system import CarRentalSystem
 from storage import StorageManager
 from fleet.enums import VehicleStatus
+from response_cache import ResponseCache, FastJSONResponse
 
 # --- DÉMARRAGE DE L'API ---
-app = FastAPI()
+app = FastAPI(default_response_class=FastJSONResponse)
 
 # Chargement des données
 storage = StorageManager("data.json")
 system = storage.load_system()
+# Tableau de bord sérialisé une fois par version du système (ETag / 304 pour le polling)
+responses = ResponseCache(system)
 
 @app.get("/api/dashboard")
-def get_dashboard_data():
+def get_dashboard_data(request: Request):
+    return responses.respond(request, build_dashboard)
+
+def build_dashboard():
     # Calcul du CA pour les locations terminées
-    total_ca = sum(r.total_cost for r in system.rentals if not r.is_active)
+    total_ca = system.closed_revenue()
     
     loues = []
     dispos = []
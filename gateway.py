@@ -0,0 +1,113 @@
+"""
+Passerelle HTTP des workers (mode multi-processus, lancé par serve.py).
+
+Les workers ne chargent pas data.json : chaque requête est relayée, telle
+quelle, au processus propriétaire (api.py) par une socket Unix. Il n'y a
+donc qu'un seul CarRentalSystem, un seul écrivain, un seul cache
+d'idempotence et un seul limiteur de débit, quel que soit le nombre de workers.
+
+Les réponses en flux (export NDJSON, /events) sont relayées au fil de l'eau.
+Les lectures avec ETag sont gardées par le worker : il redemande avec
+If-None-Match et le propriétaire répond 304 sans corps tant que rien n'a changé.
+"""
+import os
+import tempfile
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+SOCKET_ENV = "RENT_A_DREAM_SOCKET"
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), "rent-a-dream.sock")
+MAX_CACHED_READS = 256
+
+# En-têtes propres à une connexion : jamais relayés
+HOP_BY_HOP = {"connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "te", "trailer",
+              "transfer-encoding", "upgrade", "host"}
+
+class OwnerClient:
+    __slots__ = ("socket_path", "_client", "_reads")
+
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self._client = None
+        self._reads: "OrderedDict[str, tuple]" = OrderedDict()  # url -> (etag, octets, en-têtes)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            # Pas de délai de lecture : /events reste ouvert aussi longtemps que le client
+            self._client = httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(uds=self.socket_path),
+                                             base_url="http://proprietaire",
+                                             timeout=httpx.Timeout(30.0, read=None))
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _remember(self, url: str, etag: str, body: bytes, headers: dict):
+        self._reads[url] = (etag, body, headers)
+        self._reads.move_to_end(url)
+        if len(self._reads) > MAX_CACHED_READS:
+            self._reads.popitem(last=False)
+
+    async def relay(self, request: Request) -> Response:
+        url = request.url.path + (f"?{request.url.query}" if request.url.query else "")
+        headers = {k: v for k, v in request.headers.items() if k not in HOP_BY_HOP}
+        # Adresse du vrai client (le propriétaire ne voit que la socket)
+        if request.client is not None:
+            headers["x-forwarded-for"] = request.client.host
+
+        cached = self._reads.get(url) if request.method == "GET" else None
+        if cached is not None:
+            headers["if-none-match"] = cached[0]
+
+        outgoing = self.client.build_request(request.method, url, headers=headers, content=await request.body())
+        try:
+            upstream = await self.client.send(outgoing, stream=True)
+        except httpx.TransportError:
+            return JSONResponse({"detail": "Service indisponible (processus propriétaire injoignable)"},
+                                status_code=503, headers={"Retry-After": "1"})
+
+        response_headers = {k: v for k, v in upstream.headers.items() if k not in HOP_BY_HOP}
+        etag = upstream.headers.get("etag")
+
+        if cached is not None and upstream.status_code == 304:
+            # Rien n'a changé : corps déjà connu du worker
+            await upstream.aclose()
+            sent = request.headers.get("if-none-match", "")
+            if cached[0] in [tag.strip().removeprefix("W/") for tag in sent.split(",")]:
+                return Response(status_code=304, headers={"etag": cached[0]})
+            return Response(cached[1], headers=cached[2])
+
+        if request.method == "GET" and etag and upstream.status_code == 200:
+            body = await upstream.aread()
+            await upstream.aclose()
+            self._remember(url, etag, body, response_headers)
+            return Response(body, headers=response_headers)
+
+        async def stream():
+            try:
+                async for chunk in upstream.aiter_raw():
+                    yield chunk
+            finally:
+                await upstream.aclose()
+
+        return StreamingResponse(stream(), status_code=upstream.status_code, headers=response_headers)
+
+owner = OwnerClient(os.environ.get(SOCKET_ENV, DEFAULT_SOCKET))
+
+@asynccontextmanager
+async def lifespan(app):
+    yield
+    await owner.close()
+
+app = Starlette(routes=[Route("/{path:path}", owner.relay,
+                              methods=["GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"])],
+                lifespan=lifespan)
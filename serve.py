@@ -0,0 +1,86 @@
+"""
+Lancement de l'API sur plusieurs processus (Linux / macOS).
+
+    python serve.py --workers 4 [--host 127.0.0.1] [--port 8000] [--socket CHEMIN]
+
+Un seul processus "propriétaire" charge data.json et tient CarRentalSystem :
+c'est api.py, servi sur une socket Unix. Les N workers (gateway.py) acceptent
+les connexions HTTP et lui relaient chaque requête. Toutes les modifications
+passent par le même système et le même écrivain : les workers ne peuvent plus
+écraser les sauvegardes les uns des autres.
+
+Avec --workers 1, api.py est servi directement, sans passerelle.
+"""
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import uvicorn
+
+from gateway import SOCKET_ENV, DEFAULT_SOCKET
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# api.py importe les modules internes comme "fleet.*", "location.*"...
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+
+def socket_alive(path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+            return True
+        except OSError:
+            return False
+
+def start_owner(path: str) -> subprocess.Popen:
+    """Processus propriétaire (api.py sur la socket), prêt à répondre au retour."""
+    if os.path.exists(path):
+        if socket_alive(path):
+            raise RuntimeError(f"Un processus propriétaire écoute déjà sur {path}")
+        os.remove(path)  # Socket laissée par un arrêt brutal
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (current_dir, project_folder, env.get("PYTHONPATH")) if p)
+    owner = subprocess.Popen([sys.executable, "-m", "uvicorn", "api:app", "--uds", path, "--log-level", "warning"],
+                             cwd=os.getcwd(), env=env)
+    deadline = time.monotonic() + 60
+    while not socket_alive(path):
+        if owner.poll() is not None:
+            raise RuntimeError("Le processus propriétaire s'est arrêté au démarrage (voir ci-dessus)")
+        if time.monotonic() > deadline:
+            owner.terminate()
+            raise RuntimeError("Le processus propriétaire ne répond pas")
+        time.sleep(0.1)
+    return owner
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="API Rent-A-Dream sur plusieurs processus")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="Socket Unix du processus propriétaire")
+    args = parser.parse_args(argv)
+
+    if args.workers <= 1:
+        sys.path[:0] = [current_dir, project_folder]
+        uvicorn.run("api:app", host=args.host, port=args.port)
+        return
+
+    owner = start_owner(args.socket)
+    print(f"🚀 Propriétaire prêt ({args.socket}), {args.workers} workers sur http://{args.host}:{args.port}")
+    try:
+        # Les workers (processus lancés par uvicorn) héritent de l'environnement
+        os.environ[SOCKET_ENV] = args.socket
+        uvicorn.run("gateway:app", host=args.host, port=args.port, workers=args.workers)
+    finally:
+        # Arrêt propre : le propriétaire termine sa dernière sauvegarde (lifespan de api.py)
+        owner.terminate()
+        try:
+            owner.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            owner.kill()
+
+if __name__ == "__main__":
+    main()
@@ -30,6 +30,7 @@ from location.system import CarRentalSystem
 from location.rental import Rental
 from storage import StorageManager
 from clients.customer import Customer
+from clients.eligibility import check_eligibility
 from fleet.vehicles import *
 from fleet.animals import *
 from fleet.enums import VehicleStatus, MaintenanceType
@@ -291,15 +292,6 @@ def load_lottiefile(filepath: str):
 
 API_URL = "http://127.0.0.1:8000"
 
-def get_all_fleet():
-    try:
-        response = requests.get(f"{API_URL}/fleet")
-        if response.status_code == 200:
-            return response.json()
-    except:
-        return []
-    return []
-
 def post_rental(customer_id, vehicle_id, start_str, end_str):
     payload = {
         "customer_id": customer_id,
@@ -316,24 +308,6 @@ def post_rental(customer_id, vehicle_id, start_str, end_str):
     except Exception as e:
         return False, str(e)
 
-def check_age_rule(customer_age, vehicle):
-    """Vérifie l'âge minimum requis selon le type de véhicule."""
-    v_type = vehicle.__class__.__name__
-
-    if v_type in ["Truck", "Plane", "Submarine", "Dragon"]:
-        if customer_age < 21:
-            return False, "Âge minimum requis pour ce type de véhicule spécialisé (Lourd/Dragon) : 21 ans."
-
-    if isinstance(vehicle, TransportAnimal):
-        if customer_age < 16:
-            return False, "Âge minimum requis pour la location d'animaux : 16 ans."
-
-    if isinstance(vehicle, MotorizedVehicle) and v_type not in ["Karting"]:
-        if customer_age < 18:
-            return False, "Âge minimum requis pour la location motorisée : 18 ans."
-
-    return True, None
-
 # =========================================================
 # 3. INITIALISATION SESSION
 # =========================================================
@@ -688,7 +662,8 @@ elif selected == "Louer un véhicule":
     search = c1.text_input("Recherche...", placeholder="Modèle, Marque...")
     env = c2.selectbox("Filtrer par type", ["Tout", "Terre", "Mer", "Air"])
 
-    available = [v for v in system.fleet if v.status == VehicleStatus.AVAILABLE]
+    # Catalogue déjà filtré selon l'âge et le permis du client connecté
+    available = system.eligible_vehicles(me)
 
     if env == "Terre": available = [v for v in available if isinstance(v, (Car, Truck, Motorcycle, Horse, Donkey, Carriage, Cart, GoKart, Hearse))]
     elif env == "Mer": available = [v for v in available if isinstance(v, (Boat, Submarine, Whale, Dolphin))]
@@ -696,6 +671,22 @@ elif selected == "Louer un véhicule":
 
     if search: available = [v for v in available if search.lower() in str(v.show_details()).lower()]
 
+    # Matrice de prix : tous les véhicules affichés x plusieurs durées, en un seul calcul
+    if available:
+        with st.expander("📊 Comparer les prix"):
+            m1, m2 = st.columns([1, 2])
+            m_start = m1.date_input("À partir du", value=date.today(), key="matrix_start")
+            durations = sorted(m2.multiselect("Durées (jours)", [1, 2, 3, 7, 14, 30], default=[1, 3, 7, 14], key="matrix_days"))
+
+            if durations:
+                windows = [(m_start, m_start + timedelta(days=d)) for d in durations]
+                prices, free = system.quote_matrix(available, windows)
+
+                noms = [f"{getattr(v, 'brand', getattr(v, 'name', '?'))} {getattr(v, 'model', getattr(v, 'breed', ''))} (#{v.id})" for v in available]
+                df_prices = pd.DataFrame(prices.round(2), index=noms, columns=[f"{d} j" for d in durations])
+                st.dataframe(df_prices.where(free), use_container_width=True)
+                st.caption("Prix en € (tarification en vigueur). Case vide = indisponible sur la période.")
+
     if not available:
         st.info("Aucun véhicule disponible correspondant à vos critères.")
     else:
@@ -728,30 +719,21 @@ elif selected == "Louer un véhicule":
                         if d_end >= d_start:
                             days = (d_end - d_start).days
                             days = max(1, days)
-                            total_estime = days * v.daily_rate
+                            total_estime = system.pricing.quote(v, d_start, d_end)
                             st.info(f"Durée : {days} jours\n\nTotal estimé : **{total_estime}€**")
                         
                         if st.button("Confirmer la réservation", key=f"conf_{v.id}", type="primary"):
-                            s_str = d_start.strftime("%Y-%m-%d")
-                            e_str = d_end.strftime("%Y-%m-%d")
+                            can_rent, reason = check_eligibility(me, v)
 
-                            can_rent, reason = check_age_rule(me.age, v)
-
-                            is_motorized = isinstance(v, MotorizedVehicle)
-
-                            if is_motorized and not me.driver_license:
-                                st.error("🚫 Location impossible : Le permis de conduire est **obligatoire** pour tous les véhicules motorisés (Terre, Mer, Air).")
-                            elif not can_rent:
+                            if not can_rent:
                                 st.error(f"🚫 Location impossible : {reason}")
                             else:
                                 try:
                                     # 1. Création via la classe Rental (Validation incluse)
-                                    new_rental = Rental(me, v, s_str, e_str)
+                                    new_rental = Rental(me, v, d_start, d_end)
 
-                                    new_rental.id = len(system.rentals) + 1
-                                    
-                                    # 2. Ajout au système
-                                    system.rentals.append(new_rental)
+                                    # 2. Ajout au système (id unique, archive comprise)
+                                    system.add_rental(new_rental)
                                     save_data()
 
                                     type_vehicule = v.__class__.__name__
@@ -782,10 +764,7 @@ elif selected == "Espace Personnel":
     me = st.session_state.current_user
     st.title(f"Espace Personnel de {me.name}")
 
-    my_rentals = [r for r in system.rentals if r.customer.id == me.id]
-    active_rentals = [r for r in my_rentals if r.is_active]
-    history_rentals = [r for r in my_rentals if not r.is_active]
-    total_spent = sum(r.total_cost for r in history_rentals)
+    active_rentals = [r for r in system.rentals if r.customer.id == me.id and r.is_active]
 
     tab_active, tab_hist, tab_profile = st.tabs(["🔑 Locations en Cours", "📜 Historique", "⚙️ Mon Profil"])
 
@@ -801,23 +780,22 @@ elif selected == "Espace Personnel":
                 nom_vehicule = getattr(r.vehicle, 'brand', getattr(r.vehicle, 'name', 'Véhicule'))
                 detail_vehicule = getattr(r.vehicle, 'model', getattr(r.vehicle, 'breed', ''))
                 
-                titre_expander = f"🚗 {nom_vehicule} {detail_vehicule} (Retour prévu : {r.end_date.date()})"
+                titre_expander = f"🚗 {nom_vehicule} {detail_vehicule} (Retour prévu : {r.end_date})"
 
                 with st.expander(titre_expander, expanded=True):
                     c1, c2 = st.columns([2, 1])
 
                     with c1:
-                        st.write(f"**Début :** {r.start_date.date()}")
-                        st.write(f"**Fin prévue :** {r.end_date.date()}")
+                        st.write(f"**Début :** {r.start_date}")
+                        st.write(f"**Fin prévue :** {r.end_date}")
                         st.info(f"💰 Coût estimé actuel : **{r.calculate_cost()} €**")
 
                     with c2:
                         d_return = st.date_input("Date de retour", value=date.today(), key=f"ret_{r.id}")
                         
                         if st.button("Valider le retour", key=f"btn_ret_{r.id}", type="primary"):
-                            ret_str = d_return.strftime("%Y-%m-%d")
                             try:
-                                final = r.close_rental(ret_str)
+                                final = system.close_rental(r, d_return)
                                 save_data()
 
                                 st.balloons()
@@ -835,24 +813,36 @@ elif selected == "Espace Personnel":
     
     with tab_hist:
         st.subheader("Mes aventures passées")
+        # Historique via le dépôt : résumés page par page, Rental complète seulement pour la facture
+        nb_history, total_spent = system.history.totals(me.id)
         c1, c2 = st.columns(2)
-        c1.metric("Total Locations", len(history_rentals))
-        c2.metric("Budget Total", f"{total_spent} €")
+        c1.metric("Total Locations", nb_history)
+        c2.metric("Budget Total", f"{total_spent:.2f} €")
 
-        if not history_rentals:
+        if not nb_history:
             st.caption("Aucun historique.")
         else:
-            data = []
-            for r in history_rentals:
-                nom = getattr(r.vehicle, 'brand', getattr(r.vehicle, 'name', '?'))
-                model = getattr(r.vehicle, 'model', getattr(r.vehicle, 'breed', ''))
-
-                data.append({
-                    "Véhicule": f"{nom} {model}",
-                    "Période": f"{r.start_date.date()} -> {r.actual_return_date.date() if r.actual_return_date else 'En cours'}",
-                    "Coût": f"{r.total_cost} €"
-                })
-            st.dataframe(pd.DataFrame(data), use_container_width=True)
+            page_size = 20
+            nb_pages = (nb_history - 1) // page_size + 1
+            page = st.number_input("Page", min_value=1, max_value=nb_pages, value=1, key="hist_page")
+            rows, _ = system.history.page(me.id, page=page, page_size=page_size)
+
+            data = [{
+                "N°": row.id,
+                "Véhicule": row.vehicle_label,
+                "Période": f"{row.start_date} -> {row.actual_return_date}",
+                "Coût": f"{row.total_cost} €"
+            } for row in rows]
+            st.dataframe(pd.DataFrame(data), use_container_width=True, hide_index=True)
+
+            chosen = st.selectbox("📄 Revoir une facture", rows, index=None, key="hist_invoice",
+                                  format_func=lambda row: f"#{row.id} - {row.vehicle_label} ({row.actual_return_date})")
+            if chosen is not None:
+                rental = system.history.get(chosen)
+                if rental is None:
+                    st.warning("Facture indisponible (véhicule ou client supprimé).")
+                else:
+                    st.code(rental.generate_invoice(), language="text")
 
     with tab_profile:
         st.subheader("Mes Informations")
@@ -921,7 +911,7 @@ elif selected == "Dashboard":
     if st.session_state.user_role != "admin": st.error("Accès Admin requis."); st.stop()
     st.title("📊 Tableau de Bord")
     k1, k2 = st.columns(2)
-    k1.metric("CA Total", f"{sum(r.total_cost for r in system.rentals):.2f}€")
+    k1.metric("CA Total", f"{system.closed_revenue():.2f}€")
     k2.metric("Clients", len(system.customers))
     st.markdown("---")
     k3, k4 = st.columns(2)
@@ -1161,7 +1151,7 @@ elif selected == "Gestion Flotte":
 
             if st.button("🗑️ Confirmer la suppression", type="primary"):
                 obj_to_del = del_opts[sel_del]
-                system.fleet.remove(obj_to_del)
+                system.remove_vehicle(obj_to_del)
                 save_data()
                 st.success("Élément retiré du parc.")
                 time.sleep(1)
@@ -1197,10 +1187,14 @@ elif selected == "Gestion Flotte":
                     if not isinstance(anim_obj, Donkey):
                         error_msg = "❌ Charrette = Âne uniquement."
 
+                attached_to = system.harness.towed_of(anim_obj.id)
+                if attached_to is not None:
+                    error_msg = f"❌ {anim_obj.name} est déjà attelé au véhicule #{attached_to.id}."
+
                 if error_msg:
                     st.error(error_msg)
                 else:
-                    veh_obj.harness_animal(anim_obj)
+                    system.harness_animal(veh_obj, anim_obj)
                     save_data()
                     st.balloons()
                     st.success(f"✅ {anim_obj.name} attelé !")
@@ -1291,10 +1285,7 @@ elif selected == "Atelier":
                 if st.form_submit_button("Valider Intervention"):
                     m_id = len(target_obj.maintenance_log) + 1
                     new_m = Maintenance(m_id, date.today(), real_type, cost, desc, float(duration))
-                    target_obj.add_maintenance(new_m)
-                    
-                    if bloque:
-                        target_obj.status = VehicleStatus.UNDER_MAINTENANCE
+                    system.add_maintenance(target_obj, new_m, immobilize=bloque)
                     
                     save_data()
                     st.success(f"Intervention **{type_str}** enregistrée !")
@@ -1321,7 +1312,7 @@ elif selected == "Atelier":
             target_release = opts[choice]
             
             if st.button("✅ Valider la fin des travaux", type="primary"):
-                opts[choice].status = VehicleStatus.AVAILABLE
+                system.set_vehicle_status(opts[choice], VehicleStatus.AVAILABLE)
                 save_data()
                 st.balloons()
                 st.success("Véhicule disponible !")
@@ -1331,21 +1322,31 @@ elif selected == "Atelier":
     # --- ONGLET 3 : HISTORIQUE ---
     with tab_history:
         st.subheader("Journal des interventions")
-        all_logs = []
+
+        # Indicateurs lus sur les agrégats des journaux (pas de parcours des entrées)
+        summary = system.maintenance_summary()
+        m1, m2, m3 = st.columns(3)
+        m1.metric("Interventions", summary["count"])
+        m2.metric("Coût total", f"{summary['total_cost']:.2f}€")
+        m3.metric("Immobilisation", f"{summary['total_downtime_days']:g} j")
+
+        # Tableau construit colonne par colonne à partir des journaux compacts
+        cols = {"Date": [], "Véhicule": [], "Type": [], "Coût": [], "Durée": [], "Notes": []}
         for v in system.fleet:
+            log = v.maintenance_log
+            if not len(log):
+                continue
             v_name = getattr(v, 'brand', getattr(v, 'name', '?'))
-            for m in v.maintenance_log:
-                all_logs.append({
-                    "Date": m.date,
-                    "Véhicule": v_name,
-                    "Type": m.type.value,
-                    "Coût": f"{m.cost}€",
-                    "Durée": f"{m.duration}j",
-                    "Notes": m.description
-                })
+            c = log.columns()
+            cols["Date"] += c["date"]
+            cols["Véhicule"] += [v_name] * len(log)
+            cols["Type"] += [t.value for t in c["type"]]
+            cols["Coût"] += [f"{x}€" for x in c["cost"]]
+            cols["Durée"] += [f"{x}j" for x in c["duration"]]
+            cols["Notes"] += c["description"]
         
-        if all_logs:
-            st.dataframe(pd.DataFrame(all_logs), use_container_width=True)
+        if cols["Date"]:
+            st.dataframe(pd.DataFrame(cols), use_container_width=True)
         else:
             st.info("Aucun historique disponible.")
 
@@ -1361,7 +1362,7 @@ elif selected == "Locations Admin":
     st.title("📝 Registre Global des Locations")
 
     active_count = len([r for r in system.rentals if r.is_active])
-    total_rev = sum([r.total_cost for r in system.rentals if not r.is_active])
+    total_rev = system.closed_revenue()
 
     k1, k2 = st.columns(2)
     k1.metric("Véhicules loués actuellement", active_count)
@@ -1376,9 +1377,9 @@ elif selected == "Locations Admin":
         for r in system.rentals:
             status_icon = "🟢 En cours" if r.is_active else "🔴 Terminé"
 
-            d_start = r.start_date.date()
-            d_end = r.end_date.date()
-            d_real = r.actual_return_date.date() if r.actual_return_date else "En attente"
+            d_start = r.start_date
+            d_end = r.end_date
+            d_real = r.actual_return_date if r.actual_return_date else "En attente"
 
             client_name = r.customer.name if hasattr(r.customer, 'name') else f"ID {r.customer}"
 
@@ -0,0 +1,108 @@
+import asyncio
+import os
+import sys
+import unittest
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from admission import RateLimiter, AdmissionQueue, Overloaded
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestRateLimiter(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.limiter = RateLimiter(rate=2.0, burst=3, clock=self.clock)
+
+    def test_rafale_puis_429(self):
+        self.assertEqual([self.limiter.check("a") for _ in range(3)], [0.0, 0.0, 0.0])
+        retry_after = self.limiter.check("a")
+        self.assertGreater(retry_after, 0)
+        self.assertAlmostEqual(retry_after, 0.5)
+        self.assertEqual(self.limiter.rejected, 1)
+        # Un autre client a son propre seau
+        self.assertEqual(self.limiter.check("b"), 0.0)
+
+    def test_recharge(self):
+        for _ in range(3):
+            self.limiter.check("a")
+        self.clock.now = 0.5  # Un jeton regagné
+        self.assertEqual(self.limiter.check("a"), 0.0)
+        self.assertGreater(self.limiter.check("a"), 0)
+
+    def test_clients_oublies(self):
+        limiter = RateLimiter(rate=1.0, burst=1, max_clients=2, clock=self.clock)
+        limiter.check("a")
+        limiter.check("b")
+        limiter.check("c")  # "a" est oublié : seau plein à son retour
+        self.assertEqual(limiter.check("a"), 0.0)
+
+class TestAdmissionQueue(unittest.TestCase):
+
+    def test_file_pleine_503(self):
+        queue = AdmissionQueue(max_in_flight=1, max_queued=1)
+        order = []
+
+        async def request(name, hold):
+            async with queue.slot():
+                order.append(name)
+                await hold.wait()
+
+        async def scenario():
+            hold = asyncio.Event()
+            first = asyncio.create_task(request("premier", hold))
+            second = asyncio.create_task(request("second", hold))
+            await asyncio.sleep(0)
+            self.assertEqual((queue.in_flight, queue.queued), (1, 1))
+
+            with self.assertRaises(Overloaded) as ctx:
+                async with queue.slot():
+                    pass
+            self.assertGreaterEqual(ctx.exception.retry_after, 1)
+
+            hold.set()
+            await asyncio.gather(first, second)
+
+        asyncio.run(scenario())
+        self.assertEqual(order, ["premier", "second"])
+        self.assertEqual(queue.stats(), {"in_flight": 0, "queued": 0, "admitted": 2, "rejected": 1})
+
+    def test_attente_annulee(self):
+        queue = AdmissionQueue(max_in_flight=1, max_queued=4)
+
+        async def scenario():
+            hold = asyncio.Event()
+
+            async def holder():
+                async with queue.slot():
+                    await hold.wait()
+
+            first = asyncio.create_task(holder())
+            await asyncio.sleep(0)
+
+            async def waiter():
+                async with queue.slot():
+                    pass
+
+            waiting = asyncio.create_task(waiter())
+            await asyncio.sleep(0)
+            waiting.cancel()
+            await asyncio.sleep(0)
+            self.assertEqual(queue.queued, 0)
+            hold.set()
+            await first
+
+        asyncio.run(scenario())
+        self.assertEqual(queue.in_flight, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,403 @@
+"""
+Tests des routes de api.py, via le TestClient de FastAPI.
+
+api.py charge data.json du dossier courant à l'import : le module est
+importé une seule fois, depuis un dossier temporaire où restent aussi ses
+sauvegardes. Chaque test crée ses propres clients et véhicules (ids neufs)
+et s'identifie avec sa propre clé d'API (seau du limiteur de débit à part).
+"""
+import asyncio
+import io
+import itertools
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import zipfile
+from datetime import date
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+for folder in (current_dir, project_folder):
+    if folder not in sys.path:
+        sys.path.append(folder)
+
+from fastapi.testclient import TestClient
+
+from fleet.vehicles import Car
+from clients.customer import Customer
+
+api = client = None
+_directory = _previous_cwd = None
+_ids = itertools.count(1000)
+
+def setUpModule():
+    global api, client, _directory, _previous_cwd
+    _previous_cwd = os.getcwd()
+    _directory = tempfile.mkdtemp()
+    os.chdir(_directory)
+    import api as module
+    api = module
+    client = TestClient(api.app)
+    client.__enter__()
+
+def tearDownModule():
+    client.__exit__(None, None, None)
+    os.chdir(_previous_cwd)
+    shutil.rmtree(_directory)
+
+class ApiTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.headers = {"X-API-Key": self.id()}
+
+    def add_customer(self, age=30) -> Customer:
+        customer = Customer(next(_ids), "Doe", "John", age, "B-1", "j@x", "06", "john", "pw")
+        api.system.add_customer(customer)
+        return customer
+
+    def add_car(self, daily_rate=50.0):
+        api.system.add_vehicle(Car(next(_ids), daily_rate, "Peugeot", "208", "AA-123-BB", 2020, 5, True))
+        return api.system.fleet[-1]
+
+    def post(self, path, headers=None, **kwargs):
+        return client.post(path, headers={**self.headers, **(headers or {})}, **kwargs)
+
+    def rent(self, customer, vehicle, start="2030-03-01", end="2030-03-04"):
+        response = self.post("/rentals/", json={"customer_id": customer.id, "vehicle_id": vehicle.id,
+                                                "start_date": start, "end_date": end})
+        self.assertEqual(response.status_code, 200)
+        return response.json()["rental_id"]
+
+class TestQuotesRoute(ApiTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cars = [self.add_car(50.0), self.add_car(80.0)]
+        self.windows = [{"start_date": "2024-03-01", "end_date": "2024-03-04"},
+                        {"start_date": "2024-03-10", "end_date": "2024-03-11"}]
+
+    def test_prix_et_disponibilite(self):
+        self.cars[1].status = api.VehicleStatus.RENTED
+        ids = [self.cars[0].id, self.cars[1].id, self.cars[0].id]  # Un id demandé deux fois
+        response = client.post("/quotes", json={"vehicle_ids": ids, "windows": self.windows})
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["vehicle_ids"], ids)
+        for row, v_id in zip(body["prices"], ids):
+            vehicle = api.system.find_vehicle(v_id)
+            expected = [round(api.system.pricing.quote(vehicle, date.fromisoformat(w["start_date"]),
+                                                       date.fromisoformat(w["end_date"])), 2) for w in self.windows]
+            self.assertEqual(row, expected)
+        self.assertEqual(body["available"], [[True, True], [False, False], [True, True]])
+
+    def test_location_qui_chevauche(self):
+        customer = self.add_customer()
+        response = self.post("/rentals/", json={"customer_id": customer.id, "vehicle_id": self.cars[0].id,
+                                                "start_date": "2024-03-03", "end_date": "2024-03-05"})
+        self.assertEqual(response.status_code, 200)
+        body = client.post("/quotes", json={"vehicle_ids": [self.cars[0].id], "windows": self.windows}).json()
+        self.assertEqual(body["available"], [[False, False]])
+
+    def test_erreurs(self):
+        missing = client.post("/quotes", json={"vehicle_ids": [self.cars[0].id, 999_999], "windows": self.windows})
+        self.assertEqual(missing.status_code, 404)
+        bad_date = client.post("/quotes", json={"vehicle_ids": [self.cars[0].id],
+                                                "windows": [{"start_date": "2024-03-01", "end_date": "demain"}]})
+        self.assertEqual(bad_date.status_code, 400)
+        reversed_window = client.post("/quotes", json={"vehicle_ids": [self.cars[0].id],
+                                                       "windows": [{"start_date": "2024-03-04", "end_date": "2024-03-01"}]})
+        self.assertEqual(reversed_window.status_code, 400)
+        self.assertEqual(client.post("/quotes", json={"vehicle_type": "Licorne", "windows": self.windows}).status_code, 400)
+
+    def test_filtre_sur_la_flotte(self):
+        body = client.post("/quotes", json={"vehicle_type": "Car", "max_price": 60, "available_only": True,
+                                            "windows": self.windows}).json()
+        self.assertIn(self.cars[0].id, body["vehicle_ids"])
+        self.assertNotIn(self.cars[1].id, body["vehicle_ids"])
+        self.assertEqual(len(body["prices"]), len(body["vehicle_ids"]))
+
+class TestPagedRoutes(ApiTestCase):
+
+    def setUp(self):
+        super().setUp()
+        # Tarifs propres à ce test : le filtre de prix isole ses véhicules du reste du parc
+        base = 100.0 * next(_ids)
+        self.cars = [self.add_car(base + i) for i in range(5)]
+        self.prices = {"min_price": base, "max_price": base + 4}
+
+    def walk(self, path, **params):
+        ids, after = [], None
+        while True:
+            body = client.get(path, params={**params, **({"after": after} if after is not None else {})}).json()
+            ids.extend(item["id"] for item in body["items"])
+            after = body["next_after"]
+            if after is None:
+                return ids
+
+    def test_parcours_avec_curseur(self):
+        self.assertEqual(self.walk("/fleet", limit=2, **self.prices), [car.id for car in self.cars])
+
+    def test_champs(self):
+        body = client.get("/fleet", params={"fields": "id,status,inconnu", **self.prices}).json()
+        self.assertEqual(body["items"][0], {"id": self.cars[0].id, "status": "Disponible"})
+
+    def test_filtres(self):
+        self.cars[1].status = api.VehicleStatus.UNDER_MAINTENANCE
+        for status in ("UNDER_MAINTENANCE", api.VehicleStatus.UNDER_MAINTENANCE.value):
+            self.assertEqual(self.walk("/fleet", status=status, **self.prices), [self.cars[1].id])
+        self.assertEqual(len(self.walk("/fleet", vehicle_type=["Car", "Boat"], **self.prices)), 5)
+        self.assertEqual(self.walk("/fleet", environment="mer", **self.prices), [])
+
+    def test_erreurs(self):
+        for params in ({"vehicle_type": "Licorne"}, {"environment": "espace"}, {"status": "Volé"}):
+            with self.subTest(**params):
+                self.assertEqual(client.get("/fleet", params=params).status_code, 400)
+        self.assertEqual(client.get("/fleet", params={"limit": 0}).status_code, 422)
+
+    def test_clients_et_locations(self):
+        customers = [self.add_customer() for _ in range(3)]
+        body = client.get("/customers", params={"after": customers[0].id - 1, "limit": 2}).json()
+        self.assertEqual([c["id"] for c in body["items"]], [customers[0].id, customers[1].id])
+        self.assertEqual(body["next_after"], customers[1].id)
+
+        rental_id = self.rent(customers[2], self.cars[0])
+        self.rent(customers[1], self.cars[1])
+        rows = client.get("/rentals", params={"customer_id": customers[2].id}).json()["items"]
+        self.assertEqual([r["id"] for r in rows], [rental_id])
+        self.assertEqual(self.walk("/rentals", vehicle_id=self.cars[1].id, active=False), [])
+
+class TestCachedResponses(ApiTestCase):
+
+    def test_etag_et_304(self):
+        car = self.add_car()
+        params = {"after": car.id - 1, "limit": 1}
+        first = client.get("/fleet", params=params)
+        etag = first.headers["etag"]
+        again = client.get("/fleet", params=params, headers={"If-None-Match": etag})
+        self.assertEqual((again.status_code, again.content), (304, b""))
+
+        # Une modification (ici par l'API) change la version : nouvelle réponse, nouvel ETag
+        self.post(f"/fleet/{car.id}/status", params={"status": "UNDER_MAINTENANCE"})
+        changed = client.get("/fleet", params=params, headers={"If-None-Match": etag})
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers["etag"], etag)
+        self.assertEqual(changed.json()["items"][0]["status"], api.VehicleStatus.UNDER_MAINTENANCE.value)
+
+    def test_rapport_de_revenus(self):
+        etag = client.get("/reports/revenue").headers["etag"]
+        self.assertEqual(client.get("/reports/revenue", headers={"If-None-Match": etag}).status_code, 304)
+        customer, car = self.add_customer(), self.add_car()
+        rental_id = self.rent(customer, car)
+        self.post(f"/rentals/{rental_id}/return", params={"return_date": "2030-03-04"})
+        self.assertEqual(client.get("/reports/revenue", headers={"If-None-Match": etag}).status_code, 200)
+
+class TestNdjsonExportRoute(ApiTestCase):
+
+    def lines(self, response):
+        return [json.loads(line) for line in response.text.splitlines()]
+
+    def test_export_incremental(self):
+        first = client.get("/export/fleet.ndjson")
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.headers["content-type"], "application/x-ndjson")
+        self.assertEqual(len(self.lines(first)), len(api.system.fleet))
+        version = int(first.headers["x-change-version"])
+
+        car, removed = self.add_car(), self.add_car()
+        api.system.remove_vehicle(removed)
+        update = client.get("/export/fleet.ndjson", params={"since": version})
+        self.assertEqual(self.lines(update), [car.to_dict(), {"id": removed.id, "deleted": True}])
+        self.assertEqual(int(update.headers["x-change-version"]), api.system.version)
+        nothing = client.get("/export/fleet.ndjson", params={"since": update.headers["x-change-version"]})
+        self.assertEqual(nothing.text, "")
+
+    def test_locations(self):
+        customer, car = self.add_customer(), self.add_car()
+        version = api.system.version
+        rental_id = self.rent(customer, car)
+        rows = self.lines(client.get("/export/rentals.ndjson", params={"since": version}))
+        self.assertEqual([r["id"] for r in rows], [rental_id])
+
+    def test_erreurs(self):
+        self.assertEqual(client.get("/export/clients.ndjson").status_code, 404)
+        self.assertEqual(client.get("/export/fleet.ndjson", params={"since": -1}).status_code, 422)
+
+class TestIdempotencyKeys(ApiTestCase):
+
+    def test_creation_rejouee(self):
+        customer, car = self.add_customer(), self.add_car()
+        body = {"customer_id": customer.id, "vehicle_id": car.id, "start_date": "2030-03-01", "end_date": "2030-03-04"}
+        key = {"Idempotency-Key": f"{self.id()}-creation"}
+        first = self.post("/rentals/", json=body, headers=key)
+        again = self.post("/rentals/", json=body, headers=key)
+        self.assertEqual((first.status_code, again.status_code), (200, 200))
+        # Même réponse, une seule location créée (sans la clé, la 2e serait refusée : véhicule loué)
+        self.assertEqual(again.json(), first.json())
+        self.assertEqual(again.headers["idempotent-replayed"], "true")
+        self.assertEqual(sum(1 for r in api.system.rentals if r.vehicle.id == car.id), 1)
+
+        other = self.post("/rentals/", json={**body, "end_date": "2030-03-05"}, headers=key)
+        self.assertEqual(other.status_code, 422)
+
+    def test_retour_rejoue(self):
+        rental_id = self.rent(self.add_customer(), self.add_car())
+        key = {"Idempotency-Key": f"{self.id()}-retour"}
+        params = {"return_date": "2030-03-04"}
+        first = self.post(f"/rentals/{rental_id}/return", params=params, headers=key)
+        again = self.post(f"/rentals/{rental_id}/return", params=params, headers=key)
+        self.assertEqual((again.status_code, again.json()), (200, first.json()))
+        # Sans la clé : la location est bien déjà terminée
+        self.assertEqual(self.post(f"/rentals/{rental_id}/return", params=params).status_code, 409)
+
+class TestRateLimit(ApiTestCase):
+
+    def test_rafale_puis_429(self):
+        car = self.add_car()
+        path, params = f"/fleet/{car.id}/status", {"status": "AVAILABLE", "durability": "memory"}
+        rejected = client.get("/admission").json()["rate_limited"]
+        # La rafale passe (plus ce que le seau a regagné entre-temps), puis 429
+        accepted = 0
+        refused = self.post(path, params=params)
+        while refused.status_code == 200 and accepted < 2 * api.limiter.burst:
+            accepted += 1
+            refused = self.post(path, params=params)
+        self.assertGreaterEqual(accepted, api.limiter.burst)
+        self.assertEqual(refused.status_code, 429)
+        self.assertGreaterEqual(int(refused.headers["retry-after"]), 1)
+        self.assertEqual(client.get("/admission").json()["rate_limited"], rejected + 1)
+        # Un seau par clé d'API : les autres clients ne sont pas touchés
+        self.assertEqual(self.post(path, params=params, headers={"X-API-Key": f"{self.id()}-autre"}).status_code, 200)
+        # Les lectures ne passent pas par le limiteur
+        self.assertEqual(client.get("/fleet", headers=self.headers).status_code, 200)
+
+class TestMetricsRoute(ApiTestCase):
+
+    def sample(self, text, prefix):
+        return next((float(line.rsplit(" ", 1)[1]) for line in text.splitlines() if line.startswith(prefix)), 0.0)
+
+    def test_exposition(self):
+        series = 'http_requests_total{method="POST",route="/rentals/{rental_id}/return",status="404"}'
+        before = self.sample(client.get("/metrics").text, series)
+        self.post("/rentals/999999/return", params={"return_date": "2030-03-04"})
+        response = client.get("/metrics")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain; version=0.0.4"))
+        # Modèle de chemin, pas l'URL reçue
+        self.assertEqual(self.sample(response.text, series), before + 1)
+        self.assertIn("# TYPE http_request_duration_seconds histogram", response.text)
+
+    def test_jauges_lues_a_la_collecte(self):
+        car = self.add_car()
+        car.status = api.VehicleStatus.OUT_OF_SERVICE
+        out = f'fleet_vehicles{{status="{api.VehicleStatus.OUT_OF_SERVICE.value}"}}'
+        self.assertEqual(self.sample(client.get("/metrics").text, out),
+                         api.system.status_counts()[api.VehicleStatus.OUT_OF_SERVICE])
+        self.assertIn("rentals_active ", client.get("/metrics").text)
+
+class TestEventsRoute(ApiTestCase):
+    """
+    Le flux /events ne se termine jamais : la route est appelée directement et
+    son corps lu morceau par morceau, puis fermé (comme un client qui se déconnecte).
+    """
+
+    def read(self, count, since=None, last_event_id=None, during=None):
+        async def scenario():
+            response = await api.stream_events(since=since, last_event_id=last_event_id)
+            self.assertEqual(response.media_type, "text/event-stream")
+            body = response.body_iterator
+            try:
+                chunks = [await body.__anext__() for _ in range(count)]
+                if during is not None:
+                    # Modification pendant que le flux attend : il doit se réveiller
+                    task = asyncio.ensure_future(body.__anext__())
+                    await asyncio.sleep(0)
+                    during()
+                    chunks.append(await asyncio.wait_for(task, 5))
+                return [chunk.decode() for chunk in chunks]
+            finally:
+                await body.aclose()
+        return asyncio.run(scenario())
+
+    def test_reprise_depuis_une_version(self):
+        version = api.system.version
+        car = self.add_car()
+        api.system.set_vehicle_status(car, api.VehicleStatus.OUT_OF_SERVICE)
+        retry, events = self.read(2, since=version)
+        self.assertEqual(retry, f"retry: {api.sse.RETRY_MS}\n\n")
+        self.assertEqual(events.count("event: "), 2)
+        self.assertIn("event: vehicle_added\n", events)
+        self.assertTrue(events.endswith(f"id: {api.system.version}\ndata: "
+                                        f'{{"id":{car.id},"status":"Hors Service"}}\n\n'))
+        # Last-Event-ID (reconnexion du navigateur) l'emporte sur ?since=
+        self.assertEqual(self.read(2, since=0, last_event_id=str(version + 1))[1].count("event: "), 1)
+
+    def test_evenement_en_direct(self):
+        car = self.add_car()
+        _, event = self.read(1, during=lambda: api.system.set_vehicle_status(car, api.VehicleStatus.RENTED))
+        self.assertTrue(event.startswith("event: vehicle_status\n"))
+        self.assertIn(f"id: {api.system.version}\n", event)
+
+    def test_reset(self):
+        ahead = api.system.version + 100  # Client venu d'un autre état (ex : sauvegarde restaurée)
+        reset = self.read(2, since=ahead)[1]
+        self.assertTrue(reset.startswith("event: reset\n"))
+        self.assertIn(f'"from":{ahead}', reset)
+
+class TestReturnRoute(ApiTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.customer, self.car = self.add_customer(), self.add_car(50.0)
+        self.rental_id = self.rent(self.customer, self.car)
+
+    def test_retour_par_id(self):
+        response = self.post(f"/rentals/{self.rental_id}/return", params={"return_date": "2030-03-04"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["final_cost"], 150.0)
+        self.assertEqual(self.car.status, api.VehicleStatus.AVAILABLE)
+        self.assertFalse(api.system.find_rental(self.rental_id).is_active)
+
+    def test_erreurs(self):
+        self.assertEqual(self.post("/rentals/999999/return", params={"return_date": "2030-03-04"}).status_code, 404)
+        self.assertEqual(self.post(f"/rentals/{self.rental_id}/return",
+                                   params={"return_date": "hier"}).status_code, 400)
+        self.post(f"/rentals/{self.rental_id}/return", params={"return_date": "2030-03-04"})
+        self.assertEqual(self.post(f"/rentals/{self.rental_id}/return",
+                                   params={"return_date": "2030-03-05"}).status_code, 409)
+
+class TestInvoiceExportRoute(ApiTestCase):
+
+    def export(self, **params):
+        response = client.get("/invoices/export", params=params)
+        self.assertEqual(response.status_code, 200)
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            return {name: archive.read(name).decode("utf-8") for name in archive.namelist()}
+
+    def test_memoire_et_archive(self):
+        customer, cars = self.add_customer(), [self.add_car(50.0), self.add_car(70.0)]
+        # Une location de la période déjà archivée (rechargement ou écrivain en arrière-plan)...
+        archived_id = next(_ids)
+        api.system.archive.append([{"id": archived_id, "customer_id": customer.id, "vehicle_id": cars[1].id,
+                                    "start_date": "2019-05-01", "end_date": "2019-05-03",
+                                    "actual_return_date": "2019-05-03", "is_active": False,
+                                    "total_cost": 140.0, "penalty": 0.0, "version": 0}])
+        # ... et une autre encore en mémoire
+        rental_id = self.rent(customer, cars[0], "2019-05-10", "2019-05-12")
+        self.post(f"/rentals/{rental_id}/return", params={"return_date": "2019-05-12"})
+
+        files = self.export(start_date="2019-05-01", end_date="2019-05-31")
+        self.assertEqual(sorted(files), sorted([f"facture_{archived_id:04d}.txt", f"facture_{rental_id:04d}.txt"]))
+        self.assertIn("TOTAL À PAYER    : 140.00 €", files[f"facture_{archived_id:04d}.txt"])
+        # Retour de 2019 : l'écrivain a pu l'archiver entre-temps, la facture doit sortir dans les deux cas
+        self.assertIn("TOTAL À PAYER    : 100.00 €", files[f"facture_{rental_id:04d}.txt"])
+        self.assertEqual(self.export(start_date="2019-06-01", end_date="2019-06-30"), {})
+
+    def test_erreurs(self):
+        self.assertEqual(client.get("/invoices/export", params={"format": "pdf"}).status_code, 400)
+        self.assertEqual(client.get("/invoices/export", params={"start_date": "mai"}).status_code, 400)
+
+if __name__ == '__main__':
+    unittest.main()
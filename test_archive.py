@@ -0,0 +1,66 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import date
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from location.archive import RentalArchive
+
+class TestRentalArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.archive = RentalArchive(self.directory)
+        self.records = [self.record(1, 1, "2024-01-10", 100.0), self.record(2, 2, "2024-01-25", 250.0, 25.0),
+                        self.record(4, 1, "2024-03-02", 80.0), self.record(3, 1, "2024-02-14", 60.0)]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @staticmethod
+    def record(rental_id, customer_id, returned, cost, penalty=0.0):
+        return {"id": rental_id, "customer_id": customer_id, "vehicle_id": 1, "start_date": "2024-01-01",
+                "end_date": returned, "actual_return_date": returned, "is_active": False,
+                "total_cost": cost, "penalty": penalty, "version": rental_id}
+
+    def test_aller_retour(self):
+        self.assertEqual(self.archive.append(self.records), 4)
+
+        reloaded = RentalArchive(self.directory)
+        self.assertEqual(reloaded.months(), ["2024-01", "2024-02", "2024-03"])
+        by_id = lambda records: sorted(records, key=lambda r: r["id"])
+        self.assertEqual(by_id(reloaded.iter_records()), by_id(self.records))
+        self.assertEqual(reloaded.totals(), {"count": 4, "revenue": 490.0, "penalties": 25.0})
+        self.assertEqual(reloaded.last_id(), 4)
+
+    def test_periode_et_ordre(self):
+        self.archive.append(self.records)
+        ids = [r["id"] for r in self.archive.iter_records(date(2024, 1, 20), date(2024, 2, 28))]
+        self.assertEqual(ids, [2, 3])
+        returned = [r["actual_return_date"] for r in self.archive.iter_records(newest_first=True)]
+        self.assertEqual(returned, sorted(returned, reverse=True))
+        self.assertEqual([r["id"] for r in self.archive.iter_records(since=3)], [4])
+
+    def test_ids_deja_archives(self):
+        self.archive.append(self.records[:2])
+        # Nouvel essai après une sauvegarde ratée : mêmes locations, plus une nouvelle
+        self.assertEqual(self.archive.append(self.records), 2)
+        self.assertEqual(len(list(RentalArchive(self.directory).iter_records())), 4)
+        self.assertEqual(self.archive.totals()["count"], 4)
+
+    def test_totaux_par_client(self):
+        self.archive.append(self.records)
+        reloaded = RentalArchive(self.directory)
+        self.assertEqual(reloaded.customer_totals(1), (3, 240.0))
+        self.assertEqual(reloaded.customer_totals(2), (1, 250.0))
+        self.assertEqual(reloaded.customer_totals(9), (0, 0.0))
+        self.assertEqual(reloaded.count("2024-01", 1), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import sys
+import unittest
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.columnar import ColumnarFleet
+from fleet.enums import VehicleStatus
+from fleet.registry import CLASS_CODES, FLEET_CLASSES, class_code
+from location.system import CarRentalSystem
+from test_slots import sample_fleet
+
+class TestColumnarFleet(unittest.TestCase):
+
+    def setUp(self):
+        self.originals = sample_fleet()
+        self.fleet = ColumnarFleet(sample_fleet(), capacity=4)  # Plusieurs agrandissements
+
+    def test_vues_identiques_aux_objets(self):
+        self.assertEqual(len(self.fleet), len(self.originals))
+        for original, view in zip(self.originals, self.fleet):
+            with self.subTest(type(original).__name__):
+                self.assertIsInstance(view, type(original))
+                self.assertEqual(type(view).__name__, type(original).__name__)
+                self.assertEqual(class_code(view), class_code(original))
+                self.assertEqual(view.to_dict(), original.to_dict())
+                self.assertEqual(view.show_details(), original.show_details())
+
+    def test_registre_intact(self):
+        self.assertEqual(len(CLASS_CODES), len(FLEET_CLASSES))
+        self.assertTrue(all(cls in FLEET_CLASSES for cls in CLASS_CODES))
+
+    def test_ecriture_dans_les_colonnes(self):
+        view = self.fleet.find(6)
+        view.status = VehicleStatus.RENTED
+        view.daily_rate = 130.0
+        view.power_cv = 40.0
+        again = self.fleet.find(6)
+        self.assertEqual((again.status, again.daily_rate, again.power_cv), (VehicleStatus.RENTED, 130.0, 40.0))
+        self.assertEqual(self.fleet.status_counts()[VehicleStatus.RENTED], 1)
+        self.assertEqual(view, again)
+
+    def test_id_en_lecture_seule(self):
+        with self.assertRaises(AttributeError):
+            self.fleet.find(1).id = 99
+        self.assertIsNotNone(self.fleet.find(1))
+
+    def test_retrait(self):
+        self.fleet.remove(self.fleet.find(3))
+        self.assertIsNone(self.fleet.find(3))
+        self.assertNotIn(3, [v.id for v in self.fleet])
+        self.assertEqual(len(self.fleet), 17)
+        # Index de liste : les trous sont sautés
+        self.assertEqual(self.fleet[2].id, 4)
+        self.assertEqual([v.id for v in self.fleet[1:4]], [2, 4, 5])
+        self.assertEqual(list(self.fleet.columns()["id"]), [v.id for v in self.fleet])
+        with self.assertRaises(ValueError):
+            self.fleet.remove(self.originals[2])
+
+    def test_reductions(self):
+        self.fleet.set_status([1, 2], VehicleStatus.UNDER_MAINTENANCE)
+        self.assertEqual(self.fleet.status_counts()[VehicleStatus.UNDER_MAINTENANCE], 2)
+        self.assertAlmostEqual(self.fleet.potential_daily_revenue(),
+                               sum(v.daily_rate for v in self.originals))
+        self.assertAlmostEqual(self.fleet.potential_daily_revenue(VehicleStatus.UNDER_MAINTENANCE), 170.0)
+
+    def test_meme_systeme_en_liste_et_en_colonnes(self):
+        systems = [CarRentalSystem(columnar=columnar) for columnar in (False, True)]
+        for system in systems:
+            for vehicle in sample_fleet():
+                system.add_vehicle(vehicle)
+            system.remove_vehicle(system.find_vehicle(9))
+        listed, columnar = systems
+        self.assertEqual([v.to_dict() for v in columnar.fleet], [v.to_dict() for v in listed.fleet])
+        self.assertEqual([v.id for v in columnar.search_vehicles(max_price=100)],
+                         [v.id for v in listed.search_vehicles(max_price=100)])
+        self.assertEqual(columnar.status_counts(), listed.status_counts())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import contextlib
+import io
+import os
+import sys
+import unittest
+from datetime import date
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.vehicles import Car, Truck, Cart
+from fleet.animals import Horse, Dragon
+from fleet.enums import VehicleStatus
+from clients.customer import Customer
+from clients.eligibility import check_eligibility, filter_eligible
+from location.system import CarRentalSystem
+
+def customer(c_id, age, license="B-1"):
+    return Customer(c_id, "Doe", "John", age, license, "j@x", "06", f"john{c_id}", "pw")
+
+class TestEligibility(unittest.TestCase):
+
+    def setUp(self):
+        self.car = Car(1, 50.0, "Peugeot", "208", "AA-123-BB", 2020, 5, True)
+        self.truck = Truck(2, 120.0, "Renault", "Master", "TR-1", 2018, 20.0, 3500)
+        self.horse = Horse(3, 40.0, "Jolly", "Arabe", 6, 450, 40, 12)
+        self.dragon = Dragon(4, 500.0, "Smaug", "Rouge", 150, 100.0, "Doré")
+        self.cart = Cart(5, 10.0, 2, 300)
+        self.fleet = [self.car, self.truck, self.horse, self.dragon, self.cart]
+
+    def ids(self, c):
+        return [v.id for v in filter_eligible(self.fleet, c)]
+
+    def test_regles_par_classe(self):
+        self.assertEqual(self.ids(customer(1, 30)), [1, 2, 3, 4, 5])
+        # 18-20 ans : ni lourd ni dragon
+        self.assertEqual(self.ids(customer(2, 19)), [1, 3, 5])
+        # Sans permis : rien de motorisé
+        self.assertEqual(self.ids(customer(3, 30, "")), [3, 4, 5])
+        self.assertEqual(self.ids(customer(4, 16, "")), [3, 5])
+
+    def test_meme_reponse_que_la_verification_unitaire(self):
+        for c in (customer(1, 30), customer(2, 19), customer(3, 17, ""), customer(4, 12, "")):
+            expected = [v.id for v in self.fleet if check_eligibility(c, v)[0]]
+            self.assertEqual(self.ids(c), expected)
+
+    def test_raison_du_refus(self):
+        allowed, reason = check_eligibility(customer(1, 30, ""), self.car)
+        self.assertFalse(allowed)
+        self.assertIn("permis", reason)
+        self.assertEqual(check_eligibility(customer(1, 30), self.car), (True, None))
+
+class TestEligibleVehicles(unittest.TestCase):
+
+    def setUp(self):
+        self.system = CarRentalSystem()
+        self.client = customer(1, 30)
+        self.system.add_customer(self.client)
+        for v_id in (1, 2, 3):
+            self.system.add_vehicle(Car(v_id, 50.0, "Peugeot", "208", f"AA-{v_id}", 2020, 5, True))
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.system.create_rental(1, 1, date(2024, 1, 1), date(2024, 1, 5))
+        self.system.find_vehicle(3).status = VehicleStatus.UNDER_MAINTENANCE
+
+    def test_seulement_les_disponibles(self):
+        self.assertEqual([v.id for v in self.system.eligible_vehicles(self.client)], [2])
+        # Même hors de sa location, un véhicule loué n'est pas réservable
+        window = (date(2024, 2, 1), date(2024, 2, 3))
+        self.assertEqual([v.id for v in self.system.eligible_vehicles(self.client, window)], [2])
+
+    def test_coherent_avec_create_rental_et_quote_matrix(self):
+        window = (date(2024, 2, 1), date(2024, 2, 3))
+        eligible = {v.id for v in self.system.eligible_vehicles(self.client, window)}
+        vehicles = list(self.system.fleet)
+        _, available = self.system.quote_matrix(vehicles, [window])
+        self.assertEqual({v.id for v, free in zip(vehicles, available[:, 0]) if free}, eligible)
+
+        for v in vehicles:
+            with contextlib.redirect_stdout(io.StringIO()):
+                created = self.system.create_rental(1, v.id, *window) is not None
+            self.assertEqual(created, v.id in eligible)
+
+    def test_periode_inversee(self):
+        with self.assertRaises(ValueError):
+            self.system.eligible_vehicles(self.client, (date(2024, 2, 3), date(2024, 2, 1)))
+
+if __name__ == '__main__':
+    unittest.main()
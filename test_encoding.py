@@ -0,0 +1,68 @@
+import importlib.util
+import os
+import sys
+import unittest
+from datetime import date
+from unittest import mock
+
+import numpy as np
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+import encoding
+from fleet.enums import VehicleStatus
+from fleet.vehicles import Car
+
+def load_json_backend():
+    """Deuxième copie du module, chargée comme si orjson n'était pas installé."""
+    spec = importlib.util.spec_from_file_location("encoding_json", os.path.join(project_folder, "encoding.py"))
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch.dict(sys.modules, {"orjson": None}):
+        spec.loader.exec_module(module)
+    return module
+
+class TestEncoding(unittest.TestCase):
+
+    DATA = {
+        "day": date(2024, 1, 5),
+        "status": VehicleStatus.RENTED,
+        "prices": np.array([[1.5, 2.0], [3.0, 4.25]]),
+        "free": np.array([True, False]),
+        "count": np.int64(3),
+        "total": np.float64(12.5),
+        "label": "Calèche à deux chevaux",
+    }
+    EXPECTED = {
+        "day": "2024-01-05", "status": "Loué", "prices": [[1.5, 2.0], [3.0, 4.25]], "free": [True, False],
+        "count": 3, "total": 12.5, "label": "Calèche à deux chevaux",
+    }
+
+    def backends(self):
+        return [encoding, load_json_backend()]
+
+    def test_memes_valeurs_pour_les_deux_moteurs(self):
+        for backend in self.backends():
+            with self.subTest(backend=backend.BACKEND):
+                raw = backend.dumps(self.DATA)
+                self.assertIsInstance(raw, bytes)
+                self.assertEqual(backend.loads(raw), self.EXPECTED)
+                self.assertEqual(backend.loads(backend.dumps(self.DATA, indent=True)), self.EXPECTED)
+        self.assertEqual(load_json_backend().BACKEND, "json")
+
+    def test_aller_retour_d_un_vehicule(self):
+        car = Car(1, 50.0, "Peugeot", "208", "AA-1", 2020, 5, True)
+        for backend in self.backends():
+            with self.subTest(backend=backend.BACKEND):
+                self.assertEqual(backend.loads(backend.dumps(car.to_dict())), car.to_dict())
+
+    def test_type_inconnu(self):
+        for backend in self.backends():
+            with self.subTest(backend=backend.BACKEND):
+                with self.assertRaises(TypeError):
+                    backend.dumps({"x": object()})
+
+if __name__ == '__main__':
+    unittest.main()
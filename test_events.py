@@ -0,0 +1,105 @@
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import date
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+import sse
+from fleet.enums import VehicleStatus
+from fleet.vehicles import Car
+from clients.customer import Customer
+from location.events import EventLog
+from location.system import CarRentalSystem
+from storage import StorageManager
+
+class TestEventLog(unittest.TestCase):
+
+    def test_apres_une_version(self):
+        log = EventLog()
+        for version, kind in ((1, "a"), (2, "b"), (2, "c"), (3, "d")):
+            log.record(version, kind, {})
+        self.assertEqual([e[1] for e in log.after(1)], ["b", "c", "d"])
+        self.assertEqual(log.after(3), [])
+        self.assertEqual(len(log.after(0)), 4)
+
+    def test_evenements_oublies(self):
+        log = EventLog(capacity=2)
+        for version in (1, 2, 3):
+            log.record(version, "x", {})
+        self.assertEqual(log.floor, 1)
+        self.assertIsNone(log.after(0))
+        self.assertEqual([e[0] for e in log.after(1)], [2, 3])
+
+    def test_abonnes_et_chargement(self):
+        log, calls = EventLog(), []
+        listener = lambda: calls.append(1)
+        log.subscribe(listener)
+        log.record(1, "x", {})
+        log.recording = False
+        log.record(2, "y", {})
+        log.unsubscribe(listener)
+        log.unsubscribe(listener)  # Déjà retiré : sans effet
+        log.recording = True
+        log.record(3, "z", {})
+        self.assertEqual((len(calls), len(log)), (1, 2))
+
+class TestSseFormat(unittest.TestCase):
+
+    def test_message(self):
+        self.assertEqual(sse.message("reset", {"from": 3}, 7), b'event: reset\nid: 7\ndata: {"from":3}\n\n')
+        self.assertEqual(sse.message("x", {"t": "a\nb"}), b'event: x\ndata: {"t":"a\\nb"}\n\n')
+
+    def test_id_sur_le_dernier_de_chaque_version(self):
+        text = sse.format_events([(4, "vehicle_status", {"id": 1}), (5, "maintenance", {}),
+                                  (5, "vehicle_status", {"id": 2})]).decode()
+        blocks = text.split("\n\n")[:-1]
+        self.assertEqual(["id: " in block for block in blocks], [True, False, True])
+        self.assertIn("id: 5\n", blocks[2])
+
+class TestSystemEvents(unittest.TestCase):
+
+    def setUp(self):
+        self.system = CarRentalSystem()
+        self.system.add_customer(Customer(1, "Doe", "John", 30, "B-1", "j@x", "06", "john", "pw"))
+        self.system.add_vehicle(Car(1, 50.0, "Peugeot", "208", "AA-1", 2020, 5, True))
+
+    def test_evenements_publies(self):
+        start = self.system.version
+        with contextlib.redirect_stdout(io.StringIO()):
+            rental = self.system.create_rental(1, 1, date(2030, 1, 1), date(2030, 1, 3))
+            self.system.close_rental(rental, "2030-01-03")
+        self.system.set_vehicle_status(self.system.find_vehicle(1), VehicleStatus.OUT_OF_SERVICE)
+        events = self.system.events.after(start)
+        # Une location change aussi le statut du véhicule : deux événements, une version
+        self.assertEqual([(e[0] - start, e[1]) for e in events], [
+            (1, "rental_created"), (1, "vehicle_status"), (2, "rental_returned"), (2, "vehicle_status"),
+            (3, "vehicle_status"),
+        ])
+        self.assertEqual(events[-1][0], self.system.version)
+        # Même encodage que les réponses : statut par sa valeur
+        self.assertIn(b'"status":"Hors Service"', sse.format_events(events[-1:]))
+
+    def test_rien_au_chargement(self):
+        directory = tempfile.mkdtemp()
+        try:
+            storage = StorageManager(os.path.join(directory, "data.json"))
+            storage.save_system(self.system)
+            with contextlib.redirect_stdout(io.StringIO()):
+                loaded = storage.load_system()
+        finally:
+            shutil.rmtree(directory)
+        self.assertEqual(len(loaded.events), 0)
+        # Avant le chargement : plus rien à rejouer, le client doit tout relire
+        self.assertIsNone(loaded.events.after(loaded.version - 1))
+        self.assertEqual(loaded.events.after(loaded.version), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import date
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.enums import MaintenanceType
+from fleet.maintenance import Maintenance
+from fleet.vehicles import Car
+from clients.customer import Customer
+from location.system import CarRentalSystem
+from location.archive import RentalArchive
+from exports import iter_fleet, iter_rentals, iter_maintenance, ndjson_chunks
+
+def build_system(columnar=False):
+    system = CarRentalSystem(columnar=columnar)
+    system.add_customer(Customer(1, "Doe", "John", 30, "B-1", "j@x", "06", "john", "pw"))
+    for i in range(5):
+        system.add_vehicle(Car(i + 1, 50.0 + i, "Peugeot", "208", f"AA-{i}", 2020, 5, True))
+    return system
+
+class TestFleetExport(unittest.TestCase):
+
+    def test_export_complet(self):
+        for columnar in (False, True):
+            with self.subTest(columnar=columnar):
+                system = build_system(columnar)
+                self.assertEqual(list(iter_fleet(system)), [v.to_dict() for v in system.search_vehicles()])
+
+    def test_depuis_une_version(self):
+        system = build_system()
+        since = system.version
+        system.set_vehicle_status(system.find_vehicle(4), system.find_vehicle(4).status)
+        system.remove_vehicle(system.find_vehicle(2))
+        system.add_vehicle(Car(9, 90.0, "Renault", "Clio", "ZZ-9", 2021, 5, True))
+        records = list(iter_fleet(system, since))
+        self.assertEqual([r["id"] for r in records], [2, 4, 9])
+        self.assertEqual(records[0], {"id": 2, "deleted": True})
+        self.assertEqual(list(iter_fleet(system, system.version)), [])
+
+    def test_retrait_pendant_l_export(self):
+        for columnar in (False, True):
+            with self.subTest(columnar=columnar):
+                system = build_system(columnar)
+                records = iter_fleet(system)
+                first = next(records)
+                # Ids copiés au départ : le retrait ne décale ni ne répète rien
+                system.remove_vehicle(system.find_vehicle(3))
+                self.assertEqual([first["id"]] + [r["id"] for r in records], [1, 2, 4, 5])
+
+class TestRentalAndMaintenanceExport(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.system = build_system()
+        self.system.archive = RentalArchive(self.directory)
+        self.system.archive.append([{"id": 1, "customer_id": 1, "vehicle_id": 1, "start_date": "2023-01-01",
+                                     "end_date": "2023-01-03", "actual_return_date": "2023-01-03",
+                                     "is_active": False, "total_cost": 100.0, "penalty": 0.0, "version": 2}])
+        self.system.last_rental_id = 1
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def rent(self, vehicle_id):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.system.create_rental(1, vehicle_id, date(2030, 1, 1), date(2030, 1, 3))
+
+    def test_archive_puis_memoire(self):
+        rental = self.rent(2)
+        self.assertEqual([r["id"] for r in iter_rentals(self.system)], [1, rental.id])
+
+    def test_locations_depuis_une_version(self):
+        since = self.system.version
+        rental = self.rent(2)
+        # Archivée à la version 2 : avant `since`, donc pas réexportée
+        self.assertEqual([r["id"] for r in iter_rentals(self.system, since)], [rental.id])
+        self.assertEqual([r["id"] for r in iter_rentals(self.system, 1)], [1, rental.id])
+
+    def test_maintenance(self):
+        car = self.system.find_vehicle(3)
+        since = self.system.version
+        self.system.add_maintenance(car, Maintenance(1, date(2024, 1, 1), MaintenanceType.OIL_CHANGE, 80.0, "Vidange", 1))
+        rows = list(iter_maintenance(self.system))
+        self.assertEqual([(r["vehicle_id"], r["cost"]) for r in rows], [(3, 80.0)])
+        self.assertEqual(list(iter_maintenance(self.system, since)), rows)
+        self.assertEqual(list(iter_maintenance(self.system, self.system.version)), [])
+
+class TestNdjsonChunks(unittest.TestCase):
+
+    def test_morceaux(self):
+        records = [{"id": i, "label": "é"} for i in range(5)]
+        chunks = list(ndjson_chunks(records, chunk_size=2))
+        self.assertEqual(len(chunks), 3)
+        self.assertTrue(all(chunk.endswith(b"\n") for chunk in chunks))
+        lines = b"".join(chunks).decode("utf-8").splitlines()
+        self.assertEqual([json.loads(line) for line in lines], records)
+        self.assertEqual(list(ndjson_chunks([])), [])
+
+if __name__ == '__main__':
+    unittest.main()
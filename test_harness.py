@@ -0,0 +1,89 @@
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.enums import VehicleStatus
+from fleet.vehicles import Carriage, Cart
+from fleet.animals import Horse, Donkey
+from location.system import CarRentalSystem
+from storage import StorageManager
+
+class TestHarnessIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.system = CarRentalSystem()
+        self.carriage = Carriage(1, 80.0, 4, True)
+        self.cart = Cart(2, 30.0, 2, 300)
+        self.horses = [Horse(10 + i, 60.0, f"Cheval {i}", "Frison", 6, 150, 40, 12) for i in range(2)]
+        self.donkey = Donkey(20, 20.0, "Cadichon", "Provence", 8, 60, True)
+        for element in [self.carriage, self.cart, *self.horses, self.donkey]:
+            self.system.add_vehicle(element)
+
+    def harness(self, towed, animal):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.system.harness_animal(towed, animal)
+
+    def test_liens_dans_les_deux_sens(self):
+        self.assertTrue(self.harness(self.carriage, self.horses[0]))
+        self.assertTrue(self.harness(self.carriage, self.horses[1]))
+        index = self.system.harness
+        self.assertIs(index.towed_of(self.horses[1].id), self.carriage)
+        self.assertEqual(index.team_of(self.carriage.id), self.horses)
+        self.assertIs(index.team_of(self.carriage.id), self.carriage.animals)
+        self.assertFalse(index.is_harnessed(self.donkey.id))
+
+    def test_animal_deja_attele(self):
+        self.harness(self.carriage, self.horses[0])
+        self.assertFalse(self.harness(self.carriage, self.horses[0]))
+        self.assertEqual(len(self.carriage.animals), 1)
+
+    def test_regles_du_vehicule(self):
+        self.assertFalse(self.harness(self.cart, self.horses[0]))
+        self.assertFalse(self.system.harness.is_harnessed(self.horses[0].id))
+        self.assertTrue(self.harness(self.cart, self.donkey))
+
+    def test_disponibilite_de_l_attelage(self):
+        self.harness(self.carriage, self.horses[0])
+        self.assertTrue(self.system.harness.is_team_available(self.carriage))
+        self.horses[0].status = VehicleStatus.RENTED
+        self.assertFalse(self.system.harness.is_team_available(self.carriage))
+
+    def test_retrait(self):
+        self.harness(self.carriage, self.horses[0])
+        self.system.remove_vehicle(self.horses[0])
+        self.assertFalse(self.system.harness.is_harnessed(self.horses[0].id))
+        self.assertEqual(self.carriage.animals, [])
+
+        self.harness(self.cart, self.donkey)
+        self.system.remove_vehicle(self.cart)
+        self.assertFalse(self.system.harness.is_harnessed(self.donkey.id))
+
+    def test_rechargement(self):
+        self.harness(self.carriage, self.horses[0])
+        self.harness(self.carriage, self.horses[1])
+        directory = tempfile.mkdtemp()
+        try:
+            storage = StorageManager(os.path.join(directory, "data.json"))
+            storage.save_system(self.system)
+            with contextlib.redirect_stdout(io.StringIO()):
+                loaded = storage.load_system()
+        finally:
+            shutil.rmtree(directory)
+
+        # Les animaux sont chargés après la calèche : liens résolus en attente
+        carriage = loaded.find_vehicle(self.carriage.id)
+        self.assertEqual([a.id for a in carriage.animals], [h.id for h in self.horses])
+        self.assertIs(loaded.harness.towed_of(self.horses[1].id), carriage)
+        self.assertIs(carriage.animals[0], loaded.find_vehicle(self.horses[0].id))
+
+if __name__ == '__main__':
+    unittest.main()
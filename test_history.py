@@ -0,0 +1,126 @@
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import date
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.vehicles import Car
+from clients.customer import Customer
+from location.system import CarRentalSystem
+from location.archive import RentalArchive
+from location.history import RentalHistoryRepository
+
+class TestRentalHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.system = CarRentalSystem()
+        self.system.archive = RentalArchive(self.directory)
+        for c_id in (1, 2):
+            self.system.add_customer(Customer(c_id, "Doe", f"Client {c_id}", 30, f"B-{c_id}", "j@x", "06",
+                                              f"user{c_id}", "pw"))
+        for v_id in (1, 2):
+            self.system.add_vehicle(Car(v_id, 50.0, "Peugeot", "208", f"AA-{v_id}", 2020, 5, True))
+
+        # 12 locations archivées, de janvier à juin 2023 (deux par mois), clients en alternance
+        self.system.archive.append([
+            {"id": i, "customer_id": 1 + i % 2, "vehicle_id": 1, "start_date": f"2023-{1 + (i - 1) // 2:02d}-01",
+             "end_date": f"2023-{1 + (i - 1) // 2:02d}-{2 + i % 2:02d}",
+             "actual_return_date": f"2023-{1 + (i - 1) // 2:02d}-{2 + i % 2:02d}", "is_active": False,
+             "total_cost": 10.0 * i, "penalty": 0.0, "version": i}
+            for i in range(1, 13)
+        ])
+        self.system.last_rental_id = 12
+        # Deux clôturées encore en mémoire, une en cours
+        with contextlib.redirect_stdout(io.StringIO()):
+            for returned in ("2024-01-03", "2024-01-05"):
+                rental = self.system.create_rental(1, 2, date(2024, 1, 1), date(2024, 1, 3))
+                self.system.close_rental(rental, returned)
+            self.system.create_rental(2, 2, date(2024, 2, 1), date(2024, 2, 3))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_ordre_et_origine(self):
+        rows = list(self.system.history.iter_summaries())
+        self.assertEqual(len(rows), 14)
+        returned = [r.actual_return_date for r in rows]
+        self.assertEqual(returned, sorted(returned, reverse=True))
+        self.assertEqual([r.month for r in rows[:2]], [None, None])
+        self.assertEqual(rows[2].month, "2023-06")
+        self.assertEqual(rows[2].vehicle_label, "Peugeot 208")
+
+    def test_pages(self):
+        full = [r.id for r in self.system.history.iter_summaries()]
+        pages, page, more = [], 1, True
+        while more:
+            rows, more = self.system.history.page(page=page, page_size=3)
+            pages.extend(r.id for r in rows)
+            page += 1
+        self.assertEqual(pages, full)
+        self.assertEqual(page - 1, 5)
+        # Sauts de mois entiers (index) ou en partie : même résultat qu'un découpage de la liste
+        for skip in (0, 2, 5, 6, 13, 20):
+            with self.subTest(skip=skip):
+                self.assertEqual([r.id for r in self.system.history.iter_summaries(skip=skip)], full[skip:])
+
+    def test_filtres(self):
+        rows = list(self.system.history.iter_summaries(customer_id=2))
+        self.assertEqual([r.customer_id for r in rows], [2] * 6)
+        self.assertEqual([r.id for r in self.system.history.iter_summaries(customer_id=2, skip=4)],
+                         [r.id for r in rows][4:])
+        period = list(self.system.history.iter_summaries(start=date(2023, 3, 1), end=date(2023, 4, 30)))
+        self.assertEqual(sorted(r.id for r in period), [5, 6, 7, 8])
+
+    def test_totaux_par_client(self):
+        in_memory = sum(r.total_cost for r in self.system.rentals if not r.is_active)
+        self.assertEqual(self.system.history.totals(), (14, sum(10.0 * i for i in range(1, 13)) + in_memory))
+        self.assertEqual(self.system.history.totals(1), (8, sum(10.0 * i for i in range(2, 13, 2)) + in_memory))
+        self.assertEqual(self.system.history.totals(2), (6, sum(10.0 * i for i in range(1, 13, 2))))
+        self.assertEqual(self.system.history.totals(9), (0, 0.0))
+
+    def test_hydratation_a_la_demande(self):
+        history = self.system.history
+        rows = list(history.iter_summaries())
+        # Ligne en mémoire : l'objet existant, rien en cache
+        self.assertIs(history.get(rows[0]), next(r for r in self.system.rentals if r.id == rows[0].id))
+        self.assertEqual(len(history), 0)
+
+        rental = history.get(rows[2])
+        self.assertEqual((rental.id, rental.total_cost, rental.is_active), (rows[2].id, rows[2].total_cost, False))
+        self.assertIs(rental.customer, self.system.find_customer(rows[2].customer_id))
+        self.assertIs(history.get(rows[2]), rental)
+        self.assertEqual(len(history), 1)
+
+    def test_cache_borne(self):
+        history = RentalHistoryRepository(self.system, capacity=2)
+        rows = [r for r in history.iter_summaries() if r.month is not None]
+        first = history.get(rows[0])
+        second = history.get(rows[1])
+        history.get(rows[0])  # Le plus récent : c'est rows[1] qui sortira
+        history.get(rows[2])
+        self.assertEqual(len(history), 2)
+        self.assertIs(history.get(rows[0]), first)
+        # Relue dans sa partition : nouvel objet, mêmes valeurs
+        again = history.get(rows[1])
+        self.assertIsNot(again, second)
+        self.assertEqual(again.to_dict(), second.to_dict())
+        self.assertEqual(len(history), 2)
+
+    def test_vehicule_retire(self):
+        row = next(r for r in self.system.history.iter_summaries() if r.month is not None)
+        self.system.remove_vehicle(self.system.find_vehicle(1))
+        self.assertEqual(next(r for r in self.system.history.iter_summaries() if r.month is not None).vehicle_label,
+                         "Véhicule #1 (retiré)")
+        self.assertIsNone(self.system.history.get(row))
+
+if __name__ == '__main__':
+    unittest.main()
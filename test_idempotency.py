@@ -0,0 +1,133 @@
+import asyncio
+import os
+import sys
+import unittest
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from starlette.exceptions import HTTPException
+
+from encoding import loads
+from idempotency import IdempotencyStore
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestIdempotencyStore(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.store = IdempotencyStore(max_entries=10, ttl=60, clock=self.clock)
+        self.calls = 0
+
+    async def handler(self):
+        self.calls += 1
+        return {"rental_id": self.calls}
+
+    def run_store(self, key, request, handler=None, durable=None):
+        return asyncio.run(self.store.run(key, request, handler or self.handler, durable))
+
+    def test_rejoue_la_meme_reponse(self):
+        first = self.run_store("k1", ("POST /rentals/", 1))
+        second = self.run_store("k1", ("POST /rentals/", 1))
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(second.body, first.body)
+        self.assertEqual(second.headers["Idempotent-Replayed"], "true")
+        self.assertNotIn("Idempotent-Replayed", first.headers)
+        self.assertEqual(self.store.replays, 1)
+
+    def test_tentatives_simultanees(self):
+        async def both():
+            return await asyncio.gather(*(self.store.run("k1", "req", self.handler) for _ in range(3)))
+
+        responses = asyncio.run(both())
+        self.assertEqual(self.calls, 1)
+        self.assertEqual({r.body for r in responses}, {responses[0].body})
+
+    def test_conflit(self):
+        self.run_store("k1", ("POST /rentals/", 1))
+        with self.assertRaises(HTTPException) as ctx:
+            self.run_store("k1", ("POST /rentals/", 2))
+        self.assertEqual(ctx.exception.status_code, 422)
+        self.assertEqual(self.calls, 1)
+
+    def test_erreur_client_gardee(self):
+        async def refused():
+            self.calls += 1
+            raise HTTPException(status_code=400, detail="déjà loué")
+
+        first = self.run_store("k1", "req", refused)
+        second = self.run_store("k1", "req", refused)
+        self.assertEqual((first.status_code, second.status_code), (400, 400))
+        self.assertEqual(self.calls, 1)
+
+    def test_erreur_serveur_non_gardee(self):
+        async def unavailable():
+            self.calls += 1
+            raise HTTPException(status_code=503, detail="indisponible")
+
+        for _ in range(2):
+            with self.assertRaises(HTTPException):
+                self.run_store("k1", "req", unavailable)
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(len(self.store), 0)
+
+    def test_sauvegarde_ratee(self):
+        async def failing_save(result):
+            raise HTTPException(status_code=503, detail="sauvegarde impossible")
+
+        with self.assertRaises(HTTPException):
+            self.run_store("k1", "req", durable=failing_save)
+        # La modification est faite en mémoire : la nouvelle tentative reçoit la réponse d'origine
+        retry = self.run_store("k1", "req")
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(loads(retry.body), {"rental_id": 1})
+
+    def test_nouvel_essai_aussi_sauvegarde(self):
+        saved = []
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                await asyncio.sleep(0)
+                raise HTTPException(status_code=503, detail="indisponible")
+            return {"rental_id": len(attempts)}
+
+        async def save(result):
+            saved.append(result)
+
+        async def both():
+            first = asyncio.create_task(self.store.run("k1", "req", flaky, save))
+            await asyncio.sleep(0)
+            # Attend la première tentative, puis recommence elle-même après son 503
+            second = await self.store.run("k1", "req", flaky, save)
+            with self.assertRaises(HTTPException):
+                await first
+            return second
+
+        response = asyncio.run(both())
+        self.assertEqual(loads(response.body), {"rental_id": 2})
+        # La tentative qui a réussi a bien été sauvegardée
+        self.assertEqual(saved, [{"rental_id": 2}])
+
+    def test_expiration(self):
+        self.run_store("k1", "req")
+        self.clock.now = 61
+        self.run_store("k1", "req")
+        self.assertEqual(self.calls, 2)
+
+    def test_sans_cle(self):
+        self.assertEqual(self.run_store(None, "req"), {"rental_id": 1})
+        self.assertEqual(self.run_store(None, "req"), {"rental_id": 2})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import zipfile
+from datetime import date
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.vehicles import Car
+from clients.customer import Customer
+from location.system import CarRentalSystem
+from location.rental import Rental
+from location.invoices import export_invoices, invoice_record, render_invoice, render_many
+from storage import StorageManager
+
+def closed_system(count=5):
+    system = CarRentalSystem()
+    system.add_customer(Customer(1, "Doe", "John", 30, "B-1", "j@x", "06", "john", "pw"))
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(count):
+            system.add_vehicle(Car(i + 1, 40.0 + 10 * i, "Peugeot", "208", f"AA-{i}", 2020, 5, True))
+            rental = system.create_rental(1, i + 1, date(2024, 1, 1), date(2024, 1, 3))
+            system.close_rental(rental, date(2024, 1, 2 + i))
+    return system
+
+class TestInvoiceRendering(unittest.TestCase):
+
+    def setUp(self):
+        self.rental = closed_system(1).rentals[0]
+
+    def test_facture_mise_en_cache(self):
+        text = self.rental.generate_invoice()
+        self.assertIs(self.rental.generate_invoice(), text)
+        self.assertEqual(text, render_invoice(invoice_record(self.rental)))
+
+    def test_cache_invalide_si_la_location_change(self):
+        text = self.rental.generate_invoice()
+        self.rental.penalty, self.rental.total_cost = 10.0, self.rental.total_cost + 10.0
+        updated = self.rental.generate_invoice()
+        self.assertNotEqual(updated, text)
+        self.assertIn("PÉNALITÉ RETARD  : +10.00 €", updated)
+
+    def test_location_en_cours(self):
+        rental = closed_system(1).rentals[0]
+        rental.is_active = True
+        self.assertTrue(rental.generate_invoice().startswith("❌"))
+
+class TestInvoiceExport(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.system = closed_system()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_parallele_comme_en_serie(self):
+        records = [invoice_record(r) for r in self.system.rentals]
+        serial = list(render_many(records, parallel=False))
+        self.assertEqual(list(render_many(records, workers=2, chunk_size=2)), serial)
+        self.assertEqual([rental_id for rental_id, _ in serial], [r.id for r in self.system.rentals])
+
+    def test_zip_et_texte(self):
+        zip_path, txt_path = os.path.join(self.directory, "f.zip"), os.path.join(self.directory, "f.txt")
+        self.assertEqual(export_invoices(self.system.rentals, zip_path, workers=1), 5)
+        self.assertEqual(export_invoices(self.system.rentals, txt_path, workers=1), 5)
+        with zipfile.ZipFile(zip_path) as archive:
+            texts = [archive.read(name).decode("utf-8") for name in archive.namelist()]
+        self.assertEqual(texts, [r.generate_invoice() for r in self.system.rentals])
+        with open(txt_path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "".join(text + "\n" for text in texts))
+
+    def test_periode_et_locations_actives(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.system.add_vehicle(Car(99, 50.0, "Renault", "Clio", "ZZ-1", 2021, 5, True))
+            self.system.create_rental(1, 99, date(2024, 1, 1), date(2024, 1, 3))
+        path = os.path.join(self.directory, "f.zip")
+        # Retours du 2 au 6 janvier ; la location encore en cours n'a pas de facture
+        self.assertEqual(export_invoices(self.system.rentals, path, date(2024, 1, 3), date(2024, 1, 5), workers=1), 3)
+        self.assertEqual(export_invoices(self.system.rentals, path, workers=1), 5)
+
+class TestArchivedInvoices(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.storage = StorageManager(os.path.join(self.directory, "data.json"))
+        system = CarRentalSystem()
+        system.add_customer(Customer(1, "Doe", "John", 30, "B-1", "j@x", "06", "john", "pw"))
+        system.add_vehicle(Car(1, 50.0, "Peugeot", "208", "AA-123-BB", 2020, 5, True))
+        system.add_vehicle(Car(2, 80.0, "Renault", "Clio", "CC-456-DD", 2021, 5, True))
+        with contextlib.redirect_stdout(io.StringIO()):
+            for vehicle_id in (1, 2):
+                rental = system.create_rental(1, vehicle_id, date(2024, 1, 1), date(2024, 1, 3))
+                system.close_rental(rental, "2024-01-04")
+            self.storage.save_system(system)
+            # Rechargé : les retours de 2024 sont dans l'archive, plus en mémoire
+            self.system = self.storage.load_system()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def export(self, start=None, end=None):
+        path = os.path.join(self.directory, "factures.zip")
+        rentals = list(self.system.rentals)
+        archived = self.system.archived_invoice_records(start, end, skip=[r.id for r in rentals])
+        count = export_invoices(rentals, path, start, end, workers=1, archived=archived)
+        with zipfile.ZipFile(path) as archive:
+            return count, {name: archive.read(name).decode("utf-8") for name in archive.namelist()}
+
+    def test_locations_archivees_exportees(self):
+        self.assertEqual(self.system.rentals, [])
+        count, files = self.export(date(2024, 1, 1), date(2024, 1, 31))
+        self.assertEqual(count, 2)
+        self.assertEqual(sorted(files), ["facture_0001.txt", "facture_0002.txt"])
+        self.assertIn("Doe John", files["facture_0001.txt"])
+        self.assertIn("Peugeot 208", files["facture_0001.txt"])
+        self.assertIn("TOTAL À PAYER    : 155.00 €", files["facture_0001.txt"])
+
+    def test_hors_periode(self):
+        self.assertEqual(self.export(date(2024, 2, 1), date(2024, 2, 29))[0], 0)
+
+    def test_meme_facture_qu_en_memoire(self):
+        rental = self.system.history.get(next(self.system.history.iter_summaries()))
+        _, files = self.export()
+        self.assertEqual(files[f"facture_{rental.id:04d}.txt"], rental.generate_invoice())
+
+    def test_vehicule_retire(self):
+        self.system.remove_vehicle(self.system.find_vehicle(2))
+        _, files = self.export()
+        self.assertIn("Véhicule #2 (retiré)", files["facture_0002.txt"])
+        self.assertIn("Tarif journalier : 80.0 €", files["facture_0002.txt"])
+
+    def test_location_en_memoire_non_doublee(self):
+        rental = self.system.history.get(next(self.system.history.iter_summaries()))
+        self.system.rentals.append(rental)
+        self.assertEqual(self.export()[0], 2)
+
+if __name__ == '__main__':
+    unittest.main()
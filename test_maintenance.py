@@ -0,0 +1,68 @@
+import os
+import sys
+import unittest
+from datetime import date
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.enums import MaintenanceType
+from fleet.maintenance import Maintenance, MaintenanceLog
+from fleet.symbols import SYMBOLS
+from fleet.vehicles import Car
+
+class TestMaintenanceLog(unittest.TestCase):
+
+    def setUp(self):
+        self.entries = [
+            Maintenance(1, date(2024, 1, 10), MaintenanceType.CLEANING, 40, "Intérieur", 1),
+            Maintenance(2, date(2024, 3, 2), MaintenanceType.OIL_CHANGE, 89.5, "Vidange + filtre", 0.5),
+            Maintenance(3, date(2024, 2, 20), MaintenanceType.CLEANING, 35.0, "Extérieur", 1),
+        ]
+        self.log = MaintenanceLog(self.entries)
+
+    def test_agregats(self):
+        self.assertEqual(len(self.log), 3)
+        self.assertAlmostEqual(self.log.total_cost, 164.5)
+        self.assertEqual(self.log.count(MaintenanceType.CLEANING), 2)
+        self.assertEqual(self.log.count(MaintenanceType.TIRE_CHANGE), 0)
+        # Dernière intervention par date, pas par ordre d'ajout
+        self.assertEqual(self.log.last_service_date, date(2024, 3, 2))
+        self.assertAlmostEqual(self.log.total_downtime_days, 2.5)
+
+    def test_entrees_relues(self):
+        self.assertEqual([m.to_dict() for m in self.log], [m.to_dict() for m in self.entries])
+        self.assertEqual(self.log.to_dicts(), [m.to_dict() for m in self.entries])
+        self.assertEqual(self.log[-1].description, "Extérieur")
+
+    def test_tranches(self):
+        self.assertEqual([m.id for m in self.log[1:]], [2, 3])
+        self.assertEqual([m.id for m in self.log[::-1]], [3, 2, 1])
+        self.assertEqual(self.log[5:], [])
+
+    def test_entiers_gardes(self):
+        first = self.log[0]
+        self.assertIsInstance(first.cost, int)
+        self.assertIsInstance(first.duration, int)
+        self.assertIsInstance(self.log[2].cost, float)
+        self.assertEqual(self.log.columns()["cost"], [40, 89.5, 35.0])
+
+    def test_descriptions_hors_table_de_symboles(self):
+        before = len(SYMBOLS)
+        for i in range(50):
+            self.log.append(Maintenance(10 + i, date(2024, 4, 1), MaintenanceType.CLEANING, 10.0, f"Note libre n°{i}", 1))
+        self.assertEqual(len(SYMBOLS), before)
+        self.assertNotIn("Note libre n°7", SYMBOLS)
+
+    def test_aller_retour_vehicule(self):
+        car = Car(1, 50.0, "Peugeot", "208", "AA-123-BB", 2020, 5, True)
+        for m in self.entries:
+            car.add_maintenance(m)
+        restored = Car.from_dict(car.to_dict())
+        self.assertEqual(restored.maintenance_log.to_dicts(), self.log.to_dicts())
+        self.assertEqual(restored.maintenance_log.total_cost, self.log.total_cost)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import sys
+import threading
+import unittest
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from metrics import MetricsRegistry
+
+class TestMetricsRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_compteur(self):
+        counter = self.registry.counter("requests_total", "Requêtes", ("method", "status"))
+        counter.inc(1, "GET", "200")
+        counter.inc(2, "GET", "200")
+        counter.inc(1, "POST", 'a"b')
+        self.assertEqual(counter.value("GET", "200"), 3)
+        self.assertEqual(self.registry.render(), (
+            "# HELP requests_total Requêtes\n"
+            "# TYPE requests_total counter\n"
+            'requests_total{method="GET",status="200"} 3\n'
+            'requests_total{method="POST",status="a\\"b"} 1\n'
+        ))
+
+    def test_compteur_lu_ailleurs(self):
+        source = {"hits": 4}
+        self.registry.counter("hits_total", "Lectures", (), lambda: [((), source["hits"])])
+        source["hits"] = 7
+        self.assertIn("hits_total 7\n", self.registry.render())
+
+    def test_histogramme(self):
+        histogram = self.registry.histogram("wait_seconds", "Attente", ("route",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value, "/fleet")
+        self.assertEqual(histogram.count("/fleet"), 4)
+        lines = self.registry.render().splitlines()[2:]
+        self.assertEqual(lines, [
+            'wait_seconds_bucket{route="/fleet",le="0.1"} 2',
+            'wait_seconds_bucket{route="/fleet",le="1"} 3',
+            'wait_seconds_bucket{route="/fleet",le="+Inf"} 4',
+            'wait_seconds_sum{route="/fleet"} 3.65',
+            'wait_seconds_count{route="/fleet"} 4',
+        ])
+
+    def test_jauge(self):
+        fleet = {"Disponible": 3, "Loué": 1}
+        self.registry.gauge("fleet_vehicles", "Flotte", ("status",), lambda: [((k,), v) for k, v in fleet.items()])
+        fleet["Loué"] = 2
+        self.assertIn('fleet_vehicles{status="Loué"} 2', self.registry.render())
+
+    def test_meme_nom_meme_serie(self):
+        first = self.registry.counter("c_total", "C")
+        first.inc()
+        self.assertIs(self.registry.counter("c_total", "C"), first)
+        # Jauge déclarée à nouveau (module rechargé) : la dernière fonction de collecte l'emporte
+        self.registry.gauge("g", "G", (), lambda: [((), 1)])
+        self.registry.gauge("g", "G", (), lambda: [((), 2)])
+        self.assertIn("\ng 2\n", self.registry.render())
+
+    def test_plusieurs_threads(self):
+        counter = self.registry.counter("n_total", "N")
+        threads = [threading.Thread(target=lambda: [counter.inc() for _ in range(1000)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(counter.value(), 4000)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import os
+import sys
+import unittest
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.index import FleetIndex
+from fleet.enums import VehicleStatus
+from fleet.registry import CLASS_CODES
+from fleet.transport_base import TransportAnimal
+from fleet.vehicles import Car, Boat
+from fleet.animals import Horse
+from clients.customer import Customer
+from location.system import CarRentalSystem
+from location.rental import Rental
+
+def make_vehicle(v_id):
+    """Classes en alternance : Voiture, Bateau, Cheval (ids non consécutifs)."""
+    kind = v_id % 3
+    if kind == 0:
+        return Car(v_id, 40.0 + v_id % 50, "Peugeot", "208", f"AA-{v_id}", 2020, 5, True)
+    if kind == 1:
+        return Boat(v_id, 40.0 + v_id % 50, "Bénéteau", "Flyer", f"BT-{v_id}", 2019, 6.5, 30.0)
+    return Horse(v_id, 40.0 + v_id % 50, "Jolly", "Arabe", 6, 450, 40, 12)
+
+def walk(pager, limit, **filters):
+    """Toutes les pages, curseur après curseur."""
+    ids, after = [], None
+    while True:
+        items, after = pager.page(after, limit, **filters)
+        ids.extend(v.id for v in items)
+        if after is None:
+            return ids
+
+def walk_vehicles(system, limit, **filters):
+    """Même chose avec CarRentalSystem.page_vehicles."""
+    ids, after = [], None
+    while True:
+        items, after = system.page_vehicles(after, limit, **filters)
+        ids.extend(v.id for v in items)
+        if after is None:
+            return ids
+
+class TestFleetIndexPage(unittest.TestCase):
+
+    def setUp(self):
+        self.vehicles = [make_vehicle(v_id) for v_id in range(97, 3, -7)]  # Ajoutés dans le désordre
+        self.index = FleetIndex(self.vehicles)
+
+    def test_plusieurs_classes_avec_curseur(self):
+        codes = [CLASS_CODES[Car], CLASS_CODES[Horse]]
+        expected = sorted(v.id for v in self.vehicles if isinstance(v, (Car, Horse)))
+
+        for limit in (1, 2, 5, len(expected), len(expected) + 1):
+            self.assertEqual(walk(self.index, limit, codes=codes), expected)
+
+        # Curseur placé entre deux ids d'une autre classe
+        boat = next(v.id for v in sorted(self.vehicles, key=lambda v: v.id) if isinstance(v, Boat))
+        items, _ = self.index.page(boat, 3, codes)
+        self.assertEqual([v.id for v in items], [i for i in expected if i > boat][:3])
+
+    def test_plusieurs_classes_et_filtres(self):
+        self.vehicles[0].status = VehicleStatus.RENTED
+        self.vehicles[3].status = VehicleStatus.RENTED
+        codes = [CLASS_CODES[Boat], CLASS_CODES[Horse]]
+        expected = sorted(v.id for v in self.vehicles if isinstance(v, (Boat, Horse))
+                          and v.status == VehicleStatus.AVAILABLE and v.daily_rate <= 70)
+
+        self.assertEqual(walk(self.index, 2, codes=codes, status=VehicleStatus.AVAILABLE, max_price=70), expected)
+
+    def test_derniere_page_sans_curseur(self):
+        codes = [CLASS_CODES[Car], CLASS_CODES[Boat], CLASS_CODES[Horse]]
+        items, after = self.index.page(None, len(self.vehicles), codes)
+        self.assertEqual(len(items), len(self.vehicles))
+        self.assertIsNone(after)
+
+    def test_element_retire(self):
+        removed = self.vehicles[5]
+        self.index.remove(removed)
+        codes = [CLASS_CODES[type(removed)]]
+        self.assertNotIn(removed.id, walk(self.index, 3, codes=codes))
+
+class TestSystemPages(unittest.TestCase):
+    """Mêmes pages en mode liste (FleetIndex) et en mode colonnaire (ColumnarFleet)."""
+
+    def build(self, columnar):
+        system = CarRentalSystem(columnar=columnar)
+        for v_id in range(97, 3, -7):
+            vehicle = make_vehicle(v_id)
+            if v_id % 2:
+                vehicle.status = VehicleStatus.RENTED
+            system.add_vehicle(vehicle)
+        system.remove_vehicle(system.find_vehicle(48))
+        return system
+
+    def expected(self, system, vehicle_types=None, status=None, max_price=None):
+        return sorted(v.id for v in system.fleet
+                      if (vehicle_types is None or isinstance(v, tuple(vehicle_types)))
+                      and (status is None or v.status == status)
+                      and (max_price is None or v.daily_rate <= max_price))
+
+    def test_flotte_liste_et_colonnaire(self):
+        cases = [{}, {"vehicle_types": [Car, Horse]}, {"vehicle_types": [TransportAnimal]},
+                 {"status": VehicleStatus.AVAILABLE, "max_price": 70}]
+        for columnar in (False, True):
+            system = self.build(columnar)
+            for filters in cases:
+                for limit in (1, 4, 50):
+                    with self.subTest(columnar=columnar, limit=limit, **filters):
+                        self.assertEqual(walk_vehicles(system, limit, **filters), self.expected(system, **filters))
+
+    def test_meme_resultat_dans_les_deux_modes(self):
+        pages = []
+        for columnar in (False, True):
+            system = self.build(columnar)
+            items, after = system.page_vehicles(20, 3, [Car, Boat])
+            pages.append(([v.id for v in items], after))
+        self.assertEqual(pages[0], pages[1])
+        self.assertEqual(pages[0][1], pages[0][0][-1])
+
+    def test_locations(self):
+        system = self.build(False)
+        clients = [Customer(i, "Doe", "John", 30, f"B-{i}", "j@x", "06", f"john{i}", "pw") for i in (1, 2)]
+        for c in clients:
+            system.add_customer(c)
+        for i, v in enumerate(v for v in system.fleet if v.is_available):
+            system.add_rental(Rental(clients[i % 2], v, "2024-01-01", "2024-01-05"))
+
+        ids, after = [], None
+        while True:
+            items, after = system.page_rentals(after, 2, customer_id=2)
+            ids.extend(r.id for r in items)
+            if after is None:
+                break
+        expected = [r.id for r in system.rentals if r.customer.id == 2]
+        self.assertGreater(len(expected), 2)
+        self.assertEqual(ids, expected)
+
+        items, after = system.page_customers(None, 1)
+        self.assertEqual(([c.id for c in items], after), ([1], 1))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import asyncio
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import date
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.vehicles import Car
+from clients.customer import Customer
+from location.system import CarRentalSystem
+from location.archive import RentalArchive
+from persistence import Durability, PersistenceWriter, lock_data_file
+from storage import StorageManager
+
+class TestPersistenceWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.storage = StorageManager(os.path.join(self.directory, "data.json"))
+        self.system = CarRentalSystem()
+        self.system.archive = RentalArchive(self.storage.archive_dir)
+        self.system.add_customer(Customer(1, "Doe", "John", 30, "B-1", "j@x", "06", "john", "pw"))
+        for i in range(3):
+            self.system.add_vehicle(Car(i + 1, 50.0, "Peugeot", "208", f"AA-{i}", 2020, 5, True))
+        self.writer = PersistenceWriter(self.storage, self.system)
+
+    def tearDown(self):
+        self.writer._executor.shutdown()
+        shutil.rmtree(self.directory)
+
+    def saved(self) -> dict:
+        with open(self.storage.filename, encoding="utf-8") as f:
+            return json.load(f)
+
+    def rent(self, vehicle_id, returned=None):
+        with contextlib.redirect_stdout(io.StringIO()):
+            rental = self.system.create_rental(1, vehicle_id, date(2023, 1, 1), date(2023, 1, 3))
+            if returned:
+                self.system.close_rental(rental, returned)
+        return rental
+
+    def run_writer(self, coroutine):
+        async def main():
+            try:
+                return await coroutine()
+            finally:
+                await self.writer.close()
+        with contextlib.redirect_stdout(io.StringIO()):
+            return asyncio.run(main())
+
+    def test_disque(self):
+        async def scenario():
+            self.rent(1)
+            await self.writer.commit(Durability.DISK)
+            # Écrit avant la réponse
+            self.assertEqual(len(self.saved()["rentals"]), 1)
+        self.run_writer(scenario)
+        self.assertEqual(self.writer.writes, 1)
+
+    def test_memoire(self):
+        async def scenario():
+            self.rent(1)
+            await self.writer.commit(Durability.MEMORY)
+            self.assertFalse(os.path.exists(self.storage.filename))
+            await self.writer.flush()
+            self.assertEqual(len(self.saved()["rentals"]), 1)
+        self.run_writer(scenario)
+
+    def test_modifications_regroupees(self):
+        async def scenario():
+            await asyncio.gather(*(self.writer.commit(Durability.DISK) for _ in range(20)))
+        self.run_writer(scenario)
+        # Une écriture pour la première, une pour toutes celles arrivées pendant
+        self.assertLessEqual(self.writer.writes, 2)
+        self.assertEqual(self.saved()["version"], self.system.version)
+
+    def test_intervalle_d_archivage(self):
+        async def scenario():
+            self.rent(1, "2023-01-03")
+            await self.writer.commit(Durability.DISK)
+            # Première écriture : archivage fait tout de suite
+            self.assertEqual(self.system.rentals, [])
+            self.rent(2, "2023-01-03")
+            await self.writer.commit(Durability.DISK)
+            self.assertEqual(len(self.system.rentals), 1)  # Intervalle pas encore écoulé
+            self.writer.archive_interval = 0
+            await self.writer.commit(Durability.DISK)
+            self.assertEqual(self.system.rentals, [])
+        self.run_writer(scenario)
+        self.assertEqual(self.system.archive.totals()["count"], 2)
+        self.assertEqual(self.saved()["rentals"], [])
+
+    def test_erreur_d_archivage(self):
+        class BrokenArchive(RentalArchive):
+            def append(self, records):
+                raise OSError("disque plein")
+
+        self.system.archive = BrokenArchive(self.storage.archive_dir)
+        async def scenario():
+            self.rent(1, "2023-01-03")
+            await self.writer.commit(Durability.DISK)
+        self.run_writer(scenario)
+        # La copie est quand même écrite, la location reste en mémoire pour un nouvel essai
+        self.assertEqual(len(self.system.rentals), 1)
+        self.assertEqual(len(self.saved()["rentals"]), 1)
+
+    def test_erreur_d_ecriture(self):
+        def broken(snapshot):
+            raise OSError("disque plein")
+
+        self.storage.write_snapshot = broken
+        async def scenario():
+            with self.assertRaises(OSError):
+                await self.writer.commit(Durability.DISK)
+            # Durabilité "memory" : la réponse n'attend pas, l'erreur n'y remonte pas
+            await self.writer.commit(Durability.MEMORY)
+        # Sans close() : sa dernière écriture échouerait aussi (tâche annulée par asyncio.run)
+        with contextlib.redirect_stdout(io.StringIO()):
+            asyncio.run(scenario())
+
+    def test_nouvelle_boucle(self):
+        async def scenario():
+            await self.writer.commit(Durability.DISK)
+        for _ in range(2):
+            with contextlib.redirect_stdout(io.StringIO()):
+                asyncio.run(scenario())
+        self.assertEqual(self.writer.writes, 2)
+
+class TestDataFileLock(unittest.TestCase):
+
+    def test_un_seul_processus(self):
+        directory = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(directory, "data.json")
+            handle = lock_data_file(filename)
+            if handle is None:
+                self.skipTest("Pas de verrou sous Windows")
+            with self.assertRaises(RuntimeError):
+                lock_data_file(filename)
+            handle.close()
+            lock_data_file(filename).close()
+        finally:
+            shutil.rmtree(directory)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import contextlib
+import io
+import os
+import sys
+import unittest
+from datetime import date
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.enums import VehicleStatus
+from fleet.vehicles import Car, Boat
+from fleet.animals import Dragon
+from fleet.registry import class_code
+from clients.customer import Customer
+from location.pricing import PricingEngine, SeasonalMultiplier, LongRentalDiscount, ClassSurcharge, PenaltyPolicy
+from location.system import CarRentalSystem
+
+class TestPricingEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = PricingEngine()
+        self.engine.add_rule(SeasonalMultiplier([7, 8], 1.5))
+        self.engine.add_rule(LongRentalDiscount(7, 0.1))
+        self.engine.add_rule(ClassSurcharge({Dragon: 2.0}))
+        self.vehicles = [
+            Car(1, 50.0, "Peugeot", "208", "AA-123-BB", 2020, 5, True),
+            Boat(2, 120.0, "Bénéteau", "Flyer", "BT-1", 2019, 6.5, 30.0),
+            Dragon(3, 500.0, "Smaug", "Rouge", 150, 100.0, "Doré"),
+        ]
+        self.windows = [(date(2024, 6, 28), date(2024, 7, 3)), (date(2024, 7, 1), date(2024, 7, 1)),
+                        (date(2024, 8, 20), date(2024, 9, 10)), (date(2024, 3, 1), date(2024, 3, 8))]
+
+    def test_price_egal_quote(self):
+        for v in self.vehicles:
+            for start, end in self.windows:
+                days = max(1, (end - start).days)
+                vectorised = self.engine.price([class_code(v)], [v.daily_rate], [start.toordinal()], [days])
+                self.assertAlmostEqual(float(vectorised[0]), self.engine.quote(v, start, end))
+
+    def test_quote_many(self):
+        matrix = self.engine.quote_many(self.vehicles, self.windows)
+        self.assertEqual(matrix.shape, (3, 4))
+        for i, v in enumerate(self.vehicles):
+            for j, (start, end) in enumerate(self.windows):
+                self.assertAlmostEqual(matrix[i, j], self.engine.quote(v, start, end))
+
+    def test_regles(self):
+        car, _, dragon = self.vehicles
+        # Juillet : x1.5 ; 28-30 juin au tarif normal
+        self.assertAlmostEqual(self.engine.quote(car, date(2024, 6, 28), date(2024, 7, 3)), 50.0 * (3 + 2 * 1.5))
+        self.assertAlmostEqual(self.engine.quote(car, date(2024, 3, 1), date(2024, 3, 8)), 50.0 * 7 * 0.9)
+        self.assertAlmostEqual(self.engine.quote(dragon, date(2024, 3, 1), date(2024, 3, 2)), 1000.0)
+
+    def test_entrees_vides(self):
+        self.assertEqual(len(self.engine.price([], [], [], [])), 0)
+        self.assertEqual(self.engine.quote_many([], self.windows).shape, (0, 4))
+
+    def test_changement_de_regle(self):
+        car = self.vehicles[0]
+        before = self.engine.quote(car, date(2024, 7, 1), date(2024, 7, 2))
+        self.engine.clear_rules()
+        self.assertEqual(before, 75.0)
+        self.assertEqual(self.engine.quote(car, date(2024, 7, 1), date(2024, 7, 2)), 50.0)
+
+    def test_penalites(self):
+        car = self.vehicles[0]
+        self.engine.penalty_policy = PenaltyPolicy(rate=1.5, grace_days=1)
+        self.assertEqual(self.engine.penalty(car, date(2024, 1, 5), date(2024, 1, 6)), (0.0, 0))
+        self.assertEqual(self.engine.penalty(car, date(2024, 1, 5), date(2024, 1, 8)), (150.0, 2))
+        penalties, late = self.engine.penalties([50.0, 120.0], [date(2024, 1, 5).toordinal()] * 2,
+                                                [date(2024, 1, 8).toordinal(), date(2024, 1, 3).toordinal()])
+        self.assertEqual(penalties.tolist(), [150.0, 0.0])
+        self.assertEqual(late.tolist(), [2, 0])
+
+    def test_cache_invalide_par_les_regles(self):
+        car = self.vehicles[0]
+        first = self.engine.quote(car, date(2024, 3, 1), date(2024, 3, 3))
+        self.engine.add_rule(ClassSurcharge({Car: 3.0}))
+        self.assertAlmostEqual(self.engine.quote(car, date(2024, 3, 1), date(2024, 3, 3)), first * 3)
+
+class TestQuoteMatrix(unittest.TestCase):
+
+    def setUp(self):
+        self.system = CarRentalSystem()
+        self.system.add_customer(Customer(1, "Doe", "John", 30, "B-1", "j@x", "06", "john", "pw"))
+        for i in range(3):
+            self.system.add_vehicle(Car(i + 1, 40.0 + 10 * i, "Peugeot", "208", f"AA-{i}", 2020, 5, True))
+        self.vehicles = self.system.search_vehicles()
+        self.windows = [(date(2024, 3, 1), date(2024, 3, 4)), (date(2024, 3, 10), date(2024, 3, 12))]
+
+    def test_prix_egaux_au_moteur(self):
+        prices, _ = self.system.quote_matrix(self.vehicles, self.windows)
+        self.assertEqual(prices.shape, (3, 2))
+        for i, vehicle in enumerate(self.vehicles):
+            for j, (start, end) in enumerate(self.windows):
+                self.assertAlmostEqual(prices[i, j], self.system.pricing.quote(vehicle, start, end))
+
+    def test_disponibilite(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.system.create_rental(1, 1, date(2024, 3, 3), date(2024, 3, 5))
+        self.vehicles[2].status = VehicleStatus.UNDER_MAINTENANCE
+        # Le véhicule 1 est maintenant loué : plus réservable sur aucune période
+        _, available = self.system.quote_matrix(self.vehicles, self.windows)
+        self.assertEqual(available.tolist(), [[False, False], [True, True], [False, False]])
+
+    def test_id_demande_deux_fois(self):
+        car = self.vehicles[0]
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.system.create_rental(1, car.id, date(2024, 3, 3), date(2024, 3, 5))
+        car.status = VehicleStatus.AVAILABLE  # Seul le chevauchement des dates doit compter
+        _, available = self.system.quote_matrix([car, self.vehicles[1], car], self.windows)
+        self.assertEqual(available.tolist(), [[False, True], [True, True], [False, True]])
+
+    def test_periode_inversee(self):
+        with self.assertRaises(ValueError):
+            self.system.quote_matrix(self.vehicles, [(date(2024, 3, 4), date(2024, 3, 1))])
+
+if __name__ == '__main__':
+    unittest.main()
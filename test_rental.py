@@ -0,0 +1,116 @@
+import contextlib
+import io
+import os
+import sys
+import unittest
+from datetime import date, datetime
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.enums import VehicleStatus
+from fleet.vehicles import Car
+from clients.customer import Customer
+from location.rental import Rental, as_date, parse_iso_date
+from location.system import CarRentalSystem
+
+class TestRentalDates(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Customer(1, "Doe", "John", 30, "B-1", "j@x", "06", "john", "pw")
+        self.car = Car(1, 50.0, "Peugeot", "208", "AA-123-BB", 2020, 5, True)
+
+    def test_formats_acceptes(self):
+        expected = date(2024, 1, 5)
+        for value in ("2024-01-05", date(2024, 1, 5), datetime(2024, 1, 5, 18, 30)):
+            with self.subTest(value=value):
+                self.assertEqual(as_date(value), expected)
+                self.assertIs(type(as_date(value)), date)
+
+    def test_formats_refuses(self):
+        for value in ("05/01/2024", "2024-13-01", None, 20240105):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    as_date(value)
+        with self.assertRaises(ValueError):
+            Rental(self.client, self.car, "2024-01-01", "demain")
+
+    def test_cache_du_parseur(self):
+        parse_iso_date.cache_clear()
+        for _ in range(3):
+            parse_iso_date("2024-01-05")
+        self.assertEqual(parse_iso_date.cache_info().hits, 2)
+
+    def test_dates_stockees_en_objets_date(self):
+        rental = Rental(self.client, self.car, "2024-01-01", date(2024, 1, 4))
+        self.assertEqual((rental.start_date, rental.end_date), (date(2024, 1, 1), date(2024, 1, 4)))
+        rental.close_rental("2024-01-04")
+        self.assertEqual(rental.actual_return_date, date(2024, 1, 4))
+        d = rental.to_dict()
+        self.assertEqual((d["start_date"], d["end_date"], d["actual_return_date"]),
+                         ("2024-01-01", "2024-01-04", "2024-01-04"))
+
+    def test_restore_sans_validation(self):
+        self.car.status = VehicleStatus.RENTED
+        rental = Rental.restore(self.client, self.car, date(2024, 1, 1), date(2024, 1, 4), rental_id=7,
+                                is_active=True)
+        self.assertEqual((rental.id, rental.is_active, rental.from_history), (7, True, True))
+        self.assertEqual(self.car.status, VehicleStatus.RENTED)
+
+class TestBatchReturns(unittest.TestCase):
+    """close_rentals (lot vectorisé) doit donner les mêmes montants que des clôtures une par une."""
+
+    RETURNS = ["2024-01-03", "2024-01-05", "2024-01-02", "2024-01-09", "2024-01-05"]
+
+    def build(self, columnar=False):
+        system = CarRentalSystem(columnar=columnar)
+        system.add_customer(Customer(1, "Doe", "John", 30, "B-1", "j@x", "06", "john", "pw"))
+        for i in range(len(self.RETURNS)):
+            system.add_vehicle(Car(i + 1, 40.0 + 10 * i, "Peugeot", "208", f"AA-{i}", 2020, 5, True))
+        with contextlib.redirect_stdout(io.StringIO()):
+            for i in range(len(self.RETURNS)):
+                system.create_rental(1, i + 1, date(2024, 1, 1), date(2024, 1, 5))
+        return system
+
+    def test_meme_resultat_qu_une_par_une(self):
+        single = self.build()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for rental, day in zip(single.rentals, self.RETURNS):
+                single.close_rental(rental, day)
+
+        for columnar in (False, True):
+            with self.subTest(columnar=columnar):
+                batch = self.build(columnar)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    summary = batch.close_rentals([(r.id, day) for r, day in zip(batch.rentals, self.RETURNS)])
+                self.assertEqual(summary["closed"], len(self.RETURNS))
+                self.assertEqual(summary["late"], 1)
+                for expected, rental in zip(single.rentals, batch.rentals):
+                    self.assertAlmostEqual(rental.total_cost, expected.total_cost)
+                    self.assertAlmostEqual(rental.penalty, expected.penalty)
+                    self.assertFalse(rental.is_active)
+                self.assertAlmostEqual(summary["revenue"], sum(r.total_cost for r in single.rentals))
+                self.assertAlmostEqual(batch.revenue_report()["revenue"], single.revenue_report()["revenue"])
+                self.assertEqual(batch.status_counts()[VehicleStatus.AVAILABLE], len(self.RETURNS))
+
+    def test_erreurs_par_ligne(self):
+        system = self.build()
+        first, second = system.rentals[:2]
+        with contextlib.redirect_stdout(io.StringIO()):
+            summary = system.close_rentals([(first.id, "2024-01-05"), (first.id, "2024-01-05"),
+                                            (second.id, "pas une date"), (99, "2024-01-05")])
+        self.assertEqual(summary["closed"], 1)
+        self.assertEqual([rid for rid, _ in summary["errors"]], [first.id, second.id, 99])
+        # La ligne refusée reste ouverte et peut être clôturée ensuite
+        self.assertTrue(second.is_active)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(system.close_rentals([(second.id, "2024-01-05")])["closed"], 1)
+
+    def test_lot_vide(self):
+        summary = self.build().close_rentals([])
+        self.assertEqual((summary["closed"], summary["revenue"], summary["errors"]), (0, 0.0, []))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from starlette.requests import Request
+
+from response_cache import ResponseCache
+
+def request(path="/fleet", query="", if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": path, "query_string": query.encode(), "headers": headers})
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.system = SimpleNamespace(version=3)
+        self.cache = ResponseCache(self.system)
+        self.builds = 0
+
+    def build(self):
+        self.builds += 1
+        return {"items": [1, 2], "version": self.system.version}
+
+    def test_construit_une_seule_fois(self):
+        first = self.cache.lookup(("/fleet", ()), self.build)
+        self.assertIs(self.cache.lookup(("/fleet", ()), self.build), first)
+        self.assertEqual((self.builds, self.cache.hits, self.cache.misses), (1, 1, 1))
+        self.assertTrue(first[1].startswith('"3-'))
+
+    def test_invalide_par_une_modification(self):
+        _, etag = self.cache.lookup(("/fleet", ()), self.build)
+        self.system.version += 1
+        body, new_etag = self.cache.lookup(("/fleet", ()), self.build)
+        self.assertEqual(self.builds, 2)
+        self.assertNotEqual(new_etag, etag)
+        self.assertIn(b'"version":4', body.replace(b" ", b""))
+
+    def test_taille_bornee(self):
+        cache = ResponseCache(self.system, max_entries=2)
+        for key in ("a", "b", "a", "c"):
+            cache.lookup((key, ()), self.build)
+        self.assertEqual(self.builds, 3)
+        cache.lookup(("a", ()), self.build)  # Gardée : consultée récemment
+        cache.lookup(("b", ()), self.build)  # La plus ancienne, sortie
+        self.assertEqual(self.builds, 4)
+
+    def test_etag_et_304(self):
+        response = self.cache.respond(request(query="limit=2&after=1"), self.build)
+        etag = response.headers["etag"]
+        self.assertEqual(response.status_code, 200)
+        # Mêmes paramètres dans un autre ordre : même entrée
+        again = self.cache.respond(request(query="after=1&limit=2", if_none_match=f'W/{etag}, "x"'), self.build)
+        self.assertEqual((again.status_code, again.body, again.headers["etag"]), (304, b"", etag))
+        self.assertEqual(self.cache.respond(request(if_none_match="*"), self.build).status_code, 304)
+        self.assertEqual(self.builds, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import date
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.vehicles import Car, Boat
+from fleet.animals import Dragon
+from fleet.registry import class_code
+from clients.customer import Customer
+from location.system import CarRentalSystem
+from location.rental import Rental
+from location.ledger import RevenueLedger
+from storage import StorageManager
+
+class TestRevenueLedger(unittest.TestCase):
+
+    def setUp(self):
+        self.ledger = RevenueLedger()
+        self.car = Car(1, 50.0, "Peugeot", "208", "AA-123-BB", 2020, 5, True)
+        self.boat = Boat(2, 120.0, "Bénéteau", "Flyer", "BT-1", 2019, 6.5, 30.0)
+        self.ledger.record(self.car, date(2024, 1, 10), 100.0)
+        self.ledger.record(self.car, date(2024, 2, 5), 250.0, 25.0)
+        self.ledger.record(self.boat, date(2024, 1, 20), 480.0)
+        # Jour antérieur à tous les autres : la table s'étend vers le passé
+        self.ledger.record(self.boat, date(2023, 12, 31), 60.0)
+
+    def test_periode(self):
+        self.assertEqual(self.ledger.query(), {"revenue": 890.0, "penalties": 25.0, "count": 4})
+        self.assertEqual(self.ledger.query(date(2024, 1, 1), date(2024, 1, 31)),
+                         {"revenue": 580.0, "penalties": 0.0, "count": 2})
+        # Bornes incluses
+        self.assertEqual(self.ledger.query(date(2024, 1, 10), date(2024, 1, 10))["revenue"], 100.0)
+        # Hors de la table
+        self.assertEqual(self.ledger.query(date(2030, 1, 1))["count"], 0)
+
+    def test_classes(self):
+        self.assertEqual(self.ledger.query(classes=[Car]), {"revenue": 350.0, "penalties": 25.0, "count": 2})
+        self.assertEqual(self.ledger.query(date(2024, 1, 1), date(2024, 1, 31), classes=[Boat])["revenue"], 480.0)
+        self.assertEqual(self.ledger.query(classes=[Dragon])["count"], 0)
+
+        by_class = self.ledger.by_class(date(2024, 1, 1))
+        self.assertEqual(set(by_class), {"Car", "Boat"})
+        self.assertEqual(by_class["Car"]["count"], 2)
+
+    def test_record_many_equivaut_a_record(self):
+        other = RevenueLedger()
+        days = [date(2024, 1, 10), date(2024, 2, 5), date(2024, 1, 20), date(2023, 12, 31)]
+        other.record_many([class_code(self.car), class_code(self.car), class_code(self.boat), class_code(self.boat)],
+                          [d.toordinal() for d in days], [100.0, 250.0, 480.0, 60.0], [0.0, 25.0, 0.0, 0.0])
+        self.assertEqual(other.by_class(), self.ledger.by_class())
+
+    def test_retrait(self):
+        self.ledger.remove(self.car, date(2024, 2, 5), 250.0, 25.0)
+        self.assertEqual(self.ledger.query(classes=[Car]), {"revenue": 100.0, "penalties": 0.0, "count": 1})
+
+class TestReturnsLedger(unittest.TestCase):
+
+    def setUp(self):
+        self.system = CarRentalSystem()
+        self.client = Customer(1, "Doe", "John", 30, "B-1", "j@x", "06", "john", "pw")
+        self.car = Car(1, 50.0, "Peugeot", "208", "AA-123-BB", 2020, 5, True)
+        self.system.add_customer(self.client)
+        self.system.add_vehicle(self.car)
+        self.rental = self.system.add_rental(Rental(self.client, self.car, "2024-01-01", "2024-01-03"))
+
+    def close(self, rental, day):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.system.close_rental(rental, day)
+
+    def test_retour_enregistre(self):
+        self.assertEqual(self.close(self.rental, "2024-01-03"), 100.0)
+        self.assertEqual(self.system.revenue_report()["revenue"], 100.0)
+        self.assertEqual(self.system.ledger.query()["count"], 1)
+
+    def test_rental_seule_hors_grand_livre(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.rental.close_rental("2024-01-03")
+        self.assertEqual(self.system.ledger.query()["count"], 0)
+
+    def test_seconde_cloture_remplace(self):
+        self.close(self.rental, "2024-01-03")
+        self.close(self.rental, "2024-01-05")  # Date de retour corrigée : 2 jours de retard
+
+        report = self.system.revenue_report()
+        self.assertEqual(report["count"], 1)
+        self.assertEqual(report["revenue"], self.rental.total_cost)
+        self.assertEqual(report["revenue"], self.system.closed_revenue())
+        self.assertEqual(self.system.revenue_report(date(2024, 1, 3), date(2024, 1, 3))["count"], 0)
+
+    def test_retour_par_lot(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            summary = self.system.close_rentals([(self.rental.id, "2024-01-04"), (99, "2024-01-04")])
+        self.assertEqual(summary["closed"], 1)
+        self.assertEqual(len(summary["errors"]), 1)
+        report = self.system.revenue_report()
+        self.assertEqual((report["revenue"], report["count"]), (self.rental.total_cost, 1))
+        self.assertEqual(report["by_class"]["Car"]["revenue"], summary["revenue"])
+
+    def test_grand_livre_propre_au_systeme(self):
+        self.close(self.rental, "2024-01-03")
+        other = CarRentalSystem()
+        self.assertIsNot(other.ledger, self.system.ledger)
+        self.assertEqual(other.revenue_report()["count"], 0)
+
+class TestLedgerStorage(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.storage = StorageManager(os.path.join(self.directory, "data.json"))
+        system = CarRentalSystem()
+        client = Customer(1, "Doe", "John", 30, "B-1", "j@x", "06", "john", "pw")
+        car = Car(1, 50.0, "Peugeot", "208", "AA-123-BB", 2020, 5, True)
+        system.add_customer(client)
+        system.add_vehicle(car)
+        # Retour récent : la location reste dans data.json (hors archive)
+        self.today = date.today().isoformat()
+        self.rental = system.add_rental(Rental(client, car, self.today, self.today))
+        self.system = system
+
+    def close(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.system.close_rental(self.rental, self.today)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def load(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.storage.load_system()
+
+    def test_aller_retour(self):
+        self.close()
+        self.storage.save_system(self.system)
+        self.assertFalse(os.path.exists(self.storage.ledger_file + ".tmp"))
+
+        loaded = self.load()
+        self.assertEqual(loaded.revenue_report()["revenue"], 50.0)
+        # Un autre système ne partage pas ce grand livre
+        self.assertEqual(CarRentalSystem().revenue_report()["count"], 0)
+
+    def test_grand_livre_d_une_autre_version(self):
+        self.storage.save_system(self.system)
+        stale = self.storage.ledger_file + ".old"
+        shutil.copy(self.storage.ledger_file, stale)
+
+        # Arrêt entre data.json et le grand livre : data.json avec le retour, grand livre d'avant
+        self.close()
+        self.storage.save_system(self.system)
+        os.replace(stale, self.storage.ledger_file)
+        self.assertFalse(RevenueLedger().load(self.storage.ledger_file, self.system.version))
+
+        # Reconstruit depuis les locations au chargement
+        self.assertEqual(self.load().revenue_report()["revenue"], 50.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import sys
+import unittest
+from datetime import date
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.enums import MaintenanceType, VehicleStatus
+from fleet.maintenance import Maintenance
+from fleet.vehicles import Car, Carriage
+from fleet.animals import Horse
+from test_slots import sample_fleet
+
+class TestGeneratedCodec(unittest.TestCase):
+
+    def test_aller_retour_toutes_les_classes(self):
+        for vehicle in sample_fleet():
+            vehicle.status = VehicleStatus.RENTED
+            vehicle.add_maintenance(Maintenance(1, date(2024, 1, 1), MaintenanceType.CLEANING, 40.0, "Intérieur", 1))
+            with self.subTest(type(vehicle).__name__):
+                data = vehicle.to_dict()
+                restored = type(vehicle).from_dict(data)
+                self.assertIs(type(restored), type(vehicle))
+                self.assertEqual(restored.to_dict(), data)
+                self.assertEqual(restored.show_details(), vehicle.show_details())
+                self.assertEqual(restored.status, VehicleStatus.RENTED)
+
+    def test_format_json(self):
+        car = Car(1, 50.0, "Peugeot", "208", "AA-1", 2020, 5, True)
+        # Mêmes clés, dans le même ordre, que les anciens to_dict écrits à la main
+        self.assertEqual(list(car.to_dict().items()), [
+            ("type", "Car"), ("id", 1), ("daily_rate", 50.0), ("status", "Disponible"), ("maintenance_log", []),
+            ("brand", "Peugeot"), ("model", "208"), ("license_plate", "AA-1"), ("year", 2020),
+            ("door_count", 5), ("has_ac", True),
+        ])
+        self.assertEqual(Carriage(10, 80.0, 4, True).to_dict()["animal_ids"], [])
+
+    def test_valeurs_par_defaut(self):
+        # Vieille sauvegarde : champs facultatifs absents, statut inconnu
+        horse = Horse.from_dict({"type": "Horse", "id": 3, "daily_rate": 40.0, "status": "???",
+                                 "name": "Jolly", "breed": "Arabe", "wither_height": 150})
+        self.assertEqual((horse.age, horse.shoe_size_front, horse.status), (5, 0, VehicleStatus.AVAILABLE))
+        self.assertEqual(len(horse.maintenance_log), 0)
+        self.assertIsNone(horse.birth_date)  # Jamais sauvegardé
+        with self.assertRaises(KeyError):
+            Horse.from_dict({"type": "Horse", "id": 3, "daily_rate": 40.0})
+
+    def test_show_details(self):
+        car = Car(1, 50.0, "Peugeot", "208", "AA-1", 2020, 5, False)
+        self.assertEqual(car.show_details(), "[Voiture 2020] Peugeot 208 - 5 portes, Pas de clim")
+        self.assertEqual(Horse(3, 40.0, "Jolly", "Arabe", 6, 130, 40, 12).show_details(),
+                         "[Poney] Jolly (6 ans) - 130cm, Fers: 40/12mm")
+
+if __name__ == '__main__':
+    unittest.main()
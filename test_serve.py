@@ -0,0 +1,125 @@
+"""
+Mode multi-processus : un vrai processus propriétaire (api.py sur une socket
+Unix, lancé par serve.start_owner) et deux passerelles (gateway.OwnerClient)
+qui jouent le rôle de deux workers.
+"""
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import asynccontextmanager
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+for folder in (current_dir, project_folder):
+    if folder not in sys.path:
+        sys.path.append(folder)
+
+from starlette.applications import Starlette
+from starlette.routing import Route
+from fastapi.testclient import TestClient
+
+from gateway import OwnerClient
+from serve import start_owner
+from fleet.vehicles import Car
+from clients.customer import Customer
+from location.system import CarRentalSystem
+from storage import StorageManager
+
+def worker_app(socket_path: str) -> Starlette:
+    """Même application que gateway.app, sur la socket donnée."""
+    owner = OwnerClient(socket_path)
+
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+        await owner.close()
+
+    return Starlette(routes=[Route("/{path:path}", owner.relay, methods=["GET", "POST"])], lifespan=lifespan)
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Sockets Unix indisponibles")
+class TestOwnerAndWorkers(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.socket_path = os.path.join(cls.directory, "owner.sock")
+        system = CarRentalSystem()
+        system.add_customer(Customer(1, "Doe", "John", 30, "B-1", "j@x", "06", "john", "pw"))
+        for i in (1, 2):
+            system.add_vehicle(Car(i, 50.0, "Peugeot", "208", f"AA-{i}", 2020, 5, True))
+        cls.data_file = os.path.join(cls.directory, "data.json")
+        StorageManager(cls.data_file).save_system(system)
+
+        # Le propriétaire charge data.json depuis son dossier courant
+        previous = os.getcwd()
+        os.chdir(cls.directory)
+        try:
+            cls.owner = start_owner(cls.socket_path)
+        finally:
+            os.chdir(previous)
+        cls.workers = [TestClient(worker_app(cls.socket_path)) for _ in range(2)]
+        for worker in cls.workers:
+            worker.__enter__()
+
+    @classmethod
+    def tearDownClass(cls):
+        for worker in cls.workers:
+            worker.__exit__(None, None, None)
+        cls.owner.terminate()
+        try:
+            cls.owner.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            cls.owner.kill()
+        shutil.rmtree(cls.directory)
+
+    def test_un_seul_systeme(self):
+        first, second = self.workers
+        rental = {"customer_id": 1, "vehicle_id": 1, "start_date": "2030-03-01", "end_date": "2030-03-04"}
+        created = first.post("/rentals/", json=rental)
+        self.assertEqual(created.status_code, 200)
+        # L'autre worker voit la même flotte : le véhicule est déjà loué
+        refused = second.post("/rentals/", json=rental)
+        self.assertEqual(refused.status_code, 400)
+        rows = second.get("/rentals", params={"vehicle_id": 1}).json()["items"]
+        self.assertEqual([r["id"] for r in rows], [created.json()["rental_id"]])
+        # Sauvegardée par le seul écrivain (durabilité "disk" par défaut)
+        with open(self.data_file, encoding="utf-8") as f:
+            self.assertIn(created.json()["rental_id"], [r["id"] for r in json.load(f)["rentals"]])
+
+    def test_erreurs_relayees(self):
+        response = self.workers[0].post("/fleet/999/status", params={"status": "AVAILABLE"})
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {"detail": "Véhicule introuvable"})
+
+    def test_lectures_gardees_par_le_worker(self):
+        worker = self.workers[1]
+        first = worker.get("/customers")
+        etag = first.headers["etag"]
+        # Redemandée avec If-None-Match : 304 du propriétaire, corps servi par le worker
+        again = worker.get("/customers")
+        self.assertEqual((again.status_code, again.content, again.headers["etag"]), (200, first.content, etag))
+        self.assertEqual(worker.get("/customers", headers={"If-None-Match": etag}).status_code, 304)
+
+    def test_flux_relaye(self):
+        response = self.workers[0].get("/export/fleet.ndjson")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("x-change-version", response.headers)
+        self.assertEqual(sorted(json.loads(line)["id"] for line in response.text.splitlines()), [1, 2])
+
+    def test_proprietaire_deja_lance(self):
+        with self.assertRaises(RuntimeError):
+            start_owner(self.socket_path)
+
+    def test_proprietaire_injoignable(self):
+        with TestClient(worker_app(os.path.join(self.directory, "absent.sock"))) as worker:
+            response = worker.get("/fleet")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers["retry-after"], "1")
+
+if __name__ == '__main__':
+    unittest.main()
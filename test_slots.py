@@ -0,0 +1,73 @@
+import os
+import sys
+import unittest
+from datetime import date
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.vehicles import Car, Truck, Motorcycle, Hearse, GoKart, Boat, Submarine, Plane, Helicopter, Carriage, Cart
+from fleet.animals import Horse, Donkey, Camel, Whale, Dolphin, Eagle, Dragon
+from fleet.enums import MaintenanceType
+from fleet.maintenance import Maintenance
+from fleet.registry import FLEET_CLASSES
+from clients.customer import Customer
+from location.rental import Rental
+
+def sample_fleet():
+    """Un élément de chaque classe concrète."""
+    return [
+        Car(1, 50.0, "Peugeot", "208", "AA-1", 2020, 5, True),
+        Truck(2, 120.0, "Renault", "Master", "TR-1", 2018, 20.0, 3.5),
+        Motorcycle(3, 40.0, "Yamaha", "MT-07", "MO-1", 2021, 689, False),
+        Hearse(4, 200.0, "Cadillac", "Fleetwood", "HE-1", 2015, 2.2, True),
+        GoKart(5, 25.0, "Sodi", "RT8", "GK-1", 2022, "Essence", False),
+        Boat(6, 120.0, "Bénéteau", "Flyer", "BT-1", 2019, 6.5, 30.0),
+        Submarine(7, 5000.0, "Triton", "3300", "SM-1", 2020, 1000, False),
+        Plane(8, 3000.0, "Cessna", "172", "PL-1", 2010, 11.0, 1),
+        Helicopter(9, 2500.0, "Airbus", "H125", "HC-1", 2017, 3, 6000),
+        Carriage(10, 80.0, 4, True),
+        Cart(11, 30.0, 2, 300),
+        Horse(12, 60.0, "Jolly", "Arabe", 6, 150, 40, 12),
+        Donkey(13, 20.0, "Cadichon", "Provence", 8, 60, True),
+        Camel(14, 70.0, "Jamal", "Dromadaire", 12, 1, 80),
+        Whale(15, 900.0, "Moby", "Cachalot", 40, 40.0, True),
+        Dolphin(16, 150.0, "Flipper", "Souffleur", 9, 50, True),
+        Eagle(17, 90.0, "Aquila", "Royal", 5, 220, 3000),
+        Dragon(18, 500.0, "Smaug", "Rouge", 150, 100.0, "Doré"),
+    ]
+
+class TestSlots(unittest.TestCase):
+
+    def setUp(self):
+        self.fleet = sample_fleet()
+        self.client = Customer(1, "Doe", "John", 30, "B-1", "j@x", "06", "john", "pw")
+
+    def test_toutes_les_classes(self):
+        self.assertEqual([type(v) for v in self.fleet], list(FLEET_CLASSES))
+
+    def test_pas_de_dict(self):
+        rental = Rental(self.client, self.fleet[0], "2024-01-01", "2024-01-03")
+        maintenance = Maintenance(1, date(2024, 1, 1), MaintenanceType.CLEANING, 40.0, "Intérieur", 1)
+        for obj in self.fleet + [self.client, rental, maintenance]:
+            with self.subTest(type(obj).__name__):
+                self.assertFalse(hasattr(obj, "__dict__"))
+
+    def test_attribut_inconnu_refuse(self):
+        # Une faute de frappe ne crée plus silencieusement un nouvel attribut
+        with self.assertRaises(AttributeError):
+            self.fleet[0].daily_rat = 10.0
+        with self.assertRaises(AttributeError):
+            self.client.mail = "x@y"
+
+    def test_attributs_herites_modifiables(self):
+        car = self.fleet[0]
+        car.daily_rate = 55.0
+        car.brand = "Renault"
+        self.assertEqual((car.daily_rate, car.brand), (55.0, "Renault"))
+        self.assertIn("Renault", car.show_details())
+
+if __name__ == '__main__':
+    unittest.main()
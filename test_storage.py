@@ -0,0 +1,74 @@
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import date, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.vehicles import Car
+from clients.customer import Customer
+from storage import StorageManager
+
+class TestOldRentalIds(unittest.TestCase):
+    """data.json écrit par l'ancienne API : ids de location absents, nuls, en double ou dans le désordre."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.storage = StorageManager(os.path.join(self.directory, "data.json"))
+        today = date.today()
+        rentals = []
+        for i, rental_id in enumerate((0, 0, 7, 3, None, 3)):
+            rental = {"customer_id": 1, "vehicle_id": i + 1, "start_date": today.isoformat(),
+                      "end_date": (today + timedelta(days=2)).isoformat(), "actual_return_date": None,
+                      "is_active": True, "total_cost": 0.0, "penalty": 0.0}
+            if rental_id is not None:
+                rental["id"] = rental_id
+            rentals.append(rental)
+        data = {
+            "fleet": [Car(i, 50.0, "Peugeot", "208", f"AA-{i}", 2020, 5, True).to_dict() for i in range(1, 7)],
+            "customers": [Customer(1, "Doe", "John", 30, "B-1", "j@x", "06", "john", "pw").to_dict()],
+            "rentals": rentals,
+        }
+        with open(self.storage.filename, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def load(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.storage.load_system()
+
+    def test_ids_uniques_et_tries(self):
+        system = self.load()
+        ids = [r.id for r in system.rentals]
+        self.assertEqual(len(ids), 6)
+        self.assertEqual(ids, sorted(set(ids)))
+        self.assertNotIn(0, ids)
+        # Les ids valides sont gardés, les nouveaux viennent après le plus grand
+        self.assertEqual(ids[:2], [3, 7])
+        self.assertEqual(system.last_rental_id, max(ids))
+
+    def test_chaque_location_retrouvee(self):
+        system = self.load()
+        for rental in system.rentals:
+            self.assertIs(system.find_rental(rental.id), rental)
+        # Chaque véhicule garde sa location
+        self.assertEqual(sorted(r.vehicle.id for r in system.rentals), [1, 2, 3, 4, 5, 6])
+
+    def test_ids_corriges_sur_disque(self):
+        ids = [r.id for r in self.load().rentals]
+        self.assertEqual([r.id for r in self.load().rentals], ids)
+        with open(self.storage.filename, encoding="utf-8") as f:
+            self.assertEqual([r["id"] for r in json.load(f)["rentals"]], ids)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import json
+import os
+import sys
+import unittest
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_folder = os.path.join(current_dir, "CarRentalSystem")
+if project_folder not in sys.path:
+    sys.path.append(project_folder)
+
+from fleet.symbols import SymbolTable, SYMBOLS
+from fleet.vehicles import Car, GoKart
+from fleet.animals import Horse, Dragon
+
+class TestSymbolTable(unittest.TestCase):
+
+    def test_une_seule_instance(self):
+        table = SymbolTable()
+        first = table.intern("".join(["Peu", "geot"]))
+        second = table.intern("".join(["Peug", "eot"]))
+        self.assertIs(first, second)
+        self.assertEqual(len(table), 1)
+        self.assertIn("Peugeot", table)
+        self.assertIsNone(table.intern(None))
+
+class TestInternedFields(unittest.TestCase):
+
+    def test_constructeurs(self):
+        cars = [Car(i, 50.0, "".join(["Ren", "ault"]), "".join(["Cl", "io"]), f"AA-{i}", 2020, 5, True)
+                for i in range(3)]
+        self.assertIs(cars[0].brand, cars[2].brand)
+        self.assertIs(cars[0].model, cars[1].model)
+        horses = [Horse(i, 40.0, f"Cheval {i}", "".join(["Fri", "son"]), 6, 150, 40, 12) for i in range(2)]
+        self.assertIs(horses[0].breed, horses[1].breed)
+        # Les noms propres ne sont pas des catégories
+        self.assertNotIn("Cheval 1", SYMBOLS)
+
+    def test_chargement_json(self):
+        # json.loads crée une nouvelle chaîne par valeur : le décodeur les ramène à une seule
+        items = [json.loads(json.dumps(Dragon(i, 500.0, f"D{i}", "Rouge de Feu", 150, 100.0, "Doré").to_dict()))
+                 for i in range(2)]
+        dragons = [Dragon.from_dict(item) for item in items]
+        self.assertIsNot(items[0]["scale_color"], items[1]["scale_color"])
+        self.assertIs(dragons[0].scale_color, dragons[1].scale_color)
+        self.assertIs(dragons[0].breed, dragons[1].breed)
+
+        karts = [GoKart.from_dict(json.loads(json.dumps(GoKart(i, 25.0, "Sodi", "RT8", f"K-{i}", 2022, "2T", False)
+                                                        .to_dict()))) for i in range(2)]
+        self.assertIs(karts[0].engine_type, karts[1].engine_type)
+
+if __name__ == '__main__':
+    unittest.main()